@@ -0,0 +1,107 @@
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import tyro
+
+from src.kaggle_ops.utils.deps_state import read_requirements
+
+
+def _run(cmd: list[str], env: dict | None = None) -> float:
+    start = time.perf_counter()
+    subprocess.run(cmd, check=True, capture_output=True, env=env)
+    return time.perf_counter() - start
+
+
+def _import_time(site_dir: Path, modules: list[str]) -> float:
+    code = "; ".join(f"import {module}" for module in modules)
+    return _run([sys.executable, "-I", "-c", f"import sys; sys.path.insert(0, {str(site_dir)!r}); {code}"])
+
+
+def _pip_install(wheel_dir: Path, target: Path, compile_pyc: bool) -> float:
+    return _run(
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            *sorted(str(p) for p in wheel_dir.glob("*.whl")),
+            "--target",
+            str(target),
+            "--force-reinstall",
+            "--no-deps",
+            "--no-index",
+            "--find-links",
+            str(wheel_dir),
+            "--quiet",
+            *([] if compile_pyc else ["--no-compile"]),
+        ]
+    )
+
+
+def main(
+    requirements: Path = Path("codes/deps/requirements.txt"),
+    wheel_dir: Path | None = None,
+    modules: list[str] | None = None,
+    repeat: int = 3,
+) -> None:
+    """Compare the submission startup of the 'wheels' and 'overlay' deps install modes.
+
+    wheels: pip install the downloaded wheels, then import (what every submission run does).
+    overlay: import from a prebuilt, byte-compiled site-packages copied like a Kaggle kernel output.
+
+    Args:
+        requirements: requirements.txt of the deps kernel.
+        wheel_dir: Directory of already downloaded wheels (default: pip download the requirements).
+        modules: Modules to import (default: requirement names with '-' replaced by '_').
+        repeat: Number of measurements per mode (the best one is reported).
+    """
+    reqs = read_requirements(requirements)
+    modules = modules or [re.split(r"[<>=!~\[; ]", req)[0].replace("-", "_").lower() for req in reqs]
+    if not modules:
+        print(f"No requirements in {requirements}")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        if wheel_dir is None:
+            wheel_dir = tmp_dir / "wheels"
+            _run([sys.executable, "-m", "pip", "download", "-q", "-d", str(wheel_dir), *reqs])
+
+        # built once by the deps kernel
+        built = tmp_dir / "built"
+        build_seconds = _pip_install(wheel_dir, built, compile_pyc=False)
+        build_seconds += _run(
+            [sys.executable, "-m", "compileall", "-q", "-j", "0", "--invalidation-mode", "unchecked-hash", str(built)]
+        )
+
+        wheels_times, overlay_times = [], []
+        for i in range(repeat):
+            target = tmp_dir / f"wheels-{i}"
+            install_seconds = _pip_install(wheel_dir, target, compile_pyc=True)
+            wheels_times.append((install_seconds, _import_time(target, modules)))
+
+            # Kaggle copies kernel outputs, so mtimes are not preserved
+            overlay = tmp_dir / f"overlay-{i}"
+            shutil.copytree(built, overlay, copy_function=shutil.copyfile)
+            overlay_times.append((0.0, _import_time(overlay, modules)))
+
+    print(f"modules: {modules} (overlay build in deps kernel: {build_seconds:.2f}s)")
+    print(f"{'mode':<10} {'install':>10} {'import':>10} {'startup':>10}")
+    for mode, times in [("wheels", wheels_times), ("overlay", overlay_times)]:
+        install, imp = min(times, key=sum)
+        print(f"{mode:<10} {install:>9.2f}s {imp:>9.2f}s {install + imp:>9.2f}s")
+
+
+if __name__ == "__main__":
+    """Benchmark the submission startup time of the deps install modes.
+
+    Example:
+    >>> uv run python -m benchmarks.deps_startup
+    >>> uv run python -m benchmarks.deps_startup --requirements /tmp/requirements.txt --modules polars lightgbm
+    """
+    tyro.cli(main)
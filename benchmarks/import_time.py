@@ -0,0 +1,88 @@
+import subprocess
+import sys
+import time
+
+import tyro
+
+# cumulative import time budgets (ms) of each CLI entry point
+IMPORT_TIME_BUDGETS_MS = {
+    "src.kaggle_ops.check": 400,
+    "src.kaggle_ops.download": 400,
+    "src.kaggle_ops.upload": 400,
+    "src.kaggle_ops.push": 400,
+    "src.kaggle_ops.write": 400,
+    "src.kaggle_ops.parse_exp_names": 400,
+}
+# modules that must not be imported just by loading an entry point
+DEFERRED_MODULES = ["kaggle", "kagglesdk", "nbformat"]
+
+
+def measure_import_time(module: str) -> tuple[float, dict[str, float]]:
+    """Import module in a fresh interpreter with -X importtime.
+
+    Returns:
+        tuple[float, dict[str, float]]: cumulative import time of module (ms), cumulative time of every imported module (ms)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line.removeprefix("import time:").split("|"))
+        cumulative[name] = int(cumulative_us) / 1000
+    return cumulative.get(module, 0.0), cumulative
+
+
+def measure_help_time(module: str) -> float:
+    """Wall time (ms) of `python -m module --help`."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", module, "--help"], capture_output=True, check=False)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(top: int = 5, scale: float = 1.0) -> None:
+    """Measure import time of each entry point against its budget.
+
+    Args:
+        top: Number of heaviest top-level imports to show per entry point.
+        scale: Multiplier applied to every budget (e.g. for slow CI machines).
+    """
+    failures = []
+    print(f"{'entry point':<34} {'import':>10} {'budget':>10} {'--help':>10}")
+    for module, budget in IMPORT_TIME_BUDGETS_MS.items():
+        import_ms, cumulative = measure_import_time(module)
+        help_ms = measure_help_time(module)
+        status = "ok" if import_ms <= budget * scale else "OVER"
+        print(f"{module:<34} {import_ms:>8.1f}ms {budget * scale:>8.1f}ms {help_ms:>8.1f}ms  {status}")
+
+        heaviest = sorted(
+            ((name, ms) for name, ms in cumulative.items() if "." not in name and name != "src"),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+        print("    " + ", ".join(f"{name}={ms:.1f}ms" for name, ms in heaviest[:top]))
+
+        leaked = [name for name in DEFERRED_MODULES if name in cumulative]
+        if leaked:
+            print(f"    deferred modules imported eagerly: {leaked}")
+        if status != "ok" or leaked:
+            failures.append(module)
+
+    if failures:
+        print(f"Import time budget exceeded: {failures}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    """Benchmark the import time of the kaggle_ops entry points.
+
+    Example:
+    >>> uv run python -m benchmarks.import_time
+    >>> uv run python -m benchmarks.import_time --scale 2.0
+    """
+    tyro.cli(main)
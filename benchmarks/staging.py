@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import tyro
+
+from src.kaggle_ops.utils.customhub import IGNORE_PATTERNS, STAGE_MODES, copytree
+from src.kaggle_ops.utils.utils import format_bytes
+
+WRITE_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def make_synthetic_tree(root: Path, total_bytes: int, num_files: int, num_folds: int = 5) -> None:
+    """Create a synthetic artifact tree (fold directories with checkpoints) of total_bytes."""
+    chunk = os.urandom(WRITE_CHUNK_SIZE)
+    file_size = total_bytes // num_files
+    for i in range(num_files):
+        fold_dir = root / f"fold{i % num_folds}"
+        fold_dir.mkdir(parents=True, exist_ok=True)
+        with open(fold_dir / f"model_{i}.pt", "wb") as f:
+            remaining = file_size
+            while remaining > 0:
+                n = min(remaining, WRITE_CHUNK_SIZE)
+                f.write(chunk[:n])
+                remaining -= n
+
+
+def allocated_bytes(directory: Path) -> int:
+    """Bytes newly allocated on disk by directory (symlinks are not followed, hardlinked data is shared)."""
+    total = 0
+    for root, dirs, files in os.walk(directory):
+        for name in dirs + files:
+            stat = os.lstat(os.path.join(root, name))
+            if stat.st_nlink == 1 or os.path.isdir(os.path.join(root, name)):
+                total += stat.st_blocks * 512
+    return total
+
+
+def main(total_gb: float = 10.0, num_files: int = 100, work_dir: str | None = None, keep: bool = False) -> None:
+    """Benchmark staging time and peak disk usage of each stage mode on a synthetic artifact tree.
+
+    Args:
+        total_gb: Size of the synthetic tree in GB.
+        num_files: Number of files in the synthetic tree.
+        work_dir: Directory for the synthetic tree (defaults to the system temp directory).
+        keep: Keep the synthetic tree after the benchmark.
+    """
+    base_dir = Path(tempfile.mkdtemp(prefix="bench-staging-", dir=work_dir))
+    src_dir = base_dir / "src"
+    total_bytes = int(total_gb * 1024**3)
+
+    print(f"Creating synthetic tree: {format_bytes(total_bytes)} in {num_files} files at {src_dir}")
+    make_synthetic_tree(src_dir, total_bytes, num_files)
+
+    print(f"{'mode':<10} {'time':>10} {'peak disk':>12} {'fs delta':>12}")
+    try:
+        for mode in STAGE_MODES:
+            with tempfile.TemporaryDirectory() as tempdir:
+                used_before = shutil.disk_usage(tempdir).used
+                start = time.perf_counter()
+                copytree(
+                    src=str(src_dir), dst=str(Path(tempdir) / "staged"), ignore_patterns=IGNORE_PATTERNS, mode=mode
+                )
+                elapsed = time.perf_counter() - start
+                fs_delta = shutil.disk_usage(tempdir).used - used_before
+                peak = allocated_bytes(Path(tempdir))
+            print(f"{mode:<10} {elapsed:>9.2f}s {format_bytes(peak):>12} {format_bytes(max(fs_delta, 0)):>12}")
+    finally:
+        if not keep:
+            shutil.rmtree(base_dir)
+
+
+if __name__ == "__main__":
+    """Benchmark zero-copy staging.
+
+    Example:
+    >>> uv run python -m benchmarks.staging --total-gb 10
+    >>> uv run python -m benchmarks.staging --total-gb 1 --num-files 1000 --work-dir ./data
+    """
+    tyro.cli(main)
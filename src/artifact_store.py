@@ -0,0 +1,249 @@
+import json
+import logging
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.settings import DirectorySettings, KaggleSettings
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+Loader = Callable[[Path], Any]
+
+# Written by src/kaggle_ops/utils/compact.py next to compacted artifacts: {"files": {original: {"output", ...}}}
+COMPACTION_MANIFEST_NAME = "compaction.json"
+
+
+def load_npy(path: Path) -> Any:
+    import numpy as np
+
+    return np.load(path, mmap_mode="r")
+
+
+def load_npz(path: Path) -> Any:
+    import numpy as np
+
+    # NpzFile reads each member on access
+    return np.load(path)
+
+
+def load_parquet(path: Path) -> Any:
+    import pyarrow.parquet as pq
+
+    return pq.read_table(path, memory_map=True)
+
+
+def load_parquet_frame(path: Path) -> Any:
+    import pandas as pd
+
+    return pd.read_parquet(path)
+
+
+def load_arrow(path: Path) -> Any:
+    import pyarrow as pa
+
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def load_torch(path: Path) -> Any:
+    import torch
+
+    return torch.load(path, map_location="cpu", mmap=True, weights_only=True)
+
+
+def load_safetensors(path: Path) -> Any:
+    from safetensors.numpy import load_file
+
+    return load_file(path)
+
+
+def load_pickle(path: Path) -> Any:
+    try:
+        import joblib
+    except ImportError:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    return joblib.load(path, mmap_mode="r")
+
+
+DEFAULT_LOADERS: dict[str, Loader] = {
+    ".npy": load_npy,
+    ".npz": load_npz,
+    ".parquet": load_parquet,
+    ".arrow": load_arrow,
+    ".feather": load_arrow,
+    ".pt": load_torch,
+    ".pth": load_torch,
+    ".safetensors": load_safetensors,
+    ".pkl": load_pickle,
+    ".pickle": load_pickle,
+    ".joblib": load_pickle,
+}
+
+
+def load_compaction_manifest(directory: str | Path) -> dict | None:
+    """Compaction manifest of an artifact directory (None if the artifacts were not compacted)."""
+    manifest_path = Path(directory) / COMPACTION_MANIFEST_NAME
+    if not manifest_path.is_file():
+        return None
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def get_peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process (None if unavailable on this platform)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class ArtifactStore:
+    """Lazily loaded artifacts of experiments keyed by (exp_name, relative path).
+
+    Artifacts are read on first access (memory mapped where the format allows) from
+    DirectorySettings.ARTIFACT_EXP_DIR, so the same code works in local, vertex and kaggle.
+    Loaded artifacts are accounted by file size and evicted in LRU order once the resident
+    bytes exceed max_resident_bytes. Eviction only drops the store's reference; callers
+    that keep an artifact alive keep its memory too.
+
+    Artifacts uploaded with compaction are looked up by their original names: a pickled DataFrame
+    that was rewritten as Parquet is still returned as a DataFrame by get(exp_name, "oof.pkl").
+
+    Example:
+    >>> store = ArtifactStore(max_resident_bytes=4 * 1024**3)
+    >>> for exp_name in ["exp001", "exp002"]:
+    ...     for fold in range(5):
+    ...         model = store.get(exp_name, f"fold{fold}/model.pkl")
+    >>> print(store.stats())
+    """
+
+    def __init__(
+        self,
+        max_resident_bytes: int | None = None,
+        run_env: str | None = None,
+        kaggle_settings: KaggleSettings | None = None,
+        artifact_dir: str | Path | None = None,
+        loaders: dict[str, Loader] | None = None,
+    ) -> None:
+        self.max_resident_bytes = max_resident_bytes
+        self.run_env = run_env
+        self.kaggle_settings = kaggle_settings
+        self.artifact_dir = Path(artifact_dir) if artifact_dir is not None else None
+        self.loaders = {**DEFAULT_LOADERS, **(loaders or {})}
+
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple[str, str], tuple[Any, int]] = OrderedDict()
+        self._exp_dirs: dict[str, Path] = {}
+        self._compacted: dict[str, dict] = {}
+        self.resident_bytes = 0
+        self.peak_resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def exp_dir(self, exp_name: str) -> Path:
+        """Artifact directory of an experiment ({artifact_dir}/{exp_name}/1 when artifact_dir is given)."""
+        if exp_name not in self._exp_dirs and self.artifact_dir is not None:
+            self._exp_dirs[exp_name] = self.artifact_dir / exp_name / "1"
+        elif exp_name not in self._exp_dirs:
+            kwargs: dict[str, Any] = {"exp_name": exp_name, "run_env": self.run_env}
+            if self.kaggle_settings is not None:
+                kwargs["kaggle_settings"] = self.kaggle_settings
+            self._exp_dirs[exp_name] = DirectorySettings(**kwargs).ARTIFACT_EXP_DIR
+        return self._exp_dirs[exp_name]
+
+    def files(self, exp_name: str, pattern: str = "**/*") -> list[str]:
+        """Relative paths of the artifact files of an experiment matching pattern."""
+        exp_dir = self.exp_dir(exp_name)
+        return sorted(p.relative_to(exp_dir).as_posix() for p in exp_dir.glob(pattern) if p.is_file())
+
+    def register_loader(self, suffix: str, loader: Loader) -> None:
+        self.loaders[suffix] = loader
+
+    def get(self, exp_name: str, name: str) -> Any:
+        """Artifact {ARTIFACT_EXP_DIR of exp_name}/{name}, loaded on first access."""
+        key = (exp_name, name)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key][0]
+            self.misses += 1
+
+        path, loader = self._resolve(exp_name, name)
+        value = loader(path)
+        size = path.stat().st_size
+
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = (value, size)
+                self.resident_bytes += size
+                self.peak_resident_bytes = max(self.peak_resident_bytes, self.resident_bytes)
+                self._evict(keep=key)
+            return self._cache[key][0]
+
+    def _resolve(self, exp_name: str, name: str) -> tuple[Path, Loader]:
+        """Path and loader of an artifact, following the compaction manifest for renamed files."""
+        path = self.exp_dir(exp_name) / name
+        if not path.exists():
+            if exp_name not in self._compacted:
+                self._compacted[exp_name] = (load_compaction_manifest(self.exp_dir(exp_name)) or {}).get("files", {})
+            record = self._compacted[exp_name].get(name)
+            if record is not None and record["output"] != name:
+                return self.exp_dir(exp_name) / record["output"], load_parquet_frame
+
+        loader = self.loaders.get(path.suffix.lower())
+        if loader is None:
+            raise ValueError(f"No loader registered for {path.suffix!r}: {path}")
+        return path, loader
+
+    def _evict(self, keep: tuple[str, str]) -> None:
+        if self.max_resident_bytes is None:
+            return
+        while self.resident_bytes > self.max_resident_bytes and len(self._cache) > 1:
+            key, (_, size) = next(iter(self._cache.items()))
+            if key == keep:
+                self._cache.move_to_end(key)
+                continue
+            del self._cache[key]
+            self.resident_bytes -= size
+            self.evictions += 1
+            logger.debug(f"Evicted {key} ({size} bytes)")
+
+    def release(self, exp_name: str, name: str | None = None) -> None:
+        """Drop one artifact, or every artifact of an experiment when name is None."""
+        with self._lock:
+            for key in [k for k in self._cache if k[0] == exp_name and name in (None, k[1])]:
+                _, size = self._cache.pop(key)
+                self.resident_bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.resident_bytes = 0
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self._cache
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "num_resident": len(self._cache),
+            "resident_bytes": self.resident_bytes,
+            "peak_resident_bytes": self.peak_resident_bytes,
+            "max_resident_bytes": self.max_resident_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "peak_rss_bytes": get_peak_rss_bytes(),
+        }
@@ -0,0 +1,193 @@
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from src.settings import DirectorySettings
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+COLUMNAR_DIR_SUFFIX = "-columnar"
+SCHEMA_FILE_NAME = "_schema.json"
+TABULAR_EXTENSIONS = (".csv",)
+COLUMNAR_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+# string columns with fewer unique values than this ratio are dictionary encoded
+DICTIONARY_ENCODE_RATIO = 0.5
+
+
+def get_columnar_dir(comp_dataset_dir: str | Path) -> Path:
+    """Columnar cache directory next to the competition dataset directory ({COMP_DATASET_DIR}-columnar)."""
+    comp_dataset_dir = Path(comp_dataset_dir)
+    return comp_dataset_dir.parent / f"{comp_dataset_dir.name}{COLUMNAR_DIR_SUFFIX}"
+
+
+def downcast_table(table: Any, float32: bool = False) -> Any:
+    """Downcast integer columns to the smallest fitting type and low-cardinality strings to dictionary.
+
+    float64 columns are only downcast to float32 (which loses precision) when float32 is set.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = []
+    for field, column in zip(table.schema, table.columns, strict=True):
+        if pa.types.is_integer(field.type) and len(column) > 0 and column.null_count < len(column):
+            min_max = pc.min_max(column)
+            low, high = min_max["min"].as_py(), min_max["max"].as_py()
+            for candidate in (pa.int8(), pa.int16(), pa.int32()):
+                info_bits = candidate.bit_width - 1
+                if -(2**info_bits) <= low and high < 2**info_bits:
+                    column = column.cast(candidate)
+                    break
+        elif pa.types.is_float64(field.type) and float32:
+            column = column.cast(pa.float32())
+        elif pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            if len(column) > 0 and pc.count_distinct(column).as_py() / len(column) < DICTIONARY_ENCODE_RATIO:
+                column = column.dictionary_encode()
+        columns.append(column)
+    return pa.table(columns, names=table.column_names)
+
+
+def load_schema(columnar_dir: str | Path) -> dict:
+    """Load the cached schema of the columnar files ({relative csv path: {...}})."""
+    schema_path = Path(columnar_dir) / SCHEMA_FILE_NAME
+    if not schema_path.is_file():
+        return {}
+    with open(schema_path) as f:
+        return json.load(f)
+
+
+def convert_to_columnar(
+    comp_dataset_dir: str | Path,
+    fmt: str = "parquet",
+    downcast: bool = True,
+    float32: bool = False,
+    force: bool = False,
+) -> list[str]:
+    """Convert the tabular files of a competition dataset to Parquet or Arrow IPC once.
+
+    Integer and string columns are downcast losslessly (downcast); float64 columns become float32 only
+    with float32. Files already converted from an unchanged source (same size and mtime) with the same
+    options are skipped.
+    The schema of every converted file is cached in {columnar_dir}/_schema.json.
+
+    Returns:
+        list[str]: relative paths of the converted source files
+    """
+    import pyarrow.csv as pv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Invalid columnar format: {fmt}. Must be one of {list(COLUMNAR_FORMATS)}")
+
+    comp_dataset_dir = Path(comp_dataset_dir)
+    columnar_dir = get_columnar_dir(comp_dataset_dir)
+    schema = load_schema(columnar_dir)
+    float32 = downcast and float32
+
+    converted = []
+    for src_path in sorted(p for p in comp_dataset_dir.rglob("*") if p.suffix.lower() in TABULAR_EXTENSIONS):
+        key = src_path.relative_to(comp_dataset_dir).as_posix()
+        dst_path = columnar_dir / Path(key).with_suffix(COLUMNAR_FORMATS[fmt])
+        stat = src_path.stat()
+
+        cached = schema.get(key, {})
+        is_fresh = (
+            cached.get("source_size") == stat.st_size
+            and cached.get("source_mtime_ns") == stat.st_mtime_ns
+            and cached.get("format") == fmt
+            and cached.get("downcast", True) == downcast
+            and cached.get("float32", True) == float32
+            and dst_path.is_file()
+        )
+        if is_fresh and not force:
+            continue
+
+        table = pv.read_csv(src_path)
+        if downcast:
+            table = downcast_table(table, float32=float32)
+
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = dst_path.with_name(dst_path.name + ".tmp")
+        if fmt == "parquet":
+            pq.write_table(table, tmp_path)
+        else:
+            # uncompressed so that the file can be memory mapped without decoding
+            feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, dst_path)
+
+        schema[key] = {
+            "format": fmt,
+            "downcast": downcast,
+            "float32": float32,
+            "path": dst_path.relative_to(columnar_dir).as_posix(),
+            "num_rows": table.num_rows,
+            "columns": {field.name: str(field.type) for field in table.schema},
+            "source_size": stat.st_size,
+            "source_mtime_ns": stat.st_mtime_ns,
+        }
+        converted.append(key)
+        logger.info(f"Converted {src_path} -> {dst_path} ({table.num_rows} rows)")
+
+    columnar_dir.mkdir(parents=True, exist_ok=True)
+    with open(columnar_dir / SCHEMA_FILE_NAME, "w") as f:
+        json.dump(schema, f, indent=2)
+
+    return converted
+
+
+def is_source_unchanged(cached: dict, src_path: Path) -> bool:
+    """Whether the source CSV still has the size and mtime recorded at conversion (True if it is absent)."""
+    if not src_path.is_file():
+        return True
+    stat = src_path.stat()
+    if cached.get("source_size") == stat.st_size and cached.get("source_mtime_ns") == stat.st_mtime_ns:
+        return True
+    logger.warning(f"Columnar cache of {src_path.name} is stale (source changed), reading the CSV instead")
+    return False
+
+
+def load_table(
+    settings: DirectorySettings,
+    name: str,
+    columns: list[str] | None = None,
+    to_pandas: bool = True,
+) -> Any:
+    """Load a competition table, reading only the requested columns.
+
+    The columnar cache next to COMP_DATASET_DIR is memory mapped when it exists and its source CSV is
+    unchanged, otherwise the raw CSV is read. Paths are resolved from DirectorySettings, so this works
+    the same in local, vertex and kaggle.
+
+    Args:
+        settings: directory settings
+        name: relative path of the table in the competition dataset ("train" or "train.csv")
+        columns: columns to read (None reads all)
+        to_pandas: return a pandas DataFrame instead of a pyarrow Table
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    import pyarrow.parquet as pq
+
+    key = name if Path(name).suffix else f"{name}.csv"
+    columnar_dir = get_columnar_dir(settings.COMP_DATASET_DIR)
+    cached = load_schema(columnar_dir).get(key)
+    src_path = settings.COMP_DATASET_DIR / key
+
+    if cached and (columnar_dir / cached["path"]).is_file() and is_source_unchanged(cached, src_path):
+        path = columnar_dir / cached["path"]
+        if cached["format"] == "parquet":
+            table = pq.read_table(path, columns=columns, memory_map=True)
+        else:
+            table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+            if columns is not None:
+                table = table.select(columns)
+    else:
+        logger.info(f"Columnar cache not found for {key}, reading {src_path}")
+        table = pv.read_csv(src_path, convert_options=pv.ConvertOptions(include_columns=columns))
+
+    return table.to_pandas() if to_pandas else table
@@ -0,0 +1,197 @@
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+
+from src.kaggle_ops.utils.manifest import build_manifest
+from src.settings import DirectorySettings
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+FEATURE_STORE_DIR = os.getenv("KAGGLE_OPS_FEATURE_STORE_DIR")
+FEATURE_STORE_MAX_BYTES = int(float(os.getenv("KAGGLE_OPS_FEATURE_STORE_MAX_GB", "20")) * 1024**3)
+# zips duplicate the extracted files and dotfiles are our own manifests
+INPUT_IGNORE_PATTERNS = [".*", "*.zip"]
+INPUTS_MANIFEST_DIR_NAME = "_inputs"
+
+
+def get_feature_store_dir(settings: DirectorySettings) -> Path:
+    """Feature store directory shared by every experiment.
+
+    {INPUT_DIR}/../features, i.e. ./data/features locally (synced by pull-data / push-data)
+    and /gcs/{bucket}/features on Vertex. On Kaggle /kaggle/input is read only, so {ROOT_DIR}/features.
+    """
+    if FEATURE_STORE_DIR:
+        return Path(FEATURE_STORE_DIR)
+    if settings.run_env == "kaggle":
+        return Path(settings.ROOT_DIR) / "features"
+    return Path(settings.INPUT_DIR).parent / "features"
+
+
+def function_fingerprint(fn: Callable) -> str:
+    """Module, name and source code of a function (bytecode when the source is unavailable)."""
+    try:
+        source = inspect.getsource(fn)
+    except (OSError, TypeError):
+        source = fn.__code__.co_code.hex()
+    return f"{fn.__module__}.{fn.__qualname__}\n{source}"
+
+
+class FeatureStore:
+    """Cache of feature DataFrames keyed by the competition inputs, the feature function source and its params.
+
+    Entries are stored as {store_dir}/{function name}/{key}.parquet with a {key}.json sidecar and
+    evicted by least recent access once the store exceeds max_bytes.
+
+    Example:
+    >>> store = FeatureStore(DirectorySettings(exp_name=exp_name), inputs=["train.csv", "test.csv"])
+    >>> @store.feature
+    ... def target_encoding(smoothing: float = 10.0) -> pd.DataFrame: ...
+    >>> features = target_encoding(smoothing=20.0)
+    """
+
+    def __init__(
+        self,
+        settings: DirectorySettings,
+        store_dir: str | Path | None = None,
+        max_bytes: int = FEATURE_STORE_MAX_BYTES,
+        inputs: list[str] | None = None,
+    ) -> None:
+        self.input_dir = Path(settings.COMP_DATASET_DIR)
+        self.store_dir = Path(store_dir) if store_dir is not None else get_feature_store_dir(settings)
+        self.max_bytes = max_bytes
+        self.inputs = inputs
+        self._input_digest: str | None = None
+
+    def _is_input(self, rel_path: str) -> bool:
+        return self.inputs is None or any(fnmatch(rel_path, pattern) for pattern in self.inputs)
+
+    def input_digest(self) -> str:
+        """Digest of the input files (hashed once, then reused while their size and mtime are unchanged).
+
+        Only the declared inputs are hashed when inputs is given.
+        """
+        if self._input_digest is not None:
+            return self._input_digest
+
+        manifest_path = (
+            self.store_dir
+            / INPUTS_MANIFEST_DIR_NAME
+            / f"{hashlib.sha256(str(self.input_dir.resolve()).encode()).hexdigest()[:16]}.json"
+        )
+        previous = None
+        if manifest_path.is_file():
+            with open(manifest_path) as f:
+                previous = json.load(f)
+        manifest = build_manifest(self.input_dir, INPUT_IGNORE_PATTERNS, previous, include=self._is_input)
+        # keep the digests recorded by stores with other inputs
+        kept = {rel: entry for rel, entry in (previous or {}).get("files", {}).items() if not self._is_input(rel)}
+        _atomic_write_json(manifest_path, {**manifest, "files": {**kept, **manifest["files"]}})
+
+        files = sorted((rel, entry["digest"]) for rel, entry in manifest["files"].items())
+        self._input_digest = hashlib.sha256(json.dumps(files).encode()).hexdigest()
+        return self._input_digest
+
+    def key(self, fn: Callable, params: dict) -> str:
+        payload = json.dumps(
+            [self.input_digest(), function_fingerprint(fn), params],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def get_or_compute(self, fn: Callable, **params: Any) -> Any:
+        """Load fn(**params) from the store, computing and storing it on a miss."""
+        import pandas as pd
+
+        key = self.key(fn, params)
+        entry_dir = self.store_dir / fn.__name__
+        data_path = entry_dir / f"{key}.parquet"
+        meta_path = entry_dir / f"{key}.json"
+
+        if data_path.is_file() and meta_path.is_file():
+            logger.info(f"Feature store hit: {fn.__name__} ({key})")
+            with open(meta_path) as f:
+                meta = json.load(f)
+            meta["last_access"] = time.time()
+            _atomic_write_json(meta_path, meta)
+            return pd.read_parquet(data_path)
+
+        logger.info(f"Feature store miss: {fn.__name__} ({key})")
+        start = time.perf_counter()
+        features = fn(**params)
+        duration = time.perf_counter() - start
+
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = data_path.with_name(f".{data_path.name}.{os.getpid()}.tmp")
+        features.to_parquet(tmp_path)
+        os.replace(tmp_path, data_path)
+        now = time.time()
+        _atomic_write_json(
+            meta_path,
+            {
+                "name": fn.__name__,
+                "params": params,
+                "size": data_path.stat().st_size,
+                "compute_seconds": duration,
+                "created": now,
+                "last_access": now,
+            },
+        )
+        self.evict()
+        return features
+
+    def feature(self, fn: Callable) -> Callable:
+        """Decorator caching fn in the store."""
+
+        @functools.wraps(fn)
+        def wrapper(**params: Any) -> Any:
+            return self.get_or_compute(fn, **params)
+
+        return wrapper
+
+    def entries(self) -> list[tuple[Path, dict]]:
+        """(data path, metadata) of every stored entry."""
+        entries = []
+        for meta_path in self.store_dir.glob("*/*.json"):
+            if meta_path.parent.name == INPUTS_MANIFEST_DIR_NAME:
+                continue
+            data_path = meta_path.with_suffix(".parquet")
+            try:
+                with open(meta_path) as f:
+                    entries.append((data_path, json.load(f)))
+            except (OSError, json.JSONDecodeError):
+                continue
+        return entries
+
+    def evict(self) -> list[Path]:
+        """Remove the least recently accessed entries until the store fits in max_bytes."""
+        entries = sorted(self.entries(), key=lambda e: e[1].get("last_access", 0))
+        total = sum(meta.get("size", 0) for _, meta in entries)
+        evicted = []
+        for data_path, meta in entries:
+            if total <= self.max_bytes:
+                break
+            data_path.unlink(missing_ok=True)
+            data_path.with_suffix(".json").unlink(missing_ok=True)
+            total -= meta.get("size", 0)
+            evicted.append(data_path)
+            logger.info(f"Evicted {data_path} ({meta.get('size', 0)} bytes)")
+        return evicted
+
+
+def _atomic_write_json(path: Path, obj: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(obj, f, default=str)
+    os.replace(tmp_path, path)
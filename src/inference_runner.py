@@ -0,0 +1,183 @@
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from src.columnar import get_columnar_dir, load_schema
+from src.kaggle_ops.utils.utils import get_cpu_count
+from src.settings import DirectorySettings
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+InitFn = Callable[[], Any]
+PredictFn = Callable[[Any, Any], Any]
+
+
+class InferenceSettings(BaseModel):
+    """
+    Settings for the batch inference runner.
+    """
+
+    exp_name: str = Field(default="submission", description="Experiment name of the inference output directory.")
+    run_env: str | None = Field(default=None, description="Environment type: 'local', 'kaggle' or 'vertex'.")
+    test_name: str = Field(default="test.csv", description="Relative path of the test table in COMP_DATASET_DIR.")
+    columns: list[str] | None = Field(default=None, description="Columns of the test table to read (default: all).")
+    output_name: str = Field(default="submission.csv", description="File name of the predictions in OUTPUT_DIR.")
+    chunk_size: int = Field(default=100_000, description="Number of rows per chunk.")
+    num_workers: int | None = Field(default=None, description="Number of worker processes (default: CPU count).")
+    max_pending_chunks: int | None = Field(
+        default=None, description="Maximum number of chunks in flight (default: 2 * num_workers)."
+    )
+
+
+def iter_chunks(path: str | Path, chunk_size: int, columns: list[str] | None = None) -> Iterator[Any]:
+    """Stream a CSV / Parquet / Arrow file as pandas DataFrames of chunk_size rows (the last one may be smaller)."""
+    import pyarrow as pa
+    import pyarrow.csv as pv
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    if path.suffix == ".parquet":
+        batches: Iterator[Any] = pq.ParquetFile(path, memory_map=True).iter_batches(
+            batch_size=chunk_size, columns=columns
+        )
+    elif path.suffix in (".arrow", ".feather"):
+        reader = pa.ipc.open_file(pa.memory_map(str(path), "r"))
+        batches = (
+            reader.get_batch(i).select(columns) if columns else reader.get_batch(i)
+            for i in range(reader.num_record_batches)
+        )
+    else:
+        batches = iter(pv.open_csv(path, convert_options=pv.ConvertOptions(include_columns=columns)))
+
+    buffer: list[Any] = []
+    buffered_rows = 0
+    for batch in batches:
+        buffer.append(batch)
+        buffered_rows += batch.num_rows
+        while buffered_rows >= chunk_size:
+            table = pa.Table.from_batches(buffer)
+            yield table.slice(0, chunk_size).to_pandas()
+            rest = table.slice(chunk_size)
+            buffer = rest.to_batches()
+            buffered_rows = rest.num_rows
+    if buffered_rows > 0:
+        yield pa.Table.from_batches(buffer).to_pandas()
+
+
+def resolve_test_path(settings: DirectorySettings, test_name: str) -> Path:
+    """Columnar cache of the test table if it exists, otherwise the raw file in COMP_DATASET_DIR."""
+    columnar_dir = get_columnar_dir(settings.COMP_DATASET_DIR)
+    cached = load_schema(columnar_dir).get(test_name)
+    if cached and (columnar_dir / cached["path"]).is_file():
+        return columnar_dir / cached["path"]
+    return settings.COMP_DATASET_DIR / test_name
+
+
+_worker_state: Any = None
+
+
+def _init_worker(init_fn: InitFn | None) -> None:
+    global _worker_state
+    _worker_state = init_fn() if init_fn is not None else None
+
+
+def _predict_chunk(predict_fn: PredictFn, chunk: Any) -> tuple[Any, float]:
+    start = time.perf_counter()
+    predictions = predict_fn(_worker_state, chunk)
+    return predictions, time.perf_counter() - start
+
+
+class StageStats:
+    """Rows and time spent in each stage of the runner."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, int] = {}
+        self.seconds: dict[str, float] = {}
+
+    def add(self, stage: str, rows: int, seconds: float) -> None:
+        self.rows[stage] = self.rows.get(stage, 0) + rows
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    def print_summary(self) -> None:
+        print("\n=== Inference summary ===")
+        for stage, seconds in self.seconds.items():
+            rows = self.rows[stage]
+            print(f"{stage:<16} {rows:>12} rows {seconds:>9.2f}s {rows / max(seconds, 1e-9):>14,.0f} rows/s")
+
+
+class InferenceRunner:
+    """Predict a test table chunk by chunk over a process pool.
+
+    init_fn runs once in every worker (e.g. to build an ArtifactStore) and its return value is
+    passed to predict_fn(state, chunk) with each pandas DataFrame chunk. Both must be picklable
+    (module-level functions). At most max_pending_chunks chunks are in flight, and predictions
+    are appended to OUTPUT_DIR/output_name in input order as soon as they are ready.
+
+    Example (src/inference.py):
+    >>> def load_models():
+    ...     return ArtifactStore()
+    >>> def predict(store, chunk):
+    ...     return pd.DataFrame({"id": chunk["id"], "target": store.get("exp001", "model.pkl").predict(chunk)})
+    >>> if __name__ == "__main__":
+    ...     InferenceRunner(predict, tyro.cli(InferenceSettings), init_fn=load_models).run()
+    """
+
+    def __init__(self, predict_fn: PredictFn, settings: InferenceSettings, init_fn: InitFn | None = None) -> None:
+        self.predict_fn = predict_fn
+        self.init_fn = init_fn
+        self.settings = settings
+        self.stats = StageStats()
+
+    def run(self) -> Path:
+        settings = self.settings
+        directory_settings = DirectorySettings(exp_name=settings.exp_name, run_env=settings.run_env)
+        test_path = resolve_test_path(directory_settings, settings.test_name)
+        num_workers = settings.num_workers or get_cpu_count()
+        max_pending = settings.max_pending_chunks or 2 * num_workers
+
+        output_path = Path(directory_settings.OUTPUT_DIR) / settings.output_name
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = output_path.with_name(output_path.name + ".partial")
+        partial_path.unlink(missing_ok=True)
+        logger.info(
+            f"Predicting {test_path} -> {output_path} ({num_workers} workers, {settings.chunk_size} rows/chunk)"
+        )
+
+        total_start = time.perf_counter()
+        pending: deque[Future] = deque()
+        chunks = iter_chunks(test_path, settings.chunk_size, settings.columns)
+        with ProcessPoolExecutor(num_workers, initializer=_init_worker, initargs=(self.init_fn,)) as executor:
+            while True:
+                while len(pending) < max_pending:
+                    start = time.perf_counter()
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    self.stats.add("read", len(chunk), time.perf_counter() - start)
+                    pending.append(executor.submit(_predict_chunk, self.predict_fn, chunk))
+                if not pending:
+                    break
+                predictions, predict_seconds = pending.popleft().result()
+                self.stats.add("predict", len(predictions), predict_seconds)
+                self._write(predictions, partial_path)
+
+        if not partial_path.exists():
+            raise RuntimeError(f"No rows were read from {test_path}")
+        os.replace(partial_path, output_path)
+        self.stats.add("total", self.stats.rows.get("write", 0), time.perf_counter() - total_start)
+        self.stats.print_summary()
+        return output_path
+
+    def _write(self, predictions: Any, path: Path) -> None:
+        start = time.perf_counter()
+        predictions.to_csv(path, mode="a", header=not path.exists(), index=False)
+        self.stats.add("write", len(predictions), time.perf_counter() - start)
@@ -0,0 +1,26 @@
+import logging
+
+from tyro.extras import SubcommandApp
+
+from .submit import submit
+from .utils.timing import report_spans
+
+app = SubcommandApp()
+app.command(submit)
+
+
+if __name__ == "__main__":
+    """Run the whole kaggle_ops flow in one process.
+
+    Help:
+    >>> uv run python -m src.kaggle_ops submit -h
+
+    Example:
+    >>> uv run python -m src.kaggle_ops submit
+    >>> uv run python -m src.kaggle_ops submit --settings.force-push-deps --settings.max-workers 8
+    """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", force=True)
+    try:
+        app.cli()
+    finally:
+        report_spans()
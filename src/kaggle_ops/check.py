@@ -1,20 +1,19 @@
 import json
 import logging
+import time
 
 import dotenv
-from kaggle import KaggleApi
 from pydantic import BaseModel, Field
 from tyro.extras import SubcommandApp
 
 from ..settings import SUBMISSION_CODE_DIR, KaggleSettings, LocalDirectorySettings
-from .utils.customhub import check_if_exist_model_instance
+from .utils.customhub import wait_for_dataset_ready, wait_for_model_instances
+from .utils.utils import get_kaggle_client
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 dotenv.load_dotenv()
-client = KaggleApi()
-client.authenticate()
 
 app = SubcommandApp()
 local_directory_settings = LocalDirectorySettings()  # type: ignore
@@ -31,14 +30,26 @@ class CheckNecessaryArtifactsSettings(BaseModel):
     )
 
 
-@app.command()
-def nessesary_artifacts_exist(settings: CheckNecessaryArtifactsSettings) -> bool:
-    """Check if the necessary artifacts for the submission code exist."""
-    kaggle_settings = settings.kaggle_settings
+class WaitArtifactsReadySettings(BaseModel):
+    """
+    Settings for waiting until the necessary artifacts for the submission code are ready.
+    """
+
+    kaggle_settings: KaggleSettings = Field(
+        default_factory=lambda: KaggleSettings(),  # type: ignore
+        description="Kaggle settings for the check process.",
+    )
+    timeout: float = Field(default=900.0, description="Overall deadline in seconds.")
+    initial_interval: float = Field(default=5.0, description="Initial polling interval in seconds.")
+    max_interval: float = Field(default=60.0, description="Maximum polling interval in seconds.")
+
+
+def load_model_sources(kaggle_settings: KaggleSettings) -> list[str] | None:
+    """Load and validate model_sources of the submission kernel-metadata.json (None if invalid)."""
     metadata_path = SUBMISSION_CODE_DIR / "kernel-metadata.json"
     if not metadata_path.exists():
         logger.error(f"Metadata file not found: {metadata_path}")
-        return False
+        return None
 
     with open(metadata_path) as f:
         metadata = json.load(f)
@@ -47,12 +58,70 @@ def nessesary_artifacts_exist(settings: CheckNecessaryArtifactsSettings) -> bool
     for handle in model_sources:
         if not handle.startswith(kaggle_settings.BASE_ARTIFACTS_HANDLE):
             logger.error(f"Invalid model source handle: {handle}")
-            return False
-        if not check_if_exist_model_instance(client, handle):
+            return None
+
+    return model_sources
+
+
+def _check_model_sources(
+    kaggle_settings: KaggleSettings,
+    timeout: float,
+    initial_interval: float = 5.0,
+    max_interval: float = 60.0,
+) -> bool:
+    model_sources = load_model_sources(kaggle_settings)
+    if model_sources is None:
+        return False
+
+    ready = wait_for_model_instances(
+        get_kaggle_client(),
+        model_sources,
+        timeout=timeout,
+        initial_interval=initial_interval,
+        max_interval=max_interval,
+    )
+    for handle, is_ready in ready.items():
+        if not is_ready:
             logger.error(f"Model instance does not exist: {handle}")
-            return False
 
-    return True
+    return all(ready.values())
+
+
+@app.command()
+def codes_ready(settings: WaitArtifactsReadySettings) -> None:
+    """Wait until the latest version of the codes dataset is processed."""
+    handle = settings.kaggle_settings.CODES_HANDLE.lower()
+    is_ready = wait_for_dataset_ready(
+        get_kaggle_client(),
+        handle,
+        timeout=settings.timeout,
+        initial_interval=settings.initial_interval,
+        max_interval=settings.max_interval,
+    )
+    if not is_ready:
+        raise TimeoutError(f"Codes dataset {handle} is not ready within {settings.timeout}s")
+
+
+@app.command()
+def nessesary_artifacts_exist(settings: CheckNecessaryArtifactsSettings) -> bool:
+    """Check if the necessary artifacts for the submission code exist."""
+    return _check_model_sources(settings.kaggle_settings, timeout=0)
+
+
+@app.command()
+def artifacts_ready(settings: WaitArtifactsReadySettings) -> None:
+    """Wait until all model_sources of the submission code are ready (polled concurrently)."""
+    start = time.monotonic()
+    is_ready = _check_model_sources(
+        settings.kaggle_settings,
+        timeout=settings.timeout,
+        initial_interval=settings.initial_interval,
+        max_interval=settings.max_interval,
+    )
+    if not is_ready:
+        raise TimeoutError(f"Artifacts are not ready within {settings.timeout}s")
+
+    logger.info(f"All artifacts are ready ({time.monotonic() - start:.1f}s)")
 
 
 if __name__ == "__main__":
@@ -60,6 +129,8 @@ if __name__ == "__main__":
     Command line interface for checking necessary artifacts for the submission code.
     Example:
     >>> uv run python -m src.kaggle_ops.check nessesary-artifacts-exist
+    >>> uv run python -m src.kaggle_ops.check artifacts-ready --settings.timeout 900
+    >>> uv run python -m src.kaggle_ops.check codes-ready
     """
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", force=True)
     app.cli()
@@ -1,19 +1,19 @@
 import logging
+from pathlib import Path
 
 import dotenv
-from kaggle import KaggleApi
 from pydantic import BaseModel, Field
 from tyro.extras import SubcommandApp
 
 from ..settings import KaggleSettings, LocalDirectorySettings
 from .utils.customhub import competition_download, datasets_download
+from .utils.timing import report_spans
+from .utils.utils import get_kaggle_client
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 dotenv.load_dotenv()
-client = KaggleApi()
-client.authenticate()
 
 app = SubcommandApp()
 local_directory_settings = LocalDirectorySettings()  # type: ignore
@@ -29,6 +29,12 @@ class DownloadCompetitionDatasetSettings(BaseModel):
         description="Kaggle settings for the download process.",
     )
     force_download: bool = Field(False, description="Whether to force download the dataset even if it already exists.")
+    extract_workers: int | None = Field(default=None, description="Number of extraction threads (default: auto).")
+    to_columnar: bool = Field(default=False, description="Whether to convert the tabular files to a columnar cache.")
+    columnar_format: str = Field(default="parquet", description="Columnar cache format: 'parquet' or 'arrow'.")
+    columnar_float32: bool = Field(
+        default=False, description="Whether to downcast float64 columns to float32 in the columnar cache (lossy)."
+    )
 
 
 class DownloadDatasetsSettings(BaseModel):
@@ -44,6 +50,8 @@ class DownloadDatasetsSettings(BaseModel):
     force_download: bool = Field(
         False, description="Whether to force download the datasets even if they already exist."
     )
+    max_workers: int = Field(default=4, description="Number of concurrent dataset downloads.")
+    extract_workers: int | None = Field(default=None, description="Number of extraction threads per archive.")
 
 
 @app.command()
@@ -53,12 +61,22 @@ def competition_dataset(settings: DownloadCompetitionDatasetSettings) -> None:
     """
 
     competition_download(
-        client=client,
+        client=get_kaggle_client(),
         handle=settings.kaggle_settings.KAGGLE_COMPETITION_NAME,
         destination=local_directory_settings.INPUT_DIR,
         force_download=settings.force_download,
+        extract_workers=settings.extract_workers,
     )
 
+    if settings.to_columnar:
+        from ..columnar import convert_to_columnar
+
+        comp_dataset_dir = Path(local_directory_settings.INPUT_DIR) / settings.kaggle_settings.KAGGLE_COMPETITION_NAME
+        converted = convert_to_columnar(
+            comp_dataset_dir, fmt=settings.columnar_format, float32=settings.columnar_float32
+        )
+        logger.info(f"Converted {len(converted)} files to {settings.columnar_format}")
+
 
 @app.command()
 def datasets(settings: DownloadDatasetsSettings) -> None:
@@ -66,10 +84,12 @@ def datasets(settings: DownloadDatasetsSettings) -> None:
     Download the specified Kaggle datasets.
     """
     datasets_download(
-        client=client,
+        client=get_kaggle_client(),
         handles=settings.handles,
         destination=local_directory_settings.INPUT_DIR,
         force_download=settings.force_download,
+        max_workers=settings.max_workers,
+        extract_workers=settings.extract_workers,
     )
 
 
@@ -79,6 +99,12 @@ if __name__ == "__main__":
     Help:
     >>> uv run python -m src.kaggle_ops.download competition-dataset -h
     >>> uv run python -m src.kaggle_ops.download datasets -h
+
+    Example:
+    >>> uv run python -m src.kaggle_ops.download competition-dataset --settings.to-columnar
     """
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", force=True)
-    app.cli()
+    try:
+        app.cli()
+    finally:
+        report_spans()
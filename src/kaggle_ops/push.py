@@ -1,5 +1,7 @@
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import dotenv
@@ -7,6 +9,8 @@ import tyro
 
 from ..settings import SUBMISSION_CODE_DIR, KaggleSettings
 from .upload import UploadArtifactSettings, artifacts
+from .utils.timing import report_spans
+from .utils.utils import format_bytes
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -44,49 +48,107 @@ def parse_exp_names_from_kernel_metadata(kernel_metadata_path: Path) -> list[str
     return exp_names
 
 
-def push_artifacts(run_env: str = "local", exp_names: str = "") -> None:
+def _push_experiment(exp_name: str, run_env: str, kaggle_settings: KaggleSettings, compact: bool = False) -> dict:
+    """Upload artifacts of a single experiment and return its summary row (never raises)."""
+    print(f"Uploading artifacts: {exp_name}")
+    start = time.perf_counter()
+    row: dict = {"exp_name": exp_name, "status": "success", "skipped_bytes": 0, "total_bytes": 0, "error": ""}
+    try:
+        artifact_settings = UploadArtifactSettings(
+            exp_name=exp_name, run_env=run_env, kaggle_settings=kaggle_settings, compact=compact
+        )
+        result = artifacts(artifact_settings)
+        row["status"] = "success" if result.uploaded else "skipped"
+        row["skipped_bytes"] = result.skipped_bytes
+        row["total_bytes"] = result.total_bytes
+    except Exception as e:
+        logger.exception(f"Failed to upload artifacts: {exp_name}")
+        row["status"] = "failure"
+        row["error"] = f"{type(e).__name__}: {e}"
+    row["duration"] = time.perf_counter() - start
+    return row
+
+
+def print_push_summary(rows: list[dict]) -> None:
+    """Print per-experiment push summary."""
+    print("\n=== Push summary ===")
+    print(f"{'exp_name':<40} {'status':<8} {'duration':>10} {'skipped':>10} {'total':>10}  error")
+    for row in rows:
+        line = (
+            f"{row['exp_name']:<40} {row['status']:<8} {row['duration']:>9.1f}s "
+            f"{format_bytes(row['skipped_bytes']):>10} {format_bytes(row['total_bytes']):>10}  {row['error']}"
+        )
+        print(line.rstrip())
+
+
+def resolve_exp_names(exp_names: str = "") -> list[str]:
+    """Use provided comma-separated exp_names or parse them from kernel-metadata.json."""
+    if exp_names:
+        exp_names_list = [name.strip() for name in exp_names.split(",")]
+        print(f"Using provided exp_names: {exp_names_list}")
+        return exp_names_list
+
+    # Parse exp_names from kernel-metadata.json
+    kernel_metadata_path = SUBMISSION_CODE_DIR / "kernel-metadata.json"
+    if not kernel_metadata_path.exists():
+        raise FileNotFoundError(f"kernel-metadata.json not found: {kernel_metadata_path}")
+
+    exp_names_list = parse_exp_names_from_kernel_metadata(kernel_metadata_path)
+    if not exp_names_list:
+        raise ValueError("No exp_names found in kernel-metadata.json's model_sources")
+    print(f"Parsed exp_names from kernel-metadata.json: {exp_names_list}")
+    return exp_names_list
+
+
+def push_experiments(
+    exp_names_list: list[str],
+    run_env: str,
+    kaggle_settings: KaggleSettings,
+    max_workers: int = 1,
+    compact: bool = False,
+) -> list[dict]:
+    """Upload artifacts of experiments concurrently, print the summary and fail if any experiment failed."""
+    print(f"Experiments to upload: {exp_names_list} (max_workers={max_workers})")
+
+    # Upload artifacts for each exp_name
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        rows = list(
+            executor.map(lambda name: _push_experiment(name, run_env, kaggle_settings, compact), exp_names_list)
+        )
+
+    print_push_summary(rows)
+
+    failed = [row["exp_name"] for row in rows if row["status"] == "failure"]
+    if failed:
+        raise RuntimeError(f"Failed to upload artifacts: {failed}")
+
+    print("All artifacts uploaded successfully")
+    return rows
+
+
+def push_artifacts(run_env: str = "local", exp_names: str = "", max_workers: int = 1, compact: bool = False) -> None:
     """
     Upload artifacts to Kaggle for specified experiments.
 
     This command:
     1. Uses provided exp_names or parses them from kernel-metadata.json
-    2. Uploads artifacts for each experiment
-    3. Waits 60s for processing
-    4. Checks that all necessary artifacts exist
+    2. Uploads artifacts for each experiment (up to max_workers experiments at once)
+    3. Prints a per-experiment success/failure/duration summary
+
+    A failure of one experiment does not abort the others; the command fails after the summary.
 
     Args:
         run_env: Environment type: 'local' or 'vertex'
         exp_names: Comma-separated experiment names (optional, defaults to parsing from kernel-metadata.json)
+        max_workers: Maximum number of experiments uploaded concurrently
+        compact: Upload compacted copies of the artifacts (see src/kaggle_ops/utils/compact.py)
     """
     print(f"Running in {run_env} environment")
 
     # Initialize Kaggle settings
     kaggle_settings = KaggleSettings()  # type: ignore
 
-    # Determine exp_names: use provided argument or parse from kernel-metadata.json
-    if exp_names:
-        exp_names_list = [name.strip() for name in exp_names.split(",")]
-        print(f"Using provided exp_names: {exp_names_list}")
-    else:
-        # Parse exp_names from kernel-metadata.json
-        kernel_metadata_path = SUBMISSION_CODE_DIR / "kernel-metadata.json"
-        if not kernel_metadata_path.exists():
-            raise FileNotFoundError(f"kernel-metadata.json not found: {kernel_metadata_path}")
-
-        exp_names_list = parse_exp_names_from_kernel_metadata(kernel_metadata_path)
-        if not exp_names_list:
-            raise ValueError("No exp_names found in kernel-metadata.json's model_sources")
-        print(f"Parsed exp_names from kernel-metadata.json: {exp_names_list}")
-
-    print(f"Experiments to upload: {exp_names_list}")
-
-    # Upload artifacts for each exp_name
-    for exp_name in exp_names_list:
-        print(f"Uploading artifacts: {exp_name}")
-        artifact_settings = UploadArtifactSettings(exp_name=exp_name, run_env=run_env, kaggle_settings=kaggle_settings)
-        artifacts(artifact_settings)
-
-    print("All artifacts uploaded successfully")
+    push_experiments(resolve_exp_names(exp_names), run_env, kaggle_settings, max_workers=max_workers, compact=compact)
 
 
 if __name__ == "__main__":
@@ -98,6 +160,11 @@ if __name__ == "__main__":
     Example:
     >>> uv run python -m src.kaggle_ops.push --run-env local
     >>> uv run python -m src.kaggle_ops.push --run-env vertex
+    >>> uv run python -m src.kaggle_ops.push --run-env local --max-workers 4
+    >>> uv run python -m src.kaggle_ops.push --run-env local --compact
     """
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", force=True)
-    tyro.cli(push_artifacts)
+    try:
+        tyro.cli(push_artifacts)
+    finally:
+        report_spans()
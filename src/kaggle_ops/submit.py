@@ -0,0 +1,119 @@
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import dotenv
+from pydantic import BaseModel, Field
+
+from ..settings import SUBMISSION_CODE_DIR, KaggleSettings
+from .check import WaitArtifactsReadySettings, artifacts_ready, codes_ready
+from .push import push_experiments, resolve_exp_names
+from .upload import UploadCodeSettings, UploadDepsSettings, codes, deps
+from .utils.customhub import kernel_push
+from .utils.utils import get_kaggle_client
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+dotenv.load_dotenv()
+
+
+class SubmitSettings(BaseModel):
+    """
+    Settings for the whole submission flow.
+    """
+
+    kaggle_settings: KaggleSettings = Field(
+        default_factory=lambda: KaggleSettings(),  # type: ignore
+        description="Kaggle settings shared by every stage.",
+    )
+    run_env: str = Field(default="local", description="Environment type: 'local' or 'vertex'")
+    exp_names: str = Field(default="", description="Comma-separated experiment names (default: model_sources).")
+    max_workers: int = Field(default=4, description="Maximum number of experiments uploaded concurrently.")
+    force_push_deps: bool = Field(
+        default=False, description="Push the deps kernel even if the requirements are unchanged."
+    )
+    deps_install_mode: str = Field(default="wheels", description="Deps install mode: 'wheels' or 'overlay'.")
+    bundle_code: bool = Field(default=False, description="Upload only the modules used by src/inference.py.")
+    push_artifacts: bool = Field(default=True, description="Whether to upload the experiment artifacts.")
+    compact_artifacts: bool = Field(default=False, description="Upload compacted copies of the artifacts.")
+    wait_timeout: float = Field(default=900.0, description="Deadline in seconds for the artifacts to be ready.")
+
+
+class StageTimer:
+    """Record the wall time of each stage of a flow."""
+
+    def __init__(self) -> None:
+        self.durations: list[tuple[str, float, str]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        logger.info(f"==> {name}")
+        start = time.perf_counter()
+        status = "failure"
+        try:
+            yield
+            status = "success"
+        finally:
+            self.durations.append((name, time.perf_counter() - start, status))
+
+    def print_summary(self) -> None:
+        print("\n=== Stage summary ===")
+        for name, duration, status in self.durations:
+            print(f"{name:<20} {status:<8} {duration:>9.1f}s")
+        print(f"{'total':<20} {'':<8} {sum(d for _, d, _ in self.durations):>9.1f}s")
+
+
+def submit(settings: SubmitSettings) -> None:
+    """
+    Run the whole submission flow in one process with one authenticated client.
+
+    Stages: push-deps -> push-artifacts -> upload-codes -> wait-artifacts -> (wait-codes) -> push-submission
+    """
+    kaggle_settings = settings.kaggle_settings
+    timer = StageTimer()
+
+    try:
+        with timer.stage("authenticate"):
+            client = get_kaggle_client()
+
+        with timer.stage("push-deps"):
+            deps(
+                UploadDepsSettings(
+                    kaggle_settings=kaggle_settings,
+                    force=settings.force_push_deps,
+                    install_mode=settings.deps_install_mode,
+                )
+            )
+
+        if settings.push_artifacts:
+            with timer.stage("push-artifacts"):
+                push_experiments(
+                    resolve_exp_names(settings.exp_names),
+                    run_env=settings.run_env,
+                    kaggle_settings=kaggle_settings,
+                    max_workers=settings.max_workers,
+                    compact=settings.compact_artifacts,
+                )
+
+        with timer.stage("upload-codes"):
+            codes_updated = codes(
+                UploadCodeSettings(
+                    run_env=settings.run_env, kaggle_settings=kaggle_settings, bundle=settings.bundle_code
+                )
+            )
+
+        with timer.stage("wait-artifacts"):
+            wait_settings = WaitArtifactsReadySettings(kaggle_settings=kaggle_settings, timeout=settings.wait_timeout)
+            artifacts_ready(wait_settings)
+
+        # an unchanged codes dataset is already processed
+        if codes_updated:
+            with timer.stage("wait-codes"):
+                codes_ready(wait_settings)
+
+        with timer.stage("push-submission"):
+            kernel_push(client, SUBMISSION_CODE_DIR)
+    finally:
+        timer.print_summary()
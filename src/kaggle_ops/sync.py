@@ -0,0 +1,220 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Protocol
+
+import dotenv
+from pydantic import BaseModel, Field
+from tyro.extras import SubcommandApp
+
+from ..settings import KaggleSettings, LocalDirectorySettings
+from .parse_exp_names import parse_exp_names
+from .utils.utils import CACHE_DIR, format_bytes
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+dotenv.load_dotenv()
+
+app = SubcommandApp()
+
+LISTING_CACHE_DIR = CACHE_DIR / "listings"
+LISTING_CACHE_TTL = float(os.getenv("KAGGLE_OPS_LISTING_TTL", "300"))
+
+
+class FileSystem(Protocol):
+    """The part of the fsspec filesystem interface used for syncing."""
+
+    def find(self, path: str, detail: bool = ...) -> Any: ...
+
+    def get_file(self, rpath: str, lpath: str) -> None: ...
+
+
+class LocalFileSystem:
+    """Local directory standing in for a bucket (fsspec-style find / get_file)."""
+
+    def find(self, path: str, detail: bool = False) -> Any:
+        found = {}
+        for root, _, filenames in os.walk(path):
+            for filename in filenames:
+                full_path = Path(root, filename).as_posix()
+                found[full_path] = {"name": full_path, "size": os.path.getsize(full_path), "type": "file"}
+        return found if detail else sorted(found)
+
+    def get_file(self, rpath: str, lpath: str) -> None:
+        shutil.copyfile(rpath, lpath)
+
+
+def get_filesystem(url: str) -> tuple[FileSystem, str]:
+    """Filesystem and root path of a bucket url (gs://bucket) or a local directory."""
+    if url.startswith("gs://"):
+        import gcsfs
+
+        return gcsfs.GCSFileSystem(), url.removeprefix("gs://").rstrip("/")
+    return LocalFileSystem(), Path(url).as_posix().rstrip("/")
+
+
+class ListingCache:
+    """Object listings ({relative path: size}) of bucket prefixes cached on disk for ttl seconds."""
+
+    def __init__(self, cache_dir: Path = LISTING_CACHE_DIR, ttl: float = LISTING_CACHE_TTL) -> None:
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()[:24]}.json"
+
+    def get(self, key: str) -> dict[str, int] | None:
+        path = self._path(key)
+        if not path.is_file():
+            return None
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if cached.get("key") != key or time.time() - cached.get("listed_at", 0) > self.ttl:
+            return None
+        return cached["objects"]
+
+    def set(self, key: str, objects: dict[str, int]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"key": key, "listed_at": time.time(), "objects": objects}, f)
+        os.replace(tmp_path, path)
+
+
+def list_objects(fs: FileSystem, root: str, prefix: str, cache: ListingCache | None = None) -> dict[str, int]:
+    """Objects under {root}/{prefix} as {path relative to root: size}."""
+    key = f"{root}/{prefix}"
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    objects = {}
+    for name, info in fs.find(key, detail=True).items():
+        if info.get("type", "file") != "file":
+            continue
+        objects[name.removeprefix(f"{root}/")] = int(info.get("size") or 0)
+
+    if cache is not None:
+        cache.set(key, objects)
+    return objects
+
+
+def pull(
+    fs: FileSystem,
+    root: str,
+    prefixes: list[str],
+    dst_dir: str | Path,
+    max_workers: int = 16,
+    cache: ListingCache | None = None,
+) -> dict[str, int]:
+    """Download the objects under prefixes that are missing locally (or have another size) into dst_dir.
+
+    Returns:
+        dict[str, int]: number of listed / transferred objects and transferred bytes
+    """
+    dst_dir = Path(dst_dir)
+    objects: dict[str, int] = {}
+    for prefix in prefixes:
+        objects.update(list_objects(fs, root, prefix.strip("/"), cache))
+
+    to_fetch = [
+        rel
+        for rel, size in sorted(objects.items())
+        if not (dst_dir / rel).is_file() or (dst_dir / rel).stat().st_size != size
+    ]
+    logger.info(f"{len(to_fetch)}/{len(objects)} objects to pull ({format_bytes(sum(objects[r] for r in to_fetch))})")
+
+    def _fetch(rel: str) -> str:
+        dst = dst_dir / rel
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(dst.name + ".partial")
+        try:
+            fs.get_file(f"{root}/{rel}", str(tmp))
+            os.replace(tmp, dst)
+        except Exception as e:
+            tmp.unlink(missing_ok=True)
+            return f"{rel}: {e}"
+        return ""
+
+    errors = []
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            errors = [error for error in executor.map(_fetch, to_fetch) if error]
+    if errors:
+        raise RuntimeError(f"Failed to pull {len(errors)} objects:\n" + "\n".join(errors))
+
+    return {
+        "listed": len(objects),
+        "transferred": len(to_fetch),
+        "transferred_bytes": sum(objects[rel] for rel in to_fetch),
+    }
+
+
+class PullSubmissionDataSettings(BaseModel):
+    """
+    Settings for pulling only the data needed for the submission from the bucket.
+    """
+
+    kaggle_settings: KaggleSettings = Field(
+        default_factory=lambda: KaggleSettings(),  # type: ignore
+        description="Kaggle settings for the sync process.",
+    )
+    bucket_url: str = Field(default="", description="Bucket url or local directory (default: gs://$BUCKET_NAME).")
+    exp_names: str = Field(default="", description="Comma-separated experiment names (default: model_sources).")
+    include_input: bool = Field(default=True, description="Whether to pull the competition input.")
+    max_workers: int = Field(default=16, description="Number of concurrent transfers.")
+    refresh: bool = Field(default=False, description="Ignore the cached object listings.")
+
+
+@app.command()
+def submission_data(settings: PullSubmissionDataSettings) -> None:
+    """
+    Pull the outputs of the submitted experiments and the competition input from the bucket.
+    """
+    bucket_url = settings.bucket_url or f"gs://{os.environ['BUCKET_NAME']}"
+    fs, root = get_filesystem(bucket_url)
+
+    exp_names = [name.strip() for name in settings.exp_names.split(",") if name.strip()] or parse_exp_names()
+    prefixes = [f"output/{exp_name}/1" for exp_name in exp_names]
+    if settings.include_input:
+        prefixes.append(f"input/{settings.kaggle_settings.KAGGLE_COMPETITION_NAME}")
+
+    local_data_dir = Path(LocalDirectorySettings().INPUT_DIR).parent  # type: ignore
+    start = time.monotonic()
+    result = pull(
+        fs,
+        root,
+        prefixes,
+        local_data_dir,
+        max_workers=settings.max_workers,
+        cache=None if settings.refresh else ListingCache(),
+    )
+    logger.info(
+        f"Pulled {result['transferred']}/{result['listed']} objects "
+        f"({format_bytes(result['transferred_bytes'])}) from {bucket_url} in {time.monotonic() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    """Run the bucket sync commands.
+
+    Help:
+    >>> uv run python -m src.kaggle_ops.sync submission-data -h
+
+    Example:
+    >>> uv run python -m src.kaggle_ops.sync submission-data
+    >>> uv run python -m src.kaggle_ops.sync submission-data --settings.exp-names exp001,exp002 --settings.refresh
+    """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", force=True)
+    app.cli()
@@ -1,21 +1,24 @@
 import logging
+import tempfile
 from pathlib import Path
 from typing import Protocol
 
 import dotenv
-from kaggle import KaggleApi
 from pydantic import BaseModel, Field
 from tyro.extras import SubcommandApp
 
-from ..settings import KaggleSettings, LocalDirectorySettings, VertexDirectorySettings
-from .utils.customhub import dataset_upload, model_upload
+from ..settings import DEPS_CODE_DIR, KaggleSettings, LocalDirectorySettings, VertexDirectorySettings
+from .utils.bundle import DEFAULT_ENTRY_POINTS, build_code_bundle
+from .utils.compact import COMPACT_CACHE_DIR, compact_artifacts
+from .utils.customhub import IGNORE_PATTERNS, UploadResult, dataset_upload, kernel_push, model_upload
+from .utils.deps_state import check_deps_fresh, deps_digest, save_deps_state
+from .utils.timing import report_spans
+from .utils.utils import format_bytes, get_kaggle_client
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 dotenv.load_dotenv()
-client = KaggleApi()
-client.authenticate()
 
 app = SubcommandApp()
 
@@ -34,8 +37,10 @@ def get_directory_settings(run_env: str) -> DirectoryConfig:
         bucket_name = vertex_settings.BUCKET_NAME
 
         class VertexDirectoryConfig:
-            ROOT_DIR = vertex_settings.ROOT_DIR.format(bucket=bucket_name)
-            ARTIFACT_DIR = vertex_settings.ARTIFACT_DIR.format(bucket=bucket_name)
+            ROOT_DIR = vertex_settings.ROOT_DIR.format(gcs_root=vertex_settings.GCS_MOUNT_ROOT, bucket=bucket_name)
+            ARTIFACT_DIR = vertex_settings.ARTIFACT_DIR.format(
+                gcs_root=vertex_settings.GCS_MOUNT_ROOT, bucket=bucket_name
+            )
 
         return VertexDirectoryConfig()
     else:  # local
@@ -50,6 +55,24 @@ class UploadCodeSettings(BaseModel):
         KaggleSettings(),  # type: ignore
         description="Kaggle settings for the upload process.",
     )
+    stage_mode: str = Field(
+        default="auto", description="How files are staged: 'auto', 'hardlink', 'symlink' or 'copy'."
+    )
+    compresslevel: int = Field(default=6, description="Deflate level for directory archives (0 stores only).")
+    compress_workers: int = Field(
+        default=1,
+        description="Number of directory archives built (and top-level files staged) concurrently. "
+        "Top-level files are uploaded uncompressed; only subdirectories are zipped.",
+    )
+    bundle: bool = Field(
+        default=False, description="Upload only the modules imported from the entry points and the data files."
+    )
+    entry_points: list[str] = Field(
+        default_factory=lambda: list(DEFAULT_ENTRY_POINTS), description="Entry points of the code bundle."
+    )
+    data_patterns: list[str] = Field(
+        default_factory=list, description="Glob patterns (relative to ROOT_DIR) of data files added to the bundle."
+    )
 
 
 class UploadArtifactSettings(BaseModel):
@@ -61,40 +84,162 @@ class UploadArtifactSettings(BaseModel):
         KaggleSettings(),  # type: ignore
         description="Kaggle settings for the upload process.",
     )
+    incremental: bool = Field(
+        default=True, description="Skip the upload if artifacts are unchanged since the last push."
+    )
+    stage_mode: str = Field(
+        default="auto", description="How files are staged: 'auto', 'hardlink', 'symlink' or 'copy'."
+    )
+    compresslevel: int = Field(default=6, description="Deflate level for directory archives (0 stores only).")
+    compress_workers: int = Field(
+        default=1,
+        description="Number of directory archives built (and top-level files staged) concurrently. "
+        "Top-level files are uploaded uncompressed; only subdirectories are zipped.",
+    )
+    compact: bool = Field(
+        default=False, description="Upload a compacted copy of the artifacts (float32 arrays, Parquet frames)."
+    )
+    compact_float32: bool = Field(default=True, description="Downcast float64 arrays and columns when compacting.")
+    keep_float64: list[str] = Field(
+        default_factory=list, description="Glob patterns of artifacts that keep float64 when compacting."
+    )
+    drop_optimizer_state: bool = Field(
+        default=False, description="Drop optimizer and scheduler states from checkpoints when compacting."
+    )
+
+
+class UploadDepsSettings(BaseModel):
+    """Settings for pushing the deps kernel to Kaggle."""
+
+    kaggle_settings: KaggleSettings = Field(
+        KaggleSettings(),  # type: ignore
+        description="Kaggle settings for the upload process.",
+    )
+    force: bool = Field(default=False, description="Push the deps kernel even if the requirements are unchanged.")
+    install_mode: str = Field(
+        default="wheels", description="'wheels' downloads wheels, 'overlay' also builds a byte-compiled site-packages."
+    )
 
 
 @app.command()
-def codes(settings: UploadCodeSettings) -> None:
-    """Upload the code to Kaggle."""
+def codes(settings: UploadCodeSettings) -> bool:
+    """Upload the code to Kaggle.
+
+    Returns:
+        bool: whether a new version of the codes dataset was created
+    """
     directory_settings = get_directory_settings(settings.run_env)
 
-    dataset_upload(
-        client=client,
-        handle=settings.kaggle_settings.CODES_HANDLE,
-        local_dataset_dir=directory_settings.ROOT_DIR,
-        update=True,
-    )
+    if not settings.bundle:
+        return dataset_upload(
+            client=get_kaggle_client(),
+            handle=settings.kaggle_settings.CODES_HANDLE,
+            local_dataset_dir=directory_settings.ROOT_DIR,
+            update=True,
+            stage_mode=settings.stage_mode,
+            compresslevel=settings.compresslevel,
+            compress_workers=settings.compress_workers,
+        )
+
+    with tempfile.TemporaryDirectory() as bundle_dir:
+        build_code_bundle(
+            root=directory_settings.ROOT_DIR,
+            dst=bundle_dir,
+            entry_points=settings.entry_points,
+            data_patterns=settings.data_patterns,
+        )
+        return dataset_upload(
+            client=get_kaggle_client(),
+            handle=settings.kaggle_settings.CODES_HANDLE,
+            local_dataset_dir=bundle_dir,
+            ignore_patterns=[".*"],
+            update=True,
+            stage_mode=settings.stage_mode,
+            compresslevel=settings.compresslevel,
+            compress_workers=settings.compress_workers,
+        )
 
 
 @app.command()
-def artifacts(settings: UploadArtifactSettings) -> None:
+def artifacts(settings: UploadArtifactSettings) -> UploadResult:
     """Upload the artifacts to Kaggle."""
     exp_name = settings.exp_name
     kaggle_settings = settings.kaggle_settings
     directory_settings = get_directory_settings(settings.run_env)
 
-    model_upload(
-        client=client,
+    local_model_dir = Path(directory_settings.ARTIFACT_DIR) / str(exp_name) / "1"
+    if settings.compact:
+        compact_dir = COMPACT_CACHE_DIR / str(exp_name)
+        compact_artifacts(
+            local_model_dir,
+            compact_dir,
+            ignore_patterns=IGNORE_PATTERNS,
+            float32=settings.compact_float32,
+            keep_float64=settings.keep_float64,
+            drop_optimizer_state=settings.drop_optimizer_state,
+        )
+        local_model_dir = compact_dir
+
+    result = model_upload(
+        client=get_kaggle_client(),
         handle=f"{kaggle_settings.BASE_ARTIFACTS_HANDLE}/{exp_name}",
-        local_model_dir=str(Path(directory_settings.ARTIFACT_DIR) / str(exp_name) / "1"),
+        local_model_dir=str(local_model_dir),
         update=False,
+        incremental=settings.incremental,
+        stage_mode=settings.stage_mode,
+        compresslevel=settings.compresslevel,
+        compress_workers=settings.compress_workers,
+    )
+    logger.info(
+        f"{exp_name}: uploaded={result.uploaded}, "
+        f"skipped {format_bytes(result.skipped_bytes)} / {format_bytes(result.total_bytes)}"
     )
+    return result
+
+
+@app.command()
+def deps(settings: UploadDepsSettings) -> bool:
+    """Regenerate the deps code and push the deps kernel only if the requirements changed.
+
+    The submission code is regenerated with the same install mode, so that it never pip installs
+    wheels that an overlay deps kernel no longer writes (or the other way around).
+
+    Returns:
+        bool: whether a new kernel version was pushed
+    """
+    from .write import MakeCodeSettings, MakeDepsCodeSettings, deps_code, submission_code
+
+    kaggle_settings = settings.kaggle_settings
+    handle = f"{kaggle_settings.KAGGLE_USERNAME}/{kaggle_settings.DEPS_CODE_NAME}"
+    client = get_kaggle_client()
+
+    deps_code(MakeDepsCodeSettings(install_mode=settings.install_mode))
+    submission_code(MakeCodeSettings(kaggle_settings=kaggle_settings, deps_install_mode=settings.install_mode))
+    if not settings.force:
+        is_fresh, reason = check_deps_fresh(DEPS_CODE_DIR, client, handle, settings.install_mode)
+        if is_fresh:
+            logger.info(f"Deps kernel {handle} is up to date, skipping push")
+            return False
+        logger.info(f"Pushing deps kernel {handle}: {reason}")
+
+    state = deps_digest(DEPS_CODE_DIR, settings.install_mode)
+    kernel_push(client, DEPS_CODE_DIR)
+    save_deps_state(DEPS_CODE_DIR, state, handle)
+    return True
 
 
 @app.command()
 def sources(settings: UploadArtifactSettings) -> None:
     """Upload the codes and artifacts to Kaggle."""
-    codes(settings=UploadCodeSettings(run_env=settings.run_env, kaggle_settings=settings.kaggle_settings))
+    codes(
+        settings=UploadCodeSettings(
+            run_env=settings.run_env,
+            kaggle_settings=settings.kaggle_settings,
+            stage_mode=settings.stage_mode,
+            compresslevel=settings.compresslevel,
+            compress_workers=settings.compress_workers,
+        )
+    )
     artifacts(settings)
 
 
@@ -103,8 +248,14 @@ if __name__ == "__main__":
 
     Help:
     >>> uv run python -m src.kaggle_ops.upload codes -h
+    >>> uv run python -m src.kaggle_ops.upload codes --settings.bundle --settings.data-patterns "configs/*.yaml"
     >>> uv run python -m src.kaggle_ops.upload artifacts -h
+    >>> uv run python -m src.kaggle_ops.upload artifacts --settings.exp-name exp001 --settings.compact
     >>> uv run python -m src.kaggle_ops.upload sources -h
+    >>> uv run python -m src.kaggle_ops.upload deps -h
     """
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s", force=True)
-    app.cli()
+    try:
+        app.cli()
+    finally:
+        report_spans()
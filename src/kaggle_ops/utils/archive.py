@@ -0,0 +1,121 @@
+import logging
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .manifest import iter_files
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# Already compressed or high-entropy formats: deflating them burns CPU for (almost) no size reduction.
+INCOMPRESSIBLE_EXTENSIONS = [
+    ".pt",
+    ".pth",
+    ".ckpt",
+    ".safetensors",
+    ".bin",
+    ".npy",
+    ".npz",
+    ".lgb",
+    ".cbm",
+    ".onnx",
+    ".h5",
+    ".parquet",
+    ".feather",
+    ".zip",
+    ".gz",
+    ".bz2",
+    ".xz",
+    ".zst",
+    ".7z",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".webp",
+]
+DEFAULT_COMPRESSLEVEL = 6
+
+
+def write_zip_archive(
+    src_dir: str | Path,
+    archive_path: str | Path,
+    ignore_patterns: list | None = None,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+    stored_extensions: list[str] = INCOMPRESSIBLE_EXTENSIONS,
+) -> int:
+    """Write src_dir into a zip archive in a single streaming pass.
+
+    Entries matched by ignore_patterns are skipped while walking. Files with an extension in
+    stored_extensions are stored without compression, the rest are deflated with compresslevel
+    (0 stores everything). Member names are relative to src_dir, same as the Kaggle client archives.
+
+    Returns:
+        int: size of the written archive in bytes
+    """
+    src_dir = Path(src_dir)
+    stored = {ext.lower() for ext in stored_extensions}
+
+    with zipfile.ZipFile(archive_path, "w", allowZip64=True) as zf:
+        for rel_path in iter_files(src_dir, ignore_patterns):
+            file_path = src_dir / rel_path
+            if compresslevel == 0 or rel_path.suffix.lower() in stored:
+                compress_type, level = zipfile.ZIP_STORED, None
+            else:
+                compress_type, level = zipfile.ZIP_DEFLATED, compresslevel
+
+            zf.write(file_path, arcname=rel_path.as_posix(), compress_type=compress_type, compresslevel=level)
+
+    archive_size = os.path.getsize(archive_path)
+    logger.info(f"Archived {src_dir} -> {archive_path} ({archive_size} bytes)")
+    return archive_size
+
+
+def _member_parent(filename: str) -> str:
+    """Parent directory of a member, sanitized like ZipFile.extract (no absolute paths or "..")."""
+    parts = filename.replace("\\", "/").split("/")[:-1]
+    return "/".join(part for part in parts if part not in ("", ".", ".."))
+
+
+def extract_zip(zip_path: str | Path, out_dir: str | Path, max_workers: int | None = None) -> int:
+    """Extract a zip archive in-process, spreading members over threads.
+
+    Members are split into size-balanced groups, each extracted through its own ZipFile handle
+    (zlib releases the GIL while inflating). Existing files are overwritten, like "unzip -o".
+
+    Returns:
+        int: number of extracted members
+    """
+    max_workers = max_workers or min(8, os.cpu_count() or 1)
+    out_dir = Path(out_dir)
+
+    with zipfile.ZipFile(zip_path) as zf:
+        members = [info for info in zf.infolist() if not info.is_dir()]
+        for info in zf.infolist():
+            if info.is_dir():
+                zf.extract(info, out_dir)
+
+    # create member parents up front: archives without directory entries would make threads race on makedirs
+    for parent in {_member_parent(info.filename) for info in members}:
+        (out_dir / parent).mkdir(parents=True, exist_ok=True)
+
+    # greedy size balancing: largest members first, each to the lightest group
+    groups: list[list[zipfile.ZipInfo]] = [[] for _ in range(max(1, min(max_workers, len(members))))]
+    group_sizes = [0] * len(groups)
+    for info in sorted(members, key=lambda x: x.file_size, reverse=True):
+        i = group_sizes.index(min(group_sizes))
+        groups[i].append(info)
+        group_sizes[i] += info.file_size
+
+    def _extract_group(group: list[zipfile.ZipInfo]) -> None:
+        with zipfile.ZipFile(zip_path) as zf:
+            for info in group:
+                zf.extract(info, out_dir)
+
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        list(executor.map(_extract_group, groups))
+
+    logger.info(f"Extracted {len(members)} files: {zip_path} -> {out_dir}")
+    return len(members)
@@ -0,0 +1,110 @@
+import ast
+import importlib.util
+import logging
+import py_compile
+import shutil
+from collections import deque
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+DEFAULT_ENTRY_POINTS = ["src/inference.py"]
+
+
+def module_name(path: Path, root: Path) -> str:
+    parts = list(path.relative_to(root).with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+def resolve_module(name: str, root: Path) -> Path | None:
+    """Source file of module name under root (None for modules outside of root, e.g. stdlib or site-packages)."""
+    base = root.joinpath(*name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def imported_modules(path: Path, root: Path) -> set[str]:
+    """Absolute names of the modules imported by a source file, including imports inside functions."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    package = module_name(path, root) if path.name == "__init__.py" else module_name(path, root).rpartition(".")[0]
+
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                base = importlib.util.resolve_name("." * node.level + base, package) if package else base
+            names.add(base)
+            # `from package import module` imports a submodule
+            names.update(f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+    return {name for name in names if name}
+
+
+def find_local_modules(entry_points: list[Path], root: Path) -> set[Path]:
+    """Source files under root reachable from entry_points through imports (with their parent packages).
+
+    Names are resolved against the directories of the entry points first (running a script puts its
+    directory on sys.path, so src/inference.py can `import helper`), then against root.
+    """
+    search_dirs = [*dict.fromkeys(path.parent for path in entry_points), root]
+    found: set[Path] = set()
+    queue = deque(entry_points)
+    while queue:
+        path = queue.popleft()
+        if path in found:
+            continue
+        found.add(path)
+
+        names = imported_modules(path, root)
+        # importing a.b.c runs a/__init__.py and a/b/__init__.py
+        names.update(".".join(name.split(".")[:i]) for name in list(names) for i in range(1, name.count(".") + 1))
+        for name in names:
+            module_path = next(filter(None, (resolve_module(name, search_dir) for search_dir in search_dirs)), None)
+            if module_path is not None and module_path not in found:
+                queue.append(module_path)
+    return found
+
+
+def build_code_bundle(
+    root: str | Path,
+    dst: str | Path,
+    entry_points: list[str] = DEFAULT_ENTRY_POINTS,
+    data_patterns: list[str] | None = None,
+    compile_pyc: bool = True,
+) -> list[Path]:
+    """Copy the modules used by entry_points and the declared data files from root into dst.
+
+    Modules are byte-compiled with hash-based pycs that are used as is (no mtime / source check),
+    since Kaggle does not keep mtimes and /kaggle/input is read only. The pycs only take effect
+    when the Kaggle Python has the same version as the one building the bundle.
+
+    Returns:
+        list[Path]: relative paths of the bundled files (without pycs)
+    """
+    root, dst = Path(root).resolve(), Path(dst)
+    modules = find_local_modules([root / entry for entry in entry_points], root)
+    data_files = {path for pattern in data_patterns or [] for path in root.glob(pattern) if path.is_file()}
+
+    bundled = sorted(path.relative_to(root) for path in modules | data_files)
+    for rel_path in bundled:
+        (dst / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(root / rel_path, dst / rel_path)
+        if compile_pyc and rel_path.suffix == ".py":
+            py_compile.compile(
+                str(dst / rel_path),
+                cfile=importlib.util.cache_from_source(str(dst / rel_path)),
+                dfile=str(rel_path),
+                doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+
+    logger.info(f"Bundled {len(modules)} modules and {len(data_files)} data files from {root}")
+    return bundled
@@ -0,0 +1,238 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+from collections.abc import Callable
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+
+from ...artifact_store import COMPACTION_MANIFEST_NAME, load_compaction_manifest
+from .customhub import stage_file
+from .utils import CACHE_DIR, format_bytes
+from .walk import scan_tree
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# Compacted copies of the artifacts, {COMPACT_CACHE_DIR}/{exp_name}. Unchanged files are linked, not copied.
+# The compaction manifest uploaded with them (COMPACTION_MANIFEST_NAME) is read back by ArtifactStore.
+COMPACT_CACHE_DIR = Path(os.getenv("KAGGLE_OPS_COMPACT_DIR", str(CACHE_DIR / "compact"))).expanduser()
+PICKLE_SUFFIXES = (".pkl", ".pickle", ".joblib")
+CHECKPOINT_SUFFIXES = (".pt", ".pth", ".ckpt")
+# Top-level checkpoint keys that are only needed to resume training (plain torch and Lightning checkpoints).
+OPTIMIZER_STATE_KEYS = (
+    "optimizer",
+    "optimizer_state_dict",
+    "optimizer_states",
+    "scheduler",
+    "scheduler_state_dict",
+    "lr_scheduler",
+    "lr_schedulers",
+)
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def _compact_npy(src: Path, dst: Path, float32: bool, drop_optimizer_state: bool) -> list[str]:
+    import numpy as np
+
+    array = np.load(src, mmap_mode="r", allow_pickle=False)
+    if not float32 or array.dtype != np.float64:
+        return []
+    with open(_tmp_path(dst), "wb") as f:
+        np.save(f, array.astype(np.float32))
+    os.replace(_tmp_path(dst), dst)
+    return ["float64->float32"]
+
+
+def _compact_npz(src: Path, dst: Path, float32: bool, drop_optimizer_state: bool) -> list[str]:
+    import numpy as np
+
+    with np.load(src, allow_pickle=False) as npz:
+        arrays = {name: npz[name] for name in npz.files}
+    if not float32 or not any(a.dtype == np.float64 for a in arrays.values()):
+        return []
+    arrays = {name: a.astype(np.float32) if a.dtype == np.float64 else a for name, a in arrays.items()}
+    with open(_tmp_path(dst), "wb") as f:
+        np.savez(f, **arrays)  # type: ignore[arg-type]
+    os.replace(_tmp_path(dst), dst)
+    return ["float64->float32"]
+
+
+def _compact_parquet(src: Path, dst: Path, float32: bool, drop_optimizer_state: bool) -> list[str]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(src)
+    if not float32 or not any(pa.types.is_float64(field.type) for field in schema):
+        return []
+    table = pq.read_table(src)
+    table = table.cast(
+        pa.schema(
+            [field.with_type(pa.float32()) if pa.types.is_float64(field.type) else field for field in schema],
+            metadata=schema.metadata,
+        )
+    )
+    pq.write_table(table, _tmp_path(dst))
+    os.replace(_tmp_path(dst), dst)
+    return ["float64->float32"]
+
+
+def _load_pickle(path: Path) -> Any:
+    try:
+        import joblib
+    except ImportError:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    return joblib.load(path)
+
+
+def _compact_pickle(src: Path, dst: Path, float32: bool, drop_optimizer_state: bool) -> list[str]:
+    """Pickled DataFrames are rewritten as Parquet next to dst (dst.with_suffix(".parquet"))."""
+    import pandas as pd
+
+    if src.with_suffix(".parquet").exists():
+        return []
+    obj = _load_pickle(src)
+    if not isinstance(obj, pd.DataFrame):
+        return []
+    actions = ["pickle->parquet"]
+    if float32:
+        float64_columns = obj.select_dtypes(include="float64").columns
+        if len(float64_columns):
+            obj = obj.astype(dict.fromkeys(float64_columns, "float32"))
+            actions.append("float64->float32")
+    out = dst.with_suffix(".parquet")
+    obj.to_parquet(_tmp_path(out))
+    os.replace(_tmp_path(out), out)
+    return actions
+
+
+def _compact_checkpoint(src: Path, dst: Path, float32: bool, drop_optimizer_state: bool) -> list[str]:
+    if not drop_optimizer_state:
+        return []
+    import torch
+
+    checkpoint = torch.load(src, map_location="cpu", weights_only=False)
+    if not isinstance(checkpoint, dict):
+        return []
+    dropped = [key for key in OPTIMIZER_STATE_KEYS if key in checkpoint]
+    if not dropped:
+        return []
+    for key in dropped:
+        del checkpoint[key]
+    torch.save(checkpoint, _tmp_path(dst))
+    os.replace(_tmp_path(dst), dst)
+    return [f"drop:{key}" for key in dropped]
+
+
+COMPACTORS: dict[str, Callable[[Path, Path, bool, bool], list[str]]] = {
+    ".npy": _compact_npy,
+    ".npz": _compact_npz,
+    ".parquet": _compact_parquet,
+    **dict.fromkeys(PICKLE_SUFFIXES, _compact_pickle),
+    **dict.fromkeys(CHECKPOINT_SUFFIXES, _compact_checkpoint),
+}
+
+
+def compact_artifacts(
+    src_dir: str | Path,
+    dst_dir: str | Path,
+    ignore_patterns: list | None = None,
+    float32: bool = True,
+    keep_float64: list[str] | None = None,
+    drop_optimizer_state: bool = False,
+) -> dict:
+    """Write a compacted copy of the artifacts in src_dir into dst_dir and record it in COMPACTION_MANIFEST_NAME.
+
+    - float64 arrays (.npy, .npz) and Parquet columns are downcast to float32 (unless float32=False or
+      the file matches keep_float64)
+    - pickled DataFrames are rewritten as Parquet ("oof.pkl" -> "oof.parquet")
+    - optimizer and scheduler states are dropped from checkpoints (only with drop_optimizer_state)
+
+    Other files, and files that fail to compact, are staged unchanged (hardlinked where possible).
+    Files whose size and mtime match the previous compaction are not processed again.
+
+    Returns:
+        dict: the compaction manifest
+    """
+    src_dir, dst_dir = Path(src_dir), Path(dst_dir)
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    keep_float64 = keep_float64 or []
+    options = {"float32": float32, "keep_float64": keep_float64, "drop_optimizer_state": drop_optimizer_state}
+    options_digest = hashlib.sha256(json.dumps(options, sort_keys=True).encode()).hexdigest()[:16]
+
+    previous = load_compaction_manifest(dst_dir) or {}
+    previous_files = previous.get("files", {}) if previous.get("options_digest") == options_digest else {}
+
+    records: dict[str, dict] = {}
+    for entry in scan_tree(src_dir, ignore_patterns).files:
+        rel = entry.rel_path
+        if rel == COMPACTION_MANIFEST_NAME:
+            continue
+        prev = previous_files.get(rel)
+        if (
+            prev
+            and prev["size"] == entry.size
+            and prev["mtime_ns"] == entry.mtime_ns
+            and (dst_dir / prev["output"]).is_file()
+        ):
+            records[rel] = prev
+            continue
+
+        src, dst = src_dir / rel, dst_dir / rel
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        compactor = COMPACTORS.get(src.suffix.lower())
+        actions: list[str] = []
+        if compactor is not None:
+            allow_float32 = float32 and not any(fnmatch(rel, pattern) for pattern in keep_float64)
+            try:
+                actions = compactor(src, dst, allow_float32, drop_optimizer_state)
+            except Exception as e:
+                logger.warning(f"Failed to compact {rel}, uploading it unchanged: {e}")
+                actions = []
+
+        output = Path(rel).with_suffix(".parquet").as_posix() if "pickle->parquet" in actions else rel
+        if not actions:
+            dst.unlink(missing_ok=True)
+            stage_file(str(src), str(dst), "auto")
+        records[rel] = {
+            "output": output,
+            "actions": actions,
+            "size": entry.size,
+            "mtime_ns": entry.mtime_ns,
+            "compacted_size": (dst_dir / output).stat().st_size,
+        }
+
+    # outputs of files removed (or renamed) since the last compaction
+    outputs = {record["output"] for record in records.values()}
+    for entry in scan_tree(dst_dir, [".*"]).files:
+        if entry.rel_path != COMPACTION_MANIFEST_NAME and entry.rel_path not in outputs:
+            (dst_dir / entry.rel_path).unlink()
+
+    total_bytes = sum(record["size"] for record in records.values())
+    compacted_bytes = sum(record["compacted_size"] for record in records.values())
+    manifest = {
+        "source": str(src_dir),
+        "options": options,
+        "options_digest": options_digest,
+        "total_bytes": total_bytes,
+        "compacted_bytes": compacted_bytes,
+        "files": records,
+    }
+    manifest_path = dst_dir / COMPACTION_MANIFEST_NAME
+    with open(_tmp_path(manifest_path), "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(_tmp_path(manifest_path), manifest_path)
+
+    compacted = sum(1 for record in records.values() if record["actions"])
+    logger.info(
+        f"Compacted {compacted}/{len(records)} files of {src_dir}: "
+        f"{format_bytes(total_bytes)} -> {format_bytes(compacted_bytes)}"
+    )
+    return manifest
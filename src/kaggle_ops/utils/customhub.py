@@ -1,21 +1,42 @@
+from __future__ import annotations
+
+import errno
 import json
 import logging
 import os
+import random
 import shutil
-import subprocess
 import tempfile
-from fnmatch import fnmatch
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-
-from kaggle import KaggleApi
-
-from .utils import get_kaggle_authentication
+from typing import TYPE_CHECKING
+
+from .archive import DEFAULT_COMPRESSLEVEL, INCOMPRESSIBLE_EXTENSIONS, extract_zip, write_zip_archive
+from .download_manifest import (
+    check_download_fresh,
+    remote_competition_state,
+    remote_dataset_state,
+    save_download_manifest,
+)
+from .handle_index import get_handle_index
+from .manifest import build_manifest, load_manifest, manifest_equals, save_manifest
+from .timing import span
+from .utils import CACHE_DIR, format_bytes, get_kaggle_authentication
+from .walk import FileEntry, TreeScan, compile_ignore, display_tree, scan_tree
+
+if TYPE_CHECKING:
+    from kaggle import KaggleApi
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
-KAGGLE_USERNAME, KAGGLE_KEY = get_kaggle_authentication()
+def get_kaggle_username() -> str:
+    """Kaggle username from the environment (resolved on use, not at import)."""
+    return get_kaggle_authentication()[0]
 
 
 IGNORE_PATTERNS = [
@@ -33,33 +54,53 @@ IGNORE_PATTERNS = [
     "cloudbuild.yaml",
     "Makefile",
     "Dockerfile",
+    "benchmarks",
 ]
 
+# auto: hardlink on the same filesystem, symlink across filesystems
+# hardlink: hardlink, fall back to copy across filesystems (or where hardlinks are unsupported)
+STAGE_MODES = ("auto", "hardlink", "symlink", "copy")
+LINK_FALLBACK_ERRNOS = (errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EMLINK)
+
+
+@dataclass
+class UploadResult:
+    """Result of an upload call."""
+
+    handle: str
+    uploaded: bool
+    total_bytes: int = 0
+    skipped_bytes: int = 0
+
+
+def check_response(result: object, action: str) -> None:
+    """Raise if a create / upload call of the Kaggle client failed (it returns errors instead of raising)."""
+    if result is None:
+        raise RuntimeError(f"{action} failed: no response")
+    error = getattr(result, "error", "")
+    status = getattr(result, "status", None)
+    if error or (status is not None and str(status).lower() != "ok"):
+        raise RuntimeError(f"{action} failed: {error or status}")
+
 
 def existing_dataset(client: KaggleApi) -> list:
-    """Check existing dataset in kaggle."""
-    return client.dataset_list(user=KAGGLE_USERNAME)
+    """Check existing dataset in kaggle (all pages, cached)."""
+    return sorted(get_handle_index(client, "dataset", get_kaggle_username()).handles())
 
 
 def check_if_exist_dataset(client: KaggleApi, handle: str) -> bool:
     """Check if dataset already exist in kaggle."""
-    for ds in existing_dataset(client):
-        if str(ds.ref) == handle:
-            return True
-    return False
+    return handle in get_handle_index(client, "dataset", get_kaggle_username())
 
 
 def existing_model(client: KaggleApi) -> list:
-    """Check existing model instance in kaggle."""
-    return client.model_list(owner=KAGGLE_USERNAME)
+    """Check existing model in kaggle (all pages, cached)."""
+    return sorted(get_handle_index(client, "model", get_kaggle_username()).handles())
 
 
 def check_if_exist_model(client: KaggleApi, handle: str) -> bool:
-    """Check if model instance already exist in kaggle."""
-    for model in existing_model(client):
-        if str(model) == handle:
-            return True
-    return False
+    """Check if model already exist in kaggle."""
+    return handle in get_handle_index(client, "model", get_kaggle_username())
 
 
 def check_if_exist_model_instance(client: KaggleApi, handle: str) -> bool:
@@ -80,6 +121,138 @@ def check_if_exist_model_instance(client: KaggleApi, handle: str) -> bool:
         raise e
 
 
+TRANSIENT_STATUS_CODES = ("429", "500", "502", "503", "504")
+
+
+def is_transient_error(e: Exception) -> bool:
+    """Whether an API error is worth retrying (rate limit, server error or network failure)."""
+    if isinstance(e, ConnectionError | TimeoutError):
+        return True
+    return any(code in str(e) for code in TRANSIENT_STATUS_CODES)
+
+
+def wait_for_model_instances(
+    client: KaggleApi,
+    handles: list[str],
+    timeout: float = 600.0,
+    initial_interval: float = 5.0,
+    max_interval: float = 60.0,
+    max_workers: int = 16,
+) -> dict[str, bool]:
+    """Poll model instances concurrently until all of them exist or the deadline passes.
+
+    Each handle is polled with exponential backoff and jitter. timeout=0 checks every handle once.
+    Transient errors (see is_transient_error) count as not ready yet; other errors are raised.
+
+    Returns:
+        dict[str, bool]: readiness of each handle
+    """
+    deadline = time.monotonic() + timeout
+
+    def _poll(handle: str) -> bool:
+        interval = initial_interval
+        while True:
+            try:
+                if check_if_exist_model_instance(client, handle):
+                    return True
+            except Exception as e:
+                if not is_transient_error(e):
+                    raise
+                logger.warning(f"Transient error while checking {handle}, retrying: {e}")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval / 2 + random.uniform(0, interval / 2), remaining))
+            interval = min(interval * 2, max_interval)
+
+    if not handles:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(handles))) as executor:
+        ready = dict(zip(handles, executor.map(_poll, handles), strict=True))
+
+    logger.info(f"Ready model instances: {sum(ready.values())}/{len(handles)}")
+    return ready
+
+
+def wait_for_dataset_ready(
+    client: KaggleApi,
+    handle: str,
+    timeout: float = 600.0,
+    initial_interval: float = 5.0,
+    max_interval: float = 60.0,
+) -> bool:
+    """Poll a dataset with exponential backoff and jitter until its latest version is processed ("ready")."""
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+    while True:
+        status = str(client.dataset_status(handle)).lower()
+        if status == "ready":
+            logger.info(f"Dataset {handle} is ready")
+            return True
+        if status == "error":
+            logger.error(f"Dataset {handle} failed to process")
+            return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.error(f"Dataset {handle} is still {status} after {timeout}s")
+            return False
+        time.sleep(min(interval / 2 + random.uniform(0, interval / 2), remaining))
+        interval = min(interval * 2, max_interval)
+
+
+# Manifests of the last pushed dataset versions ({handle}: owner--dataset), one directory per handle.
+DATASET_PUSH_RECORD_DIR = CACHE_DIR / "datasets"
+# How long the listing is re-read after a push to learn the number of the pushed version.
+DATASET_VERSION_TIMEOUT = float(os.getenv("KAGGLE_OPS_DATASET_VERSION_TIMEOUT", "30"))
+
+
+def dataset_push_record_dir(handle: str) -> Path:
+    return DATASET_PUSH_RECORD_DIR / handle.lower().replace("/", "--")
+
+
+def wait_for_dataset_version(
+    client: KaggleApi,
+    handle: str,
+    after: int,
+    timeout: float = DATASET_VERSION_TIMEOUT,
+    initial_interval: float = 2.0,
+    max_interval: float = 10.0,
+) -> int | None:
+    """Re-read the listing until the dataset's current version is newer than after (None at the deadline).
+
+    The create / version responses carry no version number and listings lag behind the push.
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+    while True:
+        remote = remote_dataset_state(client, handle)
+        if remote is not None and remote["version"] is not None and remote["version"] > after:
+            return int(remote["version"])
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(interval / 2 + random.uniform(0, interval / 2), remaining))
+        interval = min(interval * 2, max_interval)
+
+
+def is_pushed_version(record: dict | None, remote_version: int | None, processing: bool = False) -> bool:
+    """Whether remote_version is the version recorded for the last push.
+
+    A push whose version was not listed yet is recorded with pending_after (the version before it):
+    a newer listed version is ours, while pending_after itself only counts as a lagging listing as long
+    as the dataset is still processing (after that, the push did not land).
+    """
+    if not record or remote_version is None:
+        return False
+    if record.get("version") is not None:
+        return record["version"] == remote_version
+    pending_after = record.get("pending_after")
+    if pending_after is None:
+        return False
+    return remote_version > pending_after or (processing and remote_version == pending_after)
+
+
 def make_dataset_metadata(handle: str) -> dict:
     """Create dataset metadata.
 
@@ -127,43 +300,140 @@ def make_model_metadata(handle: str) -> dict:
     return model_metadata
 
 
-def copytree(src: str, dst: str, ignore_patterns: list | None = None) -> None:
-    """Copytree with ignore patterns."""
-    ignore_patterns = ignore_patterns or []
+def stage_file(src: str, dst: str, mode: str = "copy") -> None:
+    """Place src at dst by copying or linking, according to mode (see STAGE_MODES)."""
+    if mode not in STAGE_MODES:
+        raise ValueError(f"Invalid stage mode: {mode}. Must be one of {STAGE_MODES}")
+
+    if mode == "auto":
+        same_fs = os.stat(src).st_dev == os.stat(os.path.dirname(dst)).st_dev
+        mode = "hardlink" if same_fs else "symlink"
+
+    if mode == "symlink":
+        os.symlink(os.path.abspath(src), dst)
+        return
+
+    if mode == "hardlink":
+        try:
+            os.link(src, dst)
+            return
+        except OSError as e:
+            if e.errno not in LINK_FALLBACK_ERRNOS:
+                raise
+
+    shutil.copy2(src, dst)
+
+
+def copytree(src: str, dst: str, ignore_patterns: list | None = None, mode: str = "copy") -> TreeScan:
+    """Copytree with ignore patterns. Files are copied or linked according to mode (see STAGE_MODES).
+
+    Returns:
+        TreeScan: the staged files and directories (from the single traversal of src)
+    """
+    scan = scan_tree(src, ignore_patterns, follow_symlinks=True)
+
+    os.makedirs(dst, exist_ok=True)
+    for rel_dir in scan.dirs:
+        os.makedirs(os.path.join(dst, rel_dir), exist_ok=True)
+    for entry in scan.files:
+        stage_file(os.path.join(src, entry.rel_path), os.path.join(dst, entry.rel_path), mode)
+
+    return TreeScan(root=Path(dst), files=scan.files, dirs=scan.dirs)
+
 
-    if not os.path.exists(dst):
-        os.makedirs(dst)
+def prepare_upload_folder(
+    src: str,
+    dst: str,
+    ignore_patterns: list | None = None,
+    stage_mode: str = "auto",
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+    compress_workers: int = 1,
+    stored_extensions: list[str] = INCOMPRESSIBLE_EXTENSIONS,
+) -> TreeScan:
+    """Prepare the folder handed to the Kaggle client, reading the source only once.
 
-    for item in os.listdir(src):
-        if any(fnmatch(item, pattern) for pattern in ignore_patterns):
+    Top-level files are staged (see stage_file). Each top-level directory is written straight from
+    the source into "<name>.zip", which is what the client would upload with dir_mode="zip", so the
+    client neither copies nor re-compresses anything. Archives are built and files are staged by
+    compress_workers threads.
+
+    Only directories are compressed: the client uploads top-level files as they are, and zipping one
+    would publish "<name>.zip" instead of the file. Move large flat files (e.g. OOF CSVs) into a
+    subdirectory to have them compressed.
+
+    Returns:
+        TreeScan: the staged files and archives with their sizes (dst is not traversed again)
+    """
+    is_ignored = compile_ignore(ignore_patterns)
+    os.makedirs(dst, exist_ok=True)
+
+    staged = TreeScan(root=Path(dst))
+    archive_jobs = []
+    file_entries = []
+    with os.scandir(src) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if is_ignored(entry.name):
             continue
 
-        s = os.path.join(src, item)
-        d = os.path.join(dst, item)
-        if os.path.isdir(s):
-            copytree(s, d, ignore_patterns)
+        if entry.is_dir():
+            archive_jobs.append((entry.path, os.path.join(dst, f"{entry.name}.zip")))
         else:
-            shutil.copy2(s, d)
+            file_entries.append(entry)
+            stat = entry.stat()
+            staged.files.append(FileEntry(entry.name, stat.st_size, stat.st_mtime_ns))
+
+    file_names = {entry.name for entry in file_entries}
+    for _, archive_path in archive_jobs:
+        if os.path.basename(archive_path) in file_names or os.path.exists(archive_path):
+            raise FileExistsError(f"Archive name collides with an existing file: {archive_path}")
+
+    with ThreadPoolExecutor(max_workers=max(1, compress_workers)) as executor:
+        staging = [
+            executor.submit(stage_file, entry.path, os.path.join(dst, entry.name), stage_mode) for entry in file_entries
+        ]
+        futures = [
+            executor.submit(
+                write_zip_archive,
+                src_dir,
+                archive_path,
+                ignore_patterns=ignore_patterns,
+                compresslevel=compresslevel,
+                stored_extensions=stored_extensions,
+            )
+            for src_dir, archive_path in archive_jobs
+        ]
+        for future in staging:
+            future.result()
+        for future, (_, archive_path) in zip(futures, archive_jobs, strict=True):
+            staged.files.append(FileEntry(os.path.basename(archive_path), future.result(), 0))
 
+    staged.files.sort(key=lambda e: e.rel_path)
+    return staged
 
-def display_tree(directory: Path, file_prefix: str = "") -> None:
-    """Display directory tree."""
-    entries = list(directory.iterdir())
-    file_count = len(entries)
 
-    for i, entry in enumerate(sorted(entries, key=lambda x: x.name)):
-        if i == file_count - 1:
-            prefix = "└── "
-            next_prefix = file_prefix + "    "
-        else:
-            prefix = "├── "
-            next_prefix = file_prefix + "│   "
+_model_create_locks: dict[str, threading.Lock] = {}
+_model_create_locks_lock = threading.Lock()
 
-        line = file_prefix + prefix + entry.name
-        print(line)
 
-        if entry.is_dir():
-            display_tree(entry, next_prefix)
+def ensure_model(client: KaggleApi, model_handle: str, span_handle: str = "") -> None:
+    """Create the model (<username>/<model_slug>) unless it exists.
+
+    The check and the creation are serialized per model, so concurrent pushes of instances of a new
+    model create it only once.
+    """
+    with _model_create_locks_lock:
+        lock = _model_create_locks.setdefault(model_handle, threading.Lock())
+    with lock:
+        with span("model_upload", "check_exists", span_handle or model_handle):
+            if check_if_exist_model(client=client, handle=model_handle):
+                return
+        with tempfile.TemporaryDirectory() as tempdir:
+            with open(Path(tempdir) / "model-metadata.json", "w") as f:
+                json.dump(make_model_metadata(handle=model_handle), f, indent=4)
+            with span("model_upload", "create_model", span_handle or model_handle):
+                check_response(client.model_create_new(folder=tempdir), f"Creating model {model_handle}")
+        get_handle_index(client, "model", get_kaggle_username()).add(model_handle)
 
 
 def model_upload(
@@ -172,61 +442,102 @@ def model_upload(
     local_model_dir: str,
     ignore_patterns: list[str] = IGNORE_PATTERNS,
     update: bool = False,  # 基本的に False (version 指定までしないといけないため)
-) -> None:
+    incremental: bool = True,
+    hash_workers: int | None = None,
+    stage_mode: str = "auto",
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+    compress_workers: int = 1,
+) -> UploadResult:
     """Push output directory to kaggle model instance.
 
     handle: <username>/<model_slug>/<framework>/<variation_slug>/
 
+    If incremental, a manifest of file sizes and digests is compared with the one recorded
+    at the last successful push (stored in local_model_dir), and unchanged artifacts are skipped.
+    Files are staged with links where possible (stage_mode, see STAGE_MODES) and directories are
+    archived in one pass from the source (compresslevel, compress_workers, see prepare_upload_folder).
+
     ref: https://github.com/Kaggle/kaggle-api/wiki/Model-Metadata
     """
     handle = handle.lower()
 
-    model_handle = "/".join(handle.split("/")[:2])
-    model_metadata = make_model_metadata(handle=model_handle)
-    with tempfile.TemporaryDirectory() as tempdir:
-        with open(Path(tempdir) / "model-metadata.json", "w") as f:
-            json.dump(model_metadata, f, indent=4)
+    manifest = None
+    if incremental:
+        with span("model_upload", "manifest", handle) as s:
+            previous_manifest = load_manifest(local_model_dir)
+            manifest = build_manifest(
+                local_model_dir,
+                ignore_patterns=ignore_patterns,
+                previous=previous_manifest,
+                max_workers=hash_workers,
+            )
+            s.files, s.bytes = len(manifest["files"]), manifest["total_bytes"]
+        manifest["handle"] = handle
+        if (previous_manifest or {}).get("handle") == handle and manifest_equals(manifest, previous_manifest):
+            logger.info(f"{handle} is unchanged since the last push. Skip {format_bytes(manifest['total_bytes'])}. ⏭️")
+            return UploadResult(
+                handle=handle,
+                uploaded=False,
+                total_bytes=manifest["total_bytes"],
+                skipped_bytes=manifest["total_bytes"],
+            )
 
-        if not check_if_exist_model(client=client, handle=model_handle):
-            client.model_create_new(folder=tempdir)
+    total_bytes = manifest["total_bytes"] if manifest else 0
+
+    ensure_model(client, "/".join(handle.split("/")[:2]), span_handle=handle)
 
     model_instance_metadata = make_model_instance_metadata(handle=handle)
-    is_exist_model_instance = check_if_exist_model_instance(client=client, handle=handle)
+    with span("model_upload", "check_exists", handle):
+        is_exist_model_instance = check_if_exist_model_instance(client=client, handle=handle)
 
     if is_exist_model_instance and not update:
         logger.warning(f"{handle} already exist!! Stop pushing. 🛑")
-        return
+        return UploadResult(handle=handle, uploaded=False, total_bytes=total_bytes, skipped_bytes=total_bytes)
 
     with tempfile.TemporaryDirectory() as tempdir:
-        copytree(
-            src=str(local_model_dir),
-            dst=str(tempdir),
-            ignore_patterns=ignore_patterns,
-        )
+        with span("model_upload", "stage", handle) as s:
+            staged = prepare_upload_folder(
+                src=str(local_model_dir),
+                dst=str(tempdir),
+                ignore_patterns=ignore_patterns,
+                stage_mode=stage_mode,
+                compresslevel=compresslevel,
+                compress_workers=compress_workers,
+            )
+            s.files, s.bytes = len(staged.files), staged.total_bytes
 
-        print(f"dst_dir={tempdir}\ntree")
-        display_tree(Path(tempdir))
+        with span("model_upload", "display_tree", handle):
+            print(f"dst_dir={tempdir}\ntree")
+            display_tree(scan=staged)
 
         with open(Path(tempdir) / "model-instance-metadata.json", "w") as f:
             json.dump(model_instance_metadata, f, indent=4)
 
-        if not is_exist_model_instance:
-            logger.info(f"create {handle}")
-            client.model_instance_create(
-                folder=tempdir,
-                quiet=False,
-                dir_mode="zip",
-            )
-            return
-
-        logger.info(f"update {handle}")
-        client.model_instance_version_create(
-            model_instance=handle,
-            folder=tempdir,
-            version_notes="latest",
-            quiet=False,
-            dir_mode="zip",
-        )
+        with span("model_upload", "upload", handle) as s:
+            s.files, s.bytes = len(staged.files), staged.total_bytes
+            if not is_exist_model_instance:
+                logger.info(f"create {handle}")
+                result = client.model_instance_create(
+                    folder=tempdir,
+                    quiet=False,
+                    dir_mode="zip",
+                )
+            else:
+                logger.info(f"update {handle}")
+                result = client.model_instance_version_create(
+                    model_instance=handle,
+                    folder=tempdir,
+                    version_notes="latest",
+                    quiet=False,
+                    dir_mode="zip",
+                )
+            # a failed upload must not be recorded, or the next push would skip the artifacts as unchanged
+            check_response(result, f"Uploading {handle}")
+
+    if manifest is not None:
+        save_manifest(local_model_dir, manifest)
+
+    return UploadResult(handle=handle, uploaded=True, total_bytes=total_bytes)
 
 
 def dataset_upload(
@@ -235,54 +546,141 @@ def dataset_upload(
     local_dataset_dir: str,
     ignore_patterns: list[str] = IGNORE_PATTERNS,
     update: bool = False,
-) -> None:
-    """Push output directory to kaggle dataset."""
+    incremental: bool = True,
+    stage_mode: str = "auto",
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+    compress_workers: int = 1,
+) -> bool:
+    """Push output directory to kaggle dataset.
+
+    If incremental, a manifest of the staged files is compared with the one recorded for the last pushed
+    version (see DATASET_PUSH_RECORD_DIR), and the push is skipped when the contents and the remote
+    version are unchanged.
+    Files are staged with links where possible (stage_mode, see STAGE_MODES) and directories are
+    archived in one pass from the source (compresslevel, compress_workers, see prepare_upload_folder).
+
+    Returns:
+        bool: whether a new dataset version was created
+    """
     handle = handle.lower()
 
     # model and predictions
     metadata = make_dataset_metadata(handle=handle)
 
     # if exist dataset, stop pushing
-    if check_if_exist_dataset(client=client, handle=handle) and not update:
+    with span("dataset_upload", "check_exists", handle):
+        is_exist_dataset = check_if_exist_dataset(client=client, handle=handle)
+    if is_exist_dataset and not update:
         logger.warning(f"{handle} already exist!! Stop pushing. 🛑")
-        return
+        return False
+
+    manifest = None
+    remote = None
+    if incremental:
+        with span("dataset_upload", "manifest", handle) as s:
+            previous_manifest = load_manifest(dataset_push_record_dir(handle))
+            manifest = build_manifest(local_dataset_dir, ignore_patterns=ignore_patterns, previous=previous_manifest)
+            s.files, s.bytes = len(manifest["files"]), manifest["total_bytes"]
+        if is_exist_dataset:
+            with span("dataset_upload", "remote_state", handle):
+                remote = remote_dataset_state(client, handle)
+            if _is_unchanged_push(client, handle, manifest, previous_manifest, remote):
+                return False
 
     dataset_name = handle.split("/")[-1]
 
     with tempfile.TemporaryDirectory() as tempdir:
         dst_dir = Path(tempdir) / dataset_name
 
-        copytree(
-            src=str(local_dataset_dir),
-            dst=str(dst_dir),
-            ignore_patterns=ignore_patterns,
-        )
+        with span("dataset_upload", "stage", handle) as s:
+            staged = prepare_upload_folder(
+                src=str(local_dataset_dir),
+                dst=str(dst_dir),
+                ignore_patterns=ignore_patterns,
+                stage_mode=stage_mode,
+                compresslevel=compresslevel,
+                compress_workers=compress_workers,
+            )
+            s.files, s.bytes = len(staged.files), staged.total_bytes
 
-        print(f"dst_dir={dst_dir}\ntree")
-        display_tree(dst_dir)
+        with span("dataset_upload", "display_tree", handle):
+            print(f"dst_dir={dst_dir}\ntree")
+            display_tree(scan=staged)
 
         with open(Path(dst_dir) / "dataset-metadata.json", "w") as f:
             json.dump(metadata, f, indent=4)
 
-        if check_if_exist_dataset(client=client, handle=handle) and update:
-            logger.info(f"update {handle}")
-            client.dataset_create_version(
-                folder=dst_dir,
-                version_notes="latest",
-                quiet=False,
-                convert_to_csv=False,
-                delete_old_versions=False,
-                dir_mode="zip",
-            )
-            return
-
-        logger.info(f"create {handle}")
-        client.dataset_create_new(
-            folder=dst_dir,
-            public=False,
-            quiet=False,
-            dir_mode="zip",
-        )
+        with span("dataset_upload", "upload", handle) as s:
+            s.files, s.bytes = len(staged.files), staged.total_bytes
+            if is_exist_dataset and update:
+                logger.info(f"update {handle}")
+                result = client.dataset_create_version(
+                    folder=dst_dir,
+                    version_notes="latest",
+                    quiet=False,
+                    convert_to_csv=False,
+                    delete_old_versions=False,
+                    dir_mode="zip",
+                )
+            else:
+                logger.info(f"create {handle}")
+                result = client.dataset_create_new(
+                    folder=dst_dir,
+                    public=False,
+                    quiet=False,
+                    dir_mode="zip",
+                )
+            check_response(result, f"Pushing {handle}")
+        if not (is_exist_dataset and update):
+            get_handle_index(client, "dataset", get_kaggle_username()).add(handle)
+
+    if manifest is not None:
+        _record_dataset_push(client, handle, manifest, None if remote is None else remote["version"], is_exist_dataset)
+    return True
+
+
+def _is_unchanged_push(
+    client: KaggleApi, handle: str, manifest: dict, previous_manifest: dict | None, remote: dict | None
+) -> bool:
+    """Whether the remote dataset is still the recorded push of unchanged contents (resolving a pending record)."""
+    if remote is None or previous_manifest is None or not manifest_equals(manifest, previous_manifest):
+        return False
+    processing = False
+    if previous_manifest.get("version") is None and remote["version"] == previous_manifest.get("pending_after"):
+        # the listing still shows the version before the pending push: lagging only while it is processed
+        processing = str(client.dataset_status(handle)).lower() not in ("ready", "error")
+    if not is_pushed_version(previous_manifest, remote["version"], processing=processing):
+        return False
+
+    logger.info(f"{handle} is unchanged since version {remote['version']}. Skip pushing. ⏭️")
+    if previous_manifest.get("version") is None and not processing:
+        # the pending push is listed now
+        save_manifest(dataset_push_record_dir(handle), {**previous_manifest, "version": remote["version"]})
+    return True
+
+
+def _record_dataset_push(
+    client: KaggleApi, handle: str, manifest: dict, remote_version: int | None, is_exist_dataset: bool
+) -> None:
+    """Save the manifest of a pushed dataset with the number of the pushed version (or as pending)."""
+    # without a remote version before the push, the pushed one cannot be told apart
+    if remote_version is not None or not is_exist_dataset:
+        after = remote_version or 0
+        with span("dataset_upload", "pushed_version", handle):
+            manifest["version"] = wait_for_dataset_version(client, handle, after, DATASET_VERSION_TIMEOUT)
+        if manifest["version"] is None:
+            logger.info(f"Version pushed to {handle} is not listed yet, recording it as pending")
+            manifest["pending_after"] = after
+    dataset_push_record_dir(handle).mkdir(parents=True, exist_ok=True)
+    save_manifest(dataset_push_record_dir(handle), manifest)
+
+
+def kernel_push(client: KaggleApi, folder: str | Path) -> None:
+    """Push a kernel folder (code + kernel-metadata.json), like `kaggle k push`."""
+    result = client.kernels_push(str(folder))
+    if result is None or result.error:
+        raise RuntimeError(f"Kernel push failed ({folder}): {getattr(result, 'error', 'no response')}")
+    logger.info(f"Kernel version {result.version_number} pushed: {result.url}")
 
 
 def competition_download(
@@ -290,6 +688,7 @@ def competition_download(
     handle: str,
     destination: str | Path = "./",
     force_download: bool = False,
+    extract_workers: int | None = None,
 ) -> None:
     """Download competition dataset.
 
@@ -297,53 +696,118 @@ def competition_download(
         destination (str | Path): base destination directory ({destination}/{handle} is created)
         handle (str): competition name
         force_download (bool, optional): if True, overwrite existing dataset. Defaults to False.
+        extract_workers (int | None, optional): number of extraction threads. Defaults to None (auto).
+
+    The download is skipped only if the download manifest matches the remote files and the local
+    zip and extracted tree are complete (see check_download_fresh).
     """
     out_dir = Path(destination) / handle
     zipfile_path = out_dir / f"{handle}.zip"
     zipfile_path.parent.mkdir(exist_ok=True, parents=True)
 
-    if not zipfile_path.is_file() or force_download:
-        client.competition_download_files(
-            competition=handle,
-            path=out_dir,
-            quiet=False,
-            force=force_download,
-        )
-        subprocess.run(["unzip", "-o", "-q", zipfile_path, "-d", out_dir])
+    with span("competition_download", "remote_state", handle):
+        remote = remote_competition_state(client, handle)
+    with span("competition_download", "check_fresh", handle):
+        is_fresh, reason = check_download_fresh(out_dir, zipfile_path, remote)
+
+    if not is_fresh or force_download:
+        logger.info(f"Downloading competition dataset: {handle} ({'forced' if force_download else reason})")
+        with span("competition_download", "download", handle) as s:
+            client.competition_download_files(
+                competition=handle,
+                path=out_dir,
+                quiet=False,
+                force=force_download or zipfile_path.is_file(),
+            )
+            s.add_path(zipfile_path)
+        with span("competition_download", "extract", handle) as s:
+            s.files = extract_zip(zipfile_path, out_dir, max_workers=extract_workers)
+        with span("competition_download", "save_manifest", handle):
+            save_download_manifest(out_dir, handle, remote, zipfile_path)
     else:
-        logger.info(f"Dataset ({handle}) already exists.")
+        logger.info(f"Dataset ({handle}) already exists and is up to date.")
 
 
-def datasets_download(
+def dataset_download(
     client: KaggleApi,
-    handles: list[str],
+    handle: str,
     destination: str | Path = "./",
     force_download: bool = False,
+    extract_workers: int | None = None,
 ) -> None:
-    """Download kaggle datasets.
+    """Download and extract a single kaggle dataset into {destination}/{dataset_name}.
 
-    Args:
-        handles (list[str]): list of dataset names (e.g. ["username/dataset-name"])
-        destination (str | Path, optional): destination directory. Defaults to "./".
-        force_download (bool, optional): if True, overwrite existing dataset. Defaults to False.
+    The download is skipped only if the download manifest matches the remote version and the local
+    zip and extracted tree are complete (see check_download_fresh).
     """
-    for dataset in handles:
-        dataset_name = dataset.split("/")[1]
-        out_dir = Path(destination) / dataset_name
-        zipfile_path = out_dir / f"{dataset_name}.zip"
+    dataset_name = handle.split("/")[1]
+    out_dir = Path(destination) / dataset_name
+    zipfile_path = out_dir / f"{dataset_name}.zip"
+
+    out_dir.mkdir(exist_ok=True, parents=True)
 
-        out_dir.mkdir(exist_ok=True, parents=True)
+    with span("dataset_download", "remote_state", handle):
+        remote = remote_dataset_state(client, handle)
+    with span("dataset_download", "check_fresh", handle):
+        is_fresh, reason = check_download_fresh(out_dir, zipfile_path, remote)
 
-        if not zipfile_path.is_file() or force_download:
-            logger.info(f"Downloading dataset: {dataset}")
+    if not is_fresh or force_download:
+        logger.info(f"Downloading dataset: {handle} ({'forced' if force_download else reason})")
+        with span("dataset_download", "download", handle) as s:
             client.dataset_download_files(
-                dataset=dataset,
+                dataset=handle,
                 quiet=False,
                 unzip=False,
                 path=out_dir,
-                force=force_download,
+                force=force_download or zipfile_path.is_file(),
             )
+            s.add_path(zipfile_path)
+        with span("dataset_download", "extract", handle) as s:
+            s.files = extract_zip(zipfile_path, out_dir, max_workers=extract_workers)
+        with span("dataset_download", "save_manifest", handle):
+            save_download_manifest(out_dir, handle, remote, zipfile_path)
+    else:
+        logger.info(f"Dataset ({handle}) already exists and is up to date.")
 
-            subprocess.run(["unzip", "-o", "-q", zipfile_path, "-d", out_dir])
-        else:
-            logger.info(f"Dataset ({dataset}) already exists.")
+
+def datasets_download(
+    client: KaggleApi,
+    handles: list[str],
+    destination: str | Path = "./",
+    force_download: bool = False,
+    max_workers: int = 4,
+    extract_workers: int | None = None,
+) -> None:
+    """Download kaggle datasets.
+
+    Datasets are downloaded concurrently (max_workers) and each archive is extracted
+    as soon as its own download finishes.
+
+    Args:
+        handles (list[str]): list of dataset names (e.g. ["username/dataset-name"])
+        destination (str | Path, optional): destination directory. Defaults to "./".
+        force_download (bool, optional): if True, overwrite existing dataset. Defaults to False.
+        max_workers (int, optional): number of concurrent downloads. Defaults to 4.
+        extract_workers (int | None, optional): number of extraction threads per archive. Defaults to None (auto).
+    """
+    if not handles:
+        return
+
+    with (
+        span("datasets_download", "total", ",".join(handles)),
+        ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(handles)))) as executor,
+    ):
+        futures = {
+            executor.submit(dataset_download, client, handle, destination, force_download, extract_workers): handle
+            for handle in handles
+        }
+        errors = []
+        for future, handle in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Failed to download dataset {handle}: {e}")
+                errors.append(handle)
+
+    if errors:
+        raise RuntimeError(f"Failed to download datasets: {errors}")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .manifest import file_digest
+
+if TYPE_CHECKING:
+    from kaggle import KaggleApi
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# Stored in codes/deps after a successful push of the deps kernel.
+DEPS_STATE_FILE_NAME = ".kaggle-ops-deps.json"
+# Kernel statuses for which the last pushed version is (or will be) usable by the submission.
+USABLE_KERNEL_STATUSES = ("COMPLETE", "RUNNING", "QUEUED")
+
+
+def read_requirements(requirements_path: str | Path) -> list[str]:
+    with open(requirements_path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
+
+
+def deps_digest(deps_dir: str | Path, install_mode: str = "wheels") -> dict:
+    """Digest of what the deps kernel produces: requirements, local wheels, kernel metadata and install mode.
+
+    The notebook itself is not hashed (nbformat assigns random cell ids), it is derived from the requirements.
+    """
+    deps_dir = Path(deps_dir)
+    requirements = sorted(read_requirements(deps_dir / "requirements.txt"))
+    wheels = {path.name: file_digest(path) for path in sorted(deps_dir.glob("*.whl"))}
+    metadata_path = deps_dir / "kernel-metadata.json"
+    metadata = json.loads(metadata_path.read_text()) if metadata_path.is_file() else None
+
+    payload = json.dumps([requirements, wheels, metadata, install_mode], sort_keys=True)
+    return {
+        "digest": hashlib.sha256(payload.encode()).hexdigest(),
+        "requirements": requirements,
+        "wheels": wheels,
+        "install_mode": install_mode,
+    }
+
+
+def load_deps_state(deps_dir: str | Path) -> dict | None:
+    state_path = Path(deps_dir) / DEPS_STATE_FILE_NAME
+    if not state_path.is_file():
+        return None
+    try:
+        with open(state_path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_deps_state(deps_dir: str | Path, state: dict, kernel_handle: str) -> None:
+    state_path = Path(deps_dir) / DEPS_STATE_FILE_NAME
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({**state, "kernel": kernel_handle}, f, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def check_deps_fresh(
+    deps_dir: str | Path,
+    client: KaggleApi | None,
+    kernel_handle: str,
+    install_mode: str = "wheels",
+) -> tuple[bool, str]:
+    """Check whether the deps kernel pushed last is up to date with the local requirements.
+
+    When a client is given, the last kernel version must also not have failed on Kaggle.
+
+    Returns:
+        tuple[bool, str]: (is_fresh, reason)
+    """
+    previous = load_deps_state(deps_dir)
+    if previous is None:
+        return False, "no deps state"
+    if previous.get("kernel") != kernel_handle:
+        return False, "kernel handle changed"
+
+    current = deps_digest(deps_dir, install_mode)
+    if previous.get("install_mode", "wheels") != install_mode:
+        return False, f"install mode changed to {install_mode}"
+    if previous.get("digest") != current["digest"]:
+        added = sorted(set(current["requirements"]) - set(previous.get("requirements", [])))
+        removed = sorted(set(previous.get("requirements", [])) - set(current["requirements"]))
+        return False, f"requirements changed (added: {added}, removed: {removed})"
+
+    if client is not None:
+        try:
+            status = client.kernels_status(kernel_handle).status
+        except Exception as e:
+            return False, f"failed to fetch kernel status: {e}"
+        status_name = getattr(status, "name", str(status)).upper()
+        if status_name not in USABLE_KERNEL_STATUSES:
+            return False, f"last kernel run is {status_name}"
+
+    return True, "up to date"
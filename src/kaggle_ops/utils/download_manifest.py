@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kaggle import KaggleApi
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# Stored in each download directory ({destination}/{name}) next to the zip.
+DOWNLOAD_MANIFEST_FILE_NAME = ".kaggle-ops-download.json"
+LIST_PAGE_SIZE = 200
+
+
+def remote_competition_state(client: KaggleApi, handle: str) -> dict | None:
+    """Remote state of competition data: name, size and creation date of every file (None if unavailable)."""
+    try:
+        files = []
+        page_token = None
+        while True:
+            response = client.competition_list_files(handle, page_token=page_token, page_size=LIST_PAGE_SIZE)
+            files += [[f.name, int(f.total_bytes or 0), str(f.creation_date)] for f in response.files or []]
+            page_token = response.next_page_token
+            if not page_token:
+                break
+    except Exception as e:
+        logger.warning(f"Failed to fetch remote state of competition {handle}: {e}")
+        return None
+
+    files.sort()
+    return {"files": files, "total_bytes": sum(f[1] for f in files)}
+
+
+def remote_dataset_state(client: KaggleApi, handle: str) -> dict | None:
+    """Remote state of a dataset: current version, last update and size (None if unavailable)."""
+    owner, dataset_name = handle.split("/")[:2]
+    try:
+        for ds in client.dataset_list(user=owner, search=dataset_name) or []:
+            if ds is not None and str(ds.ref).lower() == f"{owner}/{dataset_name}".lower():
+                return {
+                    "version": ds.current_version_number,
+                    "last_updated": str(ds.last_updated),
+                    "total_bytes": int(ds.total_bytes or 0),
+                }
+    except Exception as e:
+        logger.warning(f"Failed to fetch remote state of dataset {handle}: {e}")
+        return None
+
+    logger.warning(f"Dataset {handle} not found in listing")
+    return None
+
+
+def load_download_manifest(out_dir: str | Path) -> dict | None:
+    manifest_path = Path(out_dir) / DOWNLOAD_MANIFEST_FILE_NAME
+    if not manifest_path.is_file():
+        return None
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_download_manifest(out_dir: str | Path, handle: str, remote: dict | None, zip_path: str | Path) -> None:
+    """Record the remote state and the local zip / extracted tree after a successful download."""
+    with zipfile.ZipFile(zip_path) as zf:
+        extracted = {info.filename: info.file_size for info in zf.infolist() if not info.is_dir()}
+
+    manifest = {
+        "handle": handle,
+        "remote": remote,
+        "zip_size": os.path.getsize(zip_path),
+        "extracted": extracted,
+    }
+    manifest_path = Path(out_dir) / DOWNLOAD_MANIFEST_FILE_NAME
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+
+def check_download_fresh(out_dir: str | Path, zip_path: str | Path, remote: dict | None) -> tuple[bool, str]:
+    """Check that a previous download is complete and matches the remote.
+
+    When the remote state is unavailable (None), only local integrity is checked.
+
+    Returns:
+        tuple[bool, str]: (is_fresh, reason)
+    """
+    out_dir, zip_path = Path(out_dir), Path(zip_path)
+    if not zip_path.is_file():
+        return False, "zip not found"
+
+    manifest = load_download_manifest(out_dir)
+    if manifest is None:
+        return False, "no download manifest"
+
+    if remote is not None and manifest.get("remote") != remote:
+        return False, "remote changed"
+
+    if os.path.getsize(zip_path) != manifest.get("zip_size"):
+        return False, "zip size mismatch (partial download?)"
+    try:
+        with zipfile.ZipFile(zip_path) as zf:
+            members = {info.filename: info.file_size for info in zf.infolist() if not info.is_dir()}
+    except (zipfile.BadZipFile, OSError) as e:
+        return False, f"corrupt zip: {e}"
+    if members != manifest.get("extracted"):
+        return False, "zip contents changed"
+
+    for name, size in members.items():
+        path = out_dir / name
+        if not path.is_file() or path.stat().st_size != size:
+            return False, f"extracted file missing or incomplete: {name}"
+
+    return True, "up to date"
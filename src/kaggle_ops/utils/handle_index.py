@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .utils import CACHE_DIR
+
+if TYPE_CHECKING:
+    from kaggle import KaggleApi
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+HANDLE_INDEX_CACHE_DIR = CACHE_DIR
+HANDLE_INDEX_TTL = float(os.getenv("KAGGLE_OPS_HANDLE_INDEX_TTL", "600"))
+HANDLE_INDEX_KINDS = ("dataset", "model")
+PAGE_SIZE = 100
+
+
+def _iter_dataset_refs(client: KaggleApi, owner: str, page_size: int = PAGE_SIZE) -> Iterator[str]:
+    page_token = None
+    while True:
+        response = client.dataset_list_with_response(user=owner, page_size=page_size, page_token=page_token)
+        for ds in response.datasets or []:
+            yield str(ds.ref)
+        page_token = response.next_page_token
+        if not page_token:
+            return
+
+
+def _iter_model_refs(client: KaggleApi, owner: str, page_size: int = PAGE_SIZE) -> Iterator[str]:
+    # KaggleApi.model_list only prints the next page token, so page through the underlying client.
+    from kagglesdk.models.types.model_api_service import ApiListModelsRequest
+
+    page_token = None
+    while True:
+        with client.build_kaggle_client() as kaggle:
+            request = ApiListModelsRequest()
+            request.owner = owner
+            request.page_size = page_size
+            if page_token:
+                request.page_token = page_token
+            response = kaggle.models.model_api_client.list_models(request)
+        for model in response.models or []:
+            yield str(model.ref)
+        page_token = response.next_page_token
+        if not page_token:
+            return
+
+
+class HandleIndex:
+    """Index of the handles (datasets or models) owned by a user.
+
+    All pages are listed once and cached on disk for ttl seconds, so existence checks are set lookups.
+    Handles created by us are added to the index right away (Kaggle listings lag behind creation).
+    """
+
+    def __init__(
+        self,
+        client: KaggleApi,
+        kind: str,
+        owner: str,
+        ttl: float = HANDLE_INDEX_TTL,
+        cache_dir: Path = HANDLE_INDEX_CACHE_DIR,
+    ) -> None:
+        if kind not in HANDLE_INDEX_KINDS:
+            raise ValueError(f"Invalid handle index kind: {kind}. Must be one of {HANDLE_INDEX_KINDS}")
+        self.client = client
+        self.kind = kind
+        self.owner = owner
+        self.ttl = ttl
+        self.cache_path = Path(cache_dir) / f"{kind}-{owner.lower()}.json"
+        self._handles: set[str] | None = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    def _load_cache(self) -> bool:
+        if not self.cache_path.is_file():
+            return False
+        try:
+            with open(self.cache_path) as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+        if time.time() - cache.get("fetched_at", 0) > self.ttl:
+            return False
+        self._handles = set(cache["handles"])
+        self._fetched_at = cache["fetched_at"]
+        return True
+
+    def _save_cache(self) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"fetched_at": self._fetched_at, "handles": sorted(self._handles or [])}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _fetch(self) -> None:
+        iter_refs = _iter_dataset_refs if self.kind == "dataset" else _iter_model_refs
+        self._handles = {ref.lower() for ref in iter_refs(self.client, self.owner)}
+        self._fetched_at = time.time()
+        logger.info(f"Listed {len(self._handles)} {self.kind}(s) of {self.owner}")
+        self._save_cache()
+
+    def handles(self) -> set[str]:
+        """Return all handles, listing them from Kaggle if the cache is missing or expired."""
+        with self._lock:
+            expired = time.time() - self._fetched_at > self.ttl
+            if self._handles is None or expired:
+                if not self._load_cache():
+                    self._fetch()
+            return set(self._handles or [])
+
+    def __contains__(self, handle: object) -> bool:
+        return isinstance(handle, str) and handle.lower() in self.handles()
+
+    def add(self, handle: str) -> None:
+        """Record a handle we just created."""
+        self.handles()
+        with self._lock:
+            assert self._handles is not None
+            self._handles.add(handle.lower())
+            self._save_cache()
+
+    def invalidate(self) -> None:
+        """Drop the in-memory and on-disk cache."""
+        with self._lock:
+            self._handles = None
+            self._fetched_at = 0.0
+            self.cache_path.unlink(missing_ok=True)
+
+
+_handle_indexes: dict[tuple[int, str, str], HandleIndex] = {}
+_handle_indexes_lock = threading.Lock()
+
+
+def get_handle_index(client: KaggleApi, kind: str, owner: str) -> HandleIndex:
+    """Return the shared handle index for (client, kind, owner)."""
+    key = (id(client), kind, owner.lower())
+    with _handle_indexes_lock:
+        if key not in _handle_indexes:
+            _handle_indexes[key] = HandleIndex(client=client, kind=kind, owner=owner)
+        return _handle_indexes[key]
@@ -0,0 +1,102 @@
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .walk import scan_tree
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# Stored next to the artifacts. The leading dot keeps it out of uploads via the ".*" ignore pattern.
+MANIFEST_FILE_NAME = ".kaggle-ops-manifest.json"
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def iter_files(directory: str | Path, ignore_patterns: list | None = None) -> list[Path]:
+    """List files under directory (relative paths), skipping entries matched by ignore patterns at any level."""
+    return [Path(entry.rel_path) for entry in scan_tree(directory, ignore_patterns).files]
+
+
+def file_digest(path: str | Path) -> str:
+    """Compute sha256 digest of a file. hashlib releases the GIL, so this scales across threads."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def build_manifest(
+    directory: str | Path,
+    ignore_patterns: list | None = None,
+    previous: dict | None = None,
+    max_workers: int | None = None,
+    include: Callable[[str], bool] | None = None,
+) -> dict:
+    """Build a manifest of file sizes and digests for directory.
+
+    Files whose size and mtime match the previous manifest reuse the recorded digest,
+    the rest are hashed in parallel. Only files whose relative path passes include are listed.
+
+    Returns:
+        dict: {"files": {relative_path: {"size", "mtime_ns", "digest"}}, "total_bytes": int}
+    """
+    directory = Path(directory)
+    previous_files = (previous or {}).get("files", {})
+
+    entries: dict[str, dict] = {}
+    to_hash: list[str] = []
+    for file_entry in scan_tree(directory, ignore_patterns).files:
+        key = file_entry.rel_path
+        if key.startswith(MANIFEST_FILE_NAME) or (include is not None and not include(key)):
+            continue
+        entry = {"size": file_entry.size, "mtime_ns": file_entry.mtime_ns, "digest": None}
+
+        prev = previous_files.get(key)
+        if prev and prev.get("size") == entry["size"] and prev.get("mtime_ns") == entry["mtime_ns"]:
+            entry["digest"] = prev["digest"]
+        else:
+            to_hash.append(key)
+        entries[key] = entry
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for key, digest in zip(to_hash, executor.map(lambda k: file_digest(directory / k), to_hash), strict=True):
+            entries[key]["digest"] = digest
+
+    logger.info(f"Manifest built: {len(entries)} files ({len(to_hash)} hashed, {len(entries) - len(to_hash)} reused)")
+    return {"files": entries, "total_bytes": sum(e["size"] for e in entries.values())}
+
+
+def manifest_equals(a: dict | None, b: dict | None) -> bool:
+    """Compare manifests by content (path, size and digest), ignoring mtimes."""
+    if not a or not b:
+        return False
+
+    def _content(manifest: dict) -> dict:
+        return {k: (v["size"], v["digest"]) for k, v in manifest.get("files", {}).items()}
+
+    return _content(a) == _content(b)
+
+
+def load_manifest(directory: str | Path) -> dict | None:
+    """Load the manifest recorded for the last successful push, if any."""
+    manifest_path = Path(directory) / MANIFEST_FILE_NAME
+    if not manifest_path.is_file():
+        return None
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to read manifest {manifest_path}: {e}")
+        return None
+
+
+def save_manifest(directory: str | Path, manifest: dict) -> None:
+    """Record manifest next to the artifacts (atomic replace)."""
+    manifest_path = Path(directory) / MANIFEST_FILE_NAME
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
@@ -0,0 +1,128 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .utils import CACHE_DIR, format_bytes
+from .walk import scan_tree
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# One JSON line per span, appended at the end of every CLI command ("" disables it).
+TIMINGS_PATH = os.getenv("KAGGLE_OPS_TIMINGS_PATH", str(CACHE_DIR / "timings.jsonl"))
+
+
+@dataclass
+class Span:
+    """Duration, file count and bytes of one phase of an operation (e.g. model_upload / stage)."""
+
+    operation: str
+    phase: str
+    handle: str = ""
+    started_at: float = 0.0
+    duration: float = 0.0
+    files: int = 0
+    bytes: int = 0
+    status: str = "success"
+
+    def add_path(self, path: str | Path) -> None:
+        """Count a file, or every file under a directory."""
+        files, size = tree_stats(path)
+        self.files += files
+        self.bytes += size
+
+
+def tree_stats(path: str | Path) -> tuple[int, int]:
+    """(number of files, total bytes) of a file or a directory tree."""
+    path = Path(path)
+    if path.is_file():
+        return 1, path.stat().st_size
+    scan = scan_tree(path)
+    return len(scan.files), scan.total_bytes
+
+
+class SpanRecorder:
+    """Collect spans from every thread of a command."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, operation: str, phase: str, handle: str = "") -> Iterator[Span]:
+        span = Span(operation=operation, phase=phase, handle=handle, started_at=time.time())
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException:
+            span.status = "failure"
+            raise
+        finally:
+            span.duration = time.perf_counter() - start
+            with self._lock:
+                self.spans.append(span)
+
+    def summary(self) -> list[dict]:
+        """Spans aggregated by (operation, phase) in order of first appearance."""
+        rows: dict[tuple[str, str], dict] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            row = rows.setdefault(
+                (span.operation, span.phase),
+                {"operation": span.operation, "phase": span.phase, "count": 0, "duration": 0.0, "files": 0, "bytes": 0},
+            )
+            row["count"] += 1
+            row["duration"] += span.duration
+            row["files"] += span.files
+            row["bytes"] += span.bytes
+        return list(rows.values())
+
+    def print_summary(self) -> None:
+        print("\n=== Timing summary ===")
+        print(f"{'operation':<22} {'phase':<16} {'count':>5} {'duration':>10} {'files':>8} {'bytes':>10}")
+        for row in self.summary():
+            print(
+                f"{row['operation']:<22} {row['phase']:<16} {row['count']:>5} {row['duration']:>9.2f}s "
+                f"{row['files']:>8} {format_bytes(row['bytes']):>10}"
+            )
+
+    def write_jsonl(self, path: str | Path, command: str) -> None:
+        """Append the spans to a JSON-lines file, tagged with the command and a run id."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        run_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        with self._lock:
+            lines = [json.dumps({"run_id": run_id, "command": command, **asdict(span)}) for span in self.spans]
+        with open(path, "a") as f:
+            f.writelines(line + "\n" for line in lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+recorder = SpanRecorder()
+span = recorder.span
+
+
+def report_spans(command: str | None = None, path: str | Path | None = TIMINGS_PATH) -> None:
+    """Print the timing summary of the command, append its spans to path and reset the recorder."""
+    if not recorder.spans:
+        return
+    command = command or " ".join([Path(sys.argv[0]).stem, *sys.argv[1:]])
+    recorder.print_summary()
+    if path:
+        try:
+            recorder.write_jsonl(path, command)
+        except OSError as e:
+            logger.warning(f"Failed to write timings to {path}: {e}")
+    recorder.clear()
@@ -1,5 +1,14 @@
 import os
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kaggle import KaggleApi
+
+
+# Root of the local caches of kaggle_ops (handle indexes, push records, timings, compacted artifacts, ...).
+CACHE_DIR = Path(os.getenv("KAGGLE_OPS_CACHE_DIR", "~/.cache/kaggle_ops")).expanduser()
 
 
 def get_run_env() -> str:
@@ -12,12 +21,20 @@ def get_run_env() -> str:
         return "kaggle"
     elif os.getenv("BUCKET_NAME"):
         # Check if running in Vertex AI (GCSFuse mounted)
-        bucket_name = os.getenv("BUCKET_NAME")
-        if Path(f"/gcs/{bucket_name}").exists():
+        bucket_name = os.environ["BUCKET_NAME"]
+        if Path(os.getenv("GCS_MOUNT_ROOT", "/gcs"), bucket_name).exists():
             return "vertex"
     return "local"
 
 
+def get_cpu_count() -> int:
+    """Number of CPUs usable by this process (respects container / affinity limits)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
 def get_default_exp_name(use_commit_hash: bool = False) -> str:
     import git
 
@@ -39,6 +56,28 @@ def get_kaggle_authentication() -> tuple[str, str]:
     return kaggle_username, kaggle_key
 
 
+_kaggle_client: "KaggleApi | None" = None
+_kaggle_client_lock = threading.Lock()
+
+
+def get_kaggle_client() -> "KaggleApi":
+    """Return an authenticated KaggleApi, created on first use.
+
+    Importing kaggle is slow (and authenticates as a side effect), so it is deferred until a command
+    actually talks to Kaggle. The client is shared by every caller in the process; creation is
+    locked so that concurrent push threads share one client (and the handle indexes keyed by it).
+    """
+    global _kaggle_client
+    with _kaggle_client_lock:
+        if _kaggle_client is None:
+            from kaggle import KaggleApi
+
+            client = KaggleApi()
+            client.authenticate()
+            _kaggle_client = client
+        return _kaggle_client
+
+
 def get_kaggle_competition_name() -> str:
     kaggle_competition_name = os.getenv("KAGGLE_COMPETITION_NAME")
 
@@ -46,3 +85,14 @@ def get_kaggle_competition_name() -> str:
         raise ValueError("KAGGLE_COMPETITION_NAME is not set. Please set it in your environment variables.")
 
     return kaggle_competition_name
+
+
+def format_bytes(num_bytes: float) -> str:
+    """Format a byte count in human readable units."""
+    if abs(num_bytes) < 1024:
+        return f"{int(num_bytes)}B"
+    for unit in ["KB", "MB", "GB"]:
+        num_bytes /= 1024
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f}{unit}"
+    return f"{num_bytes / 1024:.1f}TB"
@@ -0,0 +1,137 @@
+import os
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from fnmatch import translate
+from pathlib import Path
+
+from .utils import format_bytes
+
+# Larger directories are summarized (files collapsed into one line) by display_tree.
+DISPLAY_TREE_MAX_ENTRIES = int(os.getenv("KAGGLE_OPS_TREE_MAX_ENTRIES", "20"))
+
+
+def compile_ignore(ignore_patterns: list | None) -> Callable[[str], bool]:
+    """Compile glob patterns into a single matcher of entry names (same semantics as fnmatch)."""
+    if not ignore_patterns:
+        return lambda name: False
+    pattern = re.compile("|".join(f"(?:{translate(os.path.normcase(p))})" for p in ignore_patterns))
+    return lambda name: pattern.match(os.path.normcase(name)) is not None
+
+
+@dataclass
+class FileEntry:
+    rel_path: str  # posix path relative to the walked directory
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class TreeScan:
+    """Files (with sizes) and directories under a root, from a single traversal."""
+
+    root: Path
+    files: list[FileEntry] = field(default_factory=list)
+    dirs: list[str] = field(default_factory=list)  # parents before their subdirectories
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry.size for entry in self.files)
+
+
+def scan_tree(directory: str | Path, ignore_patterns: list | None = None, follow_symlinks: bool = False) -> TreeScan:
+    """Walk directory once with os.scandir, skipping entries matched by ignore patterns at any level.
+
+    Files are listed in the order of os.walk (each directory's files by name, then its subdirectories by name).
+    Like os.walk, symlinks to directories are not followed unless follow_symlinks.
+    """
+    directory = Path(directory)
+    is_ignored = compile_ignore(ignore_patterns)
+    scan = TreeScan(root=directory)
+
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        subdirs = []
+        with os.scandir(directory / rel_dir if rel_dir else directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            if is_ignored(entry.name):
+                continue
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=follow_symlinks):
+                subdirs.append(rel_path)
+            elif entry.is_file():
+                stat = entry.stat()
+                scan.files.append(FileEntry(rel_path, stat.st_size, stat.st_mtime_ns))
+        scan.dirs.extend(subdirs)
+        stack.extend(reversed(subdirs))
+    return scan
+
+
+def _index_tree(scan: TreeScan) -> tuple[dict[str, list[str]], dict[str, list[FileEntry]], dict[str, list[int]]]:
+    """Subdirectories, files and recursive [file count, bytes] of every directory of a scan."""
+    subdirs: dict[str, list[str]] = {"": []}
+    for rel_dir in scan.dirs:
+        subdirs[rel_dir] = []
+        subdirs[rel_dir.rpartition("/")[0]].append(rel_dir)
+    files: dict[str, list[FileEntry]] = {rel_dir: [] for rel_dir in subdirs}
+    totals: dict[str, list[int]] = {rel_dir: [0, 0] for rel_dir in subdirs}
+    for entry in scan.files:
+        rel_dir = entry.rel_path.rpartition("/")[0]
+        files[rel_dir].append(entry)
+        # count the file in every ancestor
+        while True:
+            totals[rel_dir][0] += 1
+            totals[rel_dir][1] += entry.size
+            if not rel_dir:
+                break
+            rel_dir = rel_dir.rpartition("/")[0]
+    return subdirs, files, totals
+
+
+def display_tree(
+    directory: str | Path | None = None,
+    max_entries: int = DISPLAY_TREE_MAX_ENTRIES,
+    scan: TreeScan | None = None,
+) -> None:
+    """Print a bounded summary of a tree with file counts and sizes.
+
+    Directories are listed before files. In a directory with more than max_entries entries, the files
+    are collapsed into one line and only the first max_entries subdirectories are expanded.
+    An existing scan is printed as is (no traversal).
+    """
+    if scan is None:
+        assert directory is not None, "directory or scan is required"
+        scan = scan_tree(directory)
+    subdirs, files, totals = _index_tree(scan)
+
+    def _print(rel_dir: str, prefix: str) -> None:
+        dirs = sorted(subdirs[rel_dir])
+        lines: list[tuple[str, str | None]] = []  # (label, directory to expand)
+        if len(dirs) + len(files[rel_dir]) <= max_entries:
+            lines += [(_dir_label(d), d) for d in dirs]
+            lines += [(f"{e.rel_path.rpartition('/')[2]} ({format_bytes(e.size)})", None) for e in files[rel_dir]]
+        else:
+            lines += [(_dir_label(d), d) for d in dirs[:max_entries]]
+            if len(dirs) > max_entries:
+                rest = dirs[max_entries:]
+                rest_files, rest_size = sum(totals[d][0] for d in rest), sum(totals[d][1] for d in rest)
+                lines.append(
+                    (f"... {len(rest)} more directories ({rest_files} files, {format_bytes(rest_size)})", None)
+                )
+            if files[rel_dir]:
+                size = sum(e.size for e in files[rel_dir])
+                lines.append((f"... {len(files[rel_dir])} files ({format_bytes(size)})", None))
+
+        for i, (label, expand) in enumerate(lines):
+            last = i == len(lines) - 1
+            print(f"{prefix}{'└── ' if last else '├── '}{label}")
+            if expand is not None:
+                _print(expand, prefix + ("    " if last else "│   "))
+
+    def _dir_label(rel_dir: str) -> str:
+        return f"{rel_dir.rpartition('/')[2]}/ ({totals[rel_dir][0]} files, {format_bytes(totals[rel_dir][1])})"
+
+    print(f"{scan.root} ({totals[''][0]} files, {format_bytes(totals[''][1])})")
+    _print("", "")
@@ -1,8 +1,6 @@
 import json
 import logging
 
-import nbformat
-from nbformat.v4 import new_code_cell, new_notebook
 from pydantic import BaseModel, Field
 from tyro.extras import SubcommandApp
 
@@ -11,6 +9,12 @@ from ..settings import DEPS_CODE_DIR, SUBMISSION_CODE_DIR, KaggleSettings
 app = SubcommandApp()
 logger = logging.getLogger(__name__)
 
+# wheels: the submission pip installs the wheels downloaded by the deps kernel
+# overlay: the deps kernel installs and byte-compiles the packages into site-packages,
+#          and the submission only puts that tree on PYTHONPATH
+DEPS_INSTALL_MODES = ("wheels", "overlay")
+DEPS_OVERLAY_DIR_NAME = "site-packages"
+
 
 class MakeDepsCodeMetadataSettings(BaseModel):
     """
@@ -52,6 +56,24 @@ class MakeCodeSettings(BaseModel):
         KaggleSettings(),  # type: ignore
         description="Kaggle settings for the submission or deps code.",
     )
+    deps_install_mode: str = Field(
+        default="wheels", description="How the deps are made available: 'wheels' (pip install) or 'overlay'."
+    )
+
+
+class MakeDepsCodeSettings(BaseModel):
+    """
+    Settings for creating the deps code.
+    """
+
+    install_mode: str = Field(
+        default="wheels", description="'wheels' downloads wheels, 'overlay' also builds a byte-compiled site-packages."
+    )
+
+
+def validate_deps_install_mode(install_mode: str) -> None:
+    if install_mode not in DEPS_INSTALL_MODES:
+        raise ValueError(f"Invalid deps install mode: {install_mode}. Must be one of {DEPS_INSTALL_MODES}")
 
 
 @app.command()
@@ -119,29 +141,37 @@ def submission_code(settings: MakeCodeSettings) -> None:
     """
     Create the submission code notebook.
     """
+    import nbformat
+    from nbformat.v4 import new_code_cell, new_notebook
+
     logger.info("Creating the submission code notebook...")
     kaggle_settings = settings.kaggle_settings
+    validate_deps_install_mode(settings.deps_install_mode)
+
+    pythonpath = f"/kaggle/input/{kaggle_settings.CODES_NAME}"
+    cells = []
+    if settings.deps_install_mode == "overlay":
+        # packages are already installed and byte-compiled by the deps kernel
+        pythonpath = f"/kaggle/input/{kaggle_settings.DEPS_CODE_NAME}/{DEPS_OVERLAY_DIR_NAME}:{pythonpath}"
+    else:
+        install_deps_code = (
+            f"!pip install /kaggle/input/{kaggle_settings.DEPS_CODE_NAME}/*.whl "
+            "--force-reinstall "
+            "--root-user-action ignore "
+            "--no-deps "
+            "--no-index "
+            f"--find-links /kaggle/input/{kaggle_settings.DEPS_CODE_NAME}"
+        )
+        cells.append(new_code_cell(source=install_deps_code))
 
-    install_deps_code = (
-        f"!pip install /kaggle/input/{kaggle_settings.DEPS_CODE_NAME}/*.whl "
-        "--force-reinstall "
-        "--root-user-action ignore "
-        "--no-deps "
-        "--no-index "
-        f"--find-links /kaggle/input/{kaggle_settings.DEPS_CODE_NAME}"
-    )
     run_inference_code = (
-        f"!PYTHONPATH=/kaggle/input/{kaggle_settings.CODES_NAME} "
+        f"!PYTHONPATH={pythonpath} "
         f"KAGGLE_COMPETITION_NAME={kaggle_settings.KAGGLE_COMPETITION_NAME} "
         f"python /kaggle/input/{kaggle_settings.CODES_NAME}/src/inference.py"
     )
+    cells.append(new_code_cell(source=run_inference_code))
 
-    notebook = new_notebook(
-        cells=[
-            new_code_cell(source=install_deps_code),
-            new_code_cell(source=run_inference_code),
-        ]
-    )
+    notebook = new_notebook(cells=cells)
     # add kernel metadata
     notebook["metadata"]["kernelspec"] = {
         "display_name": "Python 3",
@@ -155,10 +185,13 @@ def submission_code(settings: MakeCodeSettings) -> None:
 
 
 @app.command()
-def deps_code() -> None:
+def deps_code(settings: MakeDepsCodeSettings) -> None:
     """
     Create the deps code notebook.
     """
+    import nbformat
+    from nbformat.v4 import new_code_cell, new_notebook
+
     logger.info("Creating the deps code notebook...")
 
     # Read requirements from codes/deps/requirements.txt
@@ -171,8 +204,23 @@ def deps_code() -> None:
     with open(requirements_path, encoding="utf-8") as f:
         requirements = [line.strip() for line in f if line.strip() and not line.strip().startswith("#")]
 
+    validate_deps_install_mode(settings.install_mode)
     if not requirements:
         notebook = new_notebook(cells=[new_code_cell(source="pass")])
+    elif settings.install_mode == "overlay":
+        # hash-based pycs stay valid after Kaggle copies the output (mtimes change, /kaggle/input is read only)
+        overlay_dir = f"/kaggle/working/{DEPS_OVERLAY_DIR_NAME}"
+        install_deps_code = (
+            "!pip download -d /tmp/wheels " + " ".join(requirements) + "\n"
+            "!pip install /tmp/wheels/*.whl "
+            f"--target {overlay_dir} "
+            "--root-user-action ignore "
+            "--no-deps "
+            "--no-index "
+            "--find-links /tmp/wheels\n"
+            f"!python -m compileall -q -j 0 --invalidation-mode unchecked-hash {overlay_dir}"
+        )
+        notebook = new_notebook(cells=[new_code_cell(source=install_deps_code)])
     else:
         # Build pip download command for all requirements
         download_cmd = "!pip download -d /kaggle/working " + " ".join(requirements)
@@ -198,7 +246,7 @@ def deps_code() -> None:
     with open(deps_code_path, "w", encoding="utf-8") as f:
         nbformat.write(notebook, f)
 
-    logger.info(f"Created deps code notebook with {len(requirements)} requirement(s)")
+    logger.info(f"Created deps code notebook with {len(requirements)} requirement(s) ({settings.install_mode})")
 
 
 if __name__ == "__main__":
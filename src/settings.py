@@ -65,11 +65,16 @@ class KaggleDirectorySettings(BaseSettings):
 
 class VertexDirectorySettings(BaseSettings):
     BUCKET_NAME: str = Field(..., description="GCS bucket name for Vertex AI training.")
-    ROOT_DIR: str = Field("/gcs/{bucket}/working", description="Root directory in Vertex AI environment.")
-    INPUT_DIR: str = Field("/gcs/{bucket}/input", description="Input directory in Vertex AI environment.")
-    ARTIFACT_DIR: str = Field("/gcs/{bucket}/output", description="Artifact directory in Vertex AI environment.")
+    GCS_MOUNT_ROOT: str = Field("/gcs", description="Mount point of the gcsfuse buckets.")
+    ROOT_DIR: str = Field("{gcs_root}/{bucket}/working", description="Root directory in Vertex AI environment.")
+    INPUT_DIR: str = Field("{gcs_root}/{bucket}/input", description="Input directory in Vertex AI environment.")
+    ARTIFACT_DIR: str = Field("{gcs_root}/{bucket}/output", description="Artifact directory in Vertex AI environment.")
     OUTPUT_DIR_TEMPLATE: str = Field(
-        "/gcs/{bucket}/output/{exp_name}/1", description="Output directory template in Vertex AI environment."
+        "{gcs_root}/{bucket}/output/{exp_name}/1", description="Output directory template in Vertex AI environment."
+    )
+    WRITE_BACK_STAGING_DIR: str = Field(
+        "/tmp/kaggle_ops/output/{exp_name}/1",
+        description="Local output directory flushed to the bucket in write-back mode.",
     )
 
 
@@ -91,6 +96,12 @@ class DirectorySettings(BaseSettings):
     OUTPUT_DIR: Path = Field(default="", description="Output directory for artifacts.")  # type: ignore
     ARTIFACT_DIR: Path = Field(default="", description="Directory for artifacts.")  # type: ignore
     ARTIFACT_EXP_DIR: Path = Field(default="", description="Directory for experiment artifacts.")  # type: ignore
+    WRITE_BACK_DIR: Path | None = Field(
+        default=None, description="Directory OUTPUT_DIR is flushed to in write-back mode (see src/write_back.py)."
+    )
+    write_back: bool = Field(
+        default=False, description="On vertex, write OUTPUT_DIR to local disk and flush it to the bucket mount."
+    )
 
     @model_validator(mode="after")
     def set_directories(self) -> "DirectorySettings":
@@ -118,10 +129,16 @@ class DirectorySettings(BaseSettings):
         elif self.run_env == "vertex":
             dir_setting_vertex: VertexDirectorySettings = VertexDirectorySettings()  # type: ignore
             bucket = dir_setting_vertex.BUCKET_NAME
-            self.ROOT_DIR = Path(dir_setting_vertex.ROOT_DIR.format(bucket=bucket))
-            self.INPUT_DIR = Path(dir_setting_vertex.INPUT_DIR.format(bucket=bucket))
-            self.OUTPUT_DIR = Path(dir_setting_vertex.OUTPUT_DIR_TEMPLATE.format(bucket=bucket, exp_name=self.exp_name))
-            self.ARTIFACT_DIR = Path(dir_setting_vertex.ARTIFACT_DIR.format(bucket=bucket))
+            gcs_root = dir_setting_vertex.GCS_MOUNT_ROOT
+            self.ROOT_DIR = Path(dir_setting_vertex.ROOT_DIR.format(gcs_root=gcs_root, bucket=bucket))
+            self.INPUT_DIR = Path(dir_setting_vertex.INPUT_DIR.format(gcs_root=gcs_root, bucket=bucket))
+            self.OUTPUT_DIR = Path(
+                dir_setting_vertex.OUTPUT_DIR_TEMPLATE.format(gcs_root=gcs_root, bucket=bucket, exp_name=self.exp_name)
+            )
+            self.ARTIFACT_DIR = Path(dir_setting_vertex.ARTIFACT_DIR.format(gcs_root=gcs_root, bucket=bucket))
+            if self.write_back:
+                self.WRITE_BACK_DIR = self.OUTPUT_DIR
+                self.OUTPUT_DIR = Path(dir_setting_vertex.WRITE_BACK_STAGING_DIR.format(exp_name=self.exp_name))
             self.COMP_DATASET_DIR = self.INPUT_DIR / self.kaggle_settings.KAGGLE_COMPETITION_NAME
             self.ARTIFACT_EXP_DIR = self.ARTIFACT_DIR / self.exp_name / "1"
 
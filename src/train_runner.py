@@ -0,0 +1,225 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from src.kaggle_ops.utils.utils import get_cpu_count, get_default_exp_name
+from src.settings import DirectorySettings
+from src.write_back import start_write_back
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+FOLD_DONE_FILE_NAME = "_SUCCESS"
+THREAD_ENV_VARS = ["OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS"]
+
+
+class TrainSettings(BaseModel):
+    """
+    Settings for the cross-validation training harness.
+    """
+
+    exp_name: str | None = Field(default=None, description="Experiment name (default: current git branch).")
+    run_env: str | None = Field(default=None, description="Environment type: 'local', 'kaggle' or 'vertex'.")
+    n_folds: int = Field(default=5, description="Number of CV folds.")
+    folds: list[int] | None = Field(default=None, description="Folds to train (default: all).")
+    num_workers: int | None = Field(default=None, description="Number of folds trained concurrently (default: auto).")
+    threads_per_fold: int | None = Field(
+        default=None, description="CPU threads per fold (default: CPU count / num_workers)."
+    )
+    memory_limit_gb: float | None = Field(default=None, description="Address space limit of each fold process.")
+    force: bool = Field(default=False, description="Whether to retrain folds that already finished.")
+
+
+@dataclass
+class FoldContext:
+    """What a fold needs to train: write models into output_dir, use at most num_threads threads."""
+
+    fold: int
+    n_folds: int
+    output_dir: Path
+    num_threads: int
+    directory_settings: DirectorySettings
+
+
+def fold_dir(output_dir: Path, fold: int) -> Path:
+    return output_dir / f"fold{fold}"
+
+
+def is_fold_done(output_dir: Path, fold: int) -> bool:
+    return (fold_dir(output_dir, fold) / FOLD_DONE_FILE_NAME).is_file()
+
+
+def _limit_resources(num_threads: int, memory_limit_gb: float | None) -> None:
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(num_threads)
+    try:
+        from threadpoolctl import threadpool_limits
+
+        threadpool_limits(num_threads)
+    except ImportError:
+        pass
+
+    if memory_limit_gb is not None:
+        import resource
+
+        limit = int(memory_limit_gb * 1024**3)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def publish_fold(scratch_dir: Path, dst_dir: Path, meta: dict) -> None:
+    """Copy a finished fold into dst_dir file by file (tmp + rename) and mark it done last.
+
+    File renames are atomic locally and on gcsfuse, directory renames are not,
+    so a fold is only considered finished once its marker exists.
+    """
+    if dst_dir.exists():
+        shutil.rmtree(dst_dir)
+    for src in sorted(p for p in scratch_dir.rglob("*") if p.is_file()):
+        dst = dst_dir / src.relative_to(scratch_dir)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(dst.name + ".tmp")
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    tmp = dst_dir / (FOLD_DONE_FILE_NAME + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp, dst_dir / FOLD_DONE_FILE_NAME)
+
+
+def _run_fold(
+    train_fn: Any,
+    fold: int,
+    settings: TrainSettings,
+    directory_settings: DirectorySettings,
+    num_threads: int,
+) -> dict:
+    """Train one fold in a worker process (never raises)."""
+    _limit_resources(num_threads, settings.memory_limit_gb)
+    start = time.perf_counter()
+    try:
+        with tempfile.TemporaryDirectory(prefix=f"fold{fold}-") as scratch:
+            context = FoldContext(
+                fold=fold,
+                n_folds=settings.n_folds,
+                output_dir=Path(scratch),
+                num_threads=num_threads,
+                directory_settings=directory_settings,
+            )
+            oof = train_fn(context)
+            if oof is not None:
+                oof.to_parquet(Path(scratch) / "oof.parquet", index=False)
+
+            duration = time.perf_counter() - start
+            publish_fold(
+                Path(scratch),
+                fold_dir(directory_settings.OUTPUT_DIR, fold),
+                {"fold": fold, "duration": duration, "num_threads": num_threads},
+            )
+        return {"fold": fold, "status": "success", "duration": duration, "error": ""}
+    except Exception as e:
+        logger.error(f"Fold {fold} failed:\n{traceback.format_exc()}")
+        return {"fold": fold, "status": "failure", "duration": time.perf_counter() - start, "error": repr(e)}
+
+
+def merge_oof(output_dir: Path, n_folds: int, fallback_dir: Path | None = None) -> Path | None:
+    """Concatenate the OOF predictions of every fold into OUTPUT_DIR/oof.parquet (None if no fold has OOF).
+
+    Folds missing in output_dir are read from fallback_dir (the write-back directory of an earlier run).
+    """
+    import pandas as pd
+
+    paths = []
+    for fold in range(n_folds):
+        for base_dir in [output_dir] if fallback_dir is None else [output_dir, fallback_dir]:
+            path = fold_dir(base_dir, fold) / "oof.parquet"
+            if path.is_file():
+                paths.append(path)
+                break
+    if not paths:
+        return None
+
+    oof_path = output_dir / "oof.parquet"
+    tmp = oof_path.with_name(oof_path.name + ".tmp")
+    pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True).to_parquet(tmp, index=False)
+    os.replace(tmp, oof_path)
+    return oof_path
+
+
+def print_train_summary(results: list[dict]) -> None:
+    print("\n=== Fold summary ===")
+    for r in sorted(results, key=lambda r: r["fold"]):
+        print(f"fold{r['fold']:<6} {r['status']:<8} {r['duration']:>9.1f}s {r['error']}")
+
+
+def train_folds(train_fn: Any, settings: TrainSettings) -> list[dict]:
+    """Train CV folds in a process pool, skipping folds that already finished.
+
+    train_fn(context: FoldContext) must be picklable (a module-level function). It writes its
+    models into context.output_dir and returns the fold's OOF DataFrame (or None).
+
+    Example (src/train.py):
+    >>> def train_fold(context: FoldContext) -> pd.DataFrame:
+    ...     model, oof = fit(context.fold, n_jobs=context.num_threads)
+    ...     model.save(context.output_dir / "model.txt")
+    ...     return oof
+    >>> if __name__ == "__main__":
+    ...     train_folds(train_fold, tyro.cli(TrainSettings))
+    """
+    exp_name = settings.exp_name
+    if exp_name is None:
+        exp_name = get_default_exp_name()
+    directory_settings = DirectorySettings(exp_name=exp_name, run_env=settings.run_env)
+    output_dir = Path(directory_settings.OUTPUT_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    write_back_dir = directory_settings.WRITE_BACK_DIR
+    write_back = start_write_back(directory_settings)
+
+    folds = settings.folds if settings.folds is not None else list(range(settings.n_folds))
+    skipped = [
+        fold
+        for fold in folds
+        if not settings.force
+        and (is_fold_done(output_dir, fold) or (write_back_dir is not None and is_fold_done(write_back_dir, fold)))
+    ]
+    if skipped:
+        logger.info(f"Skipping finished folds: {skipped}")
+    todo = [fold for fold in folds if fold not in skipped]
+
+    results = [{"fold": fold, "status": "skipped", "duration": 0.0, "error": ""} for fold in skipped]
+    if todo:
+        cpu_count = get_cpu_count()
+        num_workers = settings.num_workers or min(len(todo), cpu_count)
+        num_threads = settings.threads_per_fold or max(1, cpu_count // num_workers)
+        logger.info(f"Training folds {todo} with {num_workers} workers x {num_threads} threads")
+
+        with ProcessPoolExecutor(num_workers) as executor:
+            futures = [
+                executor.submit(_run_fold, train_fn, fold, settings, directory_settings, num_threads) for fold in todo
+            ]
+            for future in as_completed(futures):
+                results.append(future.result())
+
+    print_train_summary(results)
+    failed = [r["fold"] for r in results if r["status"] == "failure"]
+    if failed:
+        if write_back is not None:
+            write_back.close()
+        raise RuntimeError(f"Failed to train folds: {failed}")
+
+    merge_oof(output_dir, settings.n_folds, write_back_dir)
+    if write_back is not None:
+        write_back.close()
+    return results
@@ -0,0 +1,168 @@
+import atexit
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any
+
+from src.settings import DirectorySettings
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+# flushed after every other file of the same pass (fold markers of src/train_runner.py)
+MARKER_PATTERNS = ["_SUCCESS"]
+# in-progress files of atomic writes (tmp + rename)
+TEMP_PATTERNS = ["*.tmp", "*.partial"]
+
+
+class WriteBack:
+    """Flush the files written under local_dir to remote_dir (e.g. the gcsfuse mount) in the background.
+
+    A file is flushed once it has not been modified for settle_seconds, and again whenever it changes.
+    Each pass copies data files first and markers last, so a marker never reaches remote_dir before
+    the files written before it: when a data file fails to copy, the markers wait for a later pass.
+    close() (registered with atexit by start()) stops the background thread and flushes everything
+    left, including files that have not settled yet.
+
+    Files are copied directly: gcsfuse uploads a file when it is closed, so remote readers only
+    see complete objects, and a tmp + rename would upload everything twice.
+
+    Example:
+    >>> with WriteBack("/tmp/kaggle_ops/output/exp001/1", "/gcs/bucket/output/exp001/1").start():
+    ...     train()
+    """
+
+    def __init__(
+        self,
+        local_dir: str | Path,
+        remote_dir: str | Path,
+        max_workers: int = 8,
+        interval: float = 10.0,
+        settle_seconds: float = 5.0,
+    ) -> None:
+        self.local_dir = Path(local_dir)
+        self.remote_dir = Path(remote_dir)
+        self.max_workers = max_workers
+        self.interval = interval
+        self.settle_seconds = settle_seconds
+        self.flushed_files = 0
+        self.flushed_bytes = 0
+        self._flushed: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def pending(self, final: bool = False) -> list[tuple[str, tuple[int, int]]]:
+        """(relative path, (size, mtime_ns)) of the files that changed since they were last flushed."""
+        now = time.time()
+        pending = []
+        for root, _, filenames in os.walk(self.local_dir):
+            for filename in filenames:
+                if any(fnmatch(filename, pattern) for pattern in TEMP_PATTERNS):
+                    continue
+                path = Path(root, filename)
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                rel = path.relative_to(self.local_dir).as_posix()
+                state = (stat.st_size, stat.st_mtime_ns)
+                if self._flushed.get(rel) == state:
+                    continue
+                if not final and now - stat.st_mtime < self.settle_seconds:
+                    continue
+                pending.append((rel, state))
+        return sorted(pending)
+
+    def _copy(self, rel: str, state: tuple[int, int]) -> str:
+        dst = self.remote_dir / rel
+        try:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self.local_dir / rel, dst)
+        except Exception as e:
+            return f"{rel}: {e}"
+        # a file modified during the copy has another state and is flushed again by the next pass
+        self._flushed[rel] = state
+        self.flushed_files += 1
+        self.flushed_bytes += state[0]
+        return ""
+
+    def flush(self, final: bool = False) -> list[str]:
+        """Copy the pending files to remote_dir and wait for them (markers last, only if every data file was copied).
+
+        Returns:
+            list[str]: relative paths of the flushed files
+        """
+        with self._lock:
+            pending = self.pending(final)
+            data = [(rel, state) for rel, state in pending if not _is_marker(rel)]
+            markers = [(rel, state) for rel, state in pending if _is_marker(rel)]
+
+            errors = []
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for batch in (data, markers):
+                    # barrier: the next batch starts once every copy of this one finished
+                    errors += [error for error in executor.map(lambda item: self._copy(*item), batch) if error]
+                    if errors:
+                        # a marker must not vouch for files that did not reach remote_dir
+                        errors += [f"{rel}: skipped (data files failed)" for rel, _ in markers]
+                        break
+        if errors:
+            raise RuntimeError(f"Failed to flush {len(errors)} files to {self.remote_dir}:\n" + "\n".join(errors))
+        return [rel for rel, _ in pending]
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"Write-back flush failed (retried by the next pass): {e}")
+
+    def start(self) -> "WriteBack":
+        self.local_dir.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="write-back", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        logger.info(f"Writing back {self.local_dir} to {self.remote_dir} every {self.interval}s")
+        return self
+
+    def close(self) -> None:
+        """Stop the background flushes and flush every remaining file (blocks until they are copied)."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+        start = time.perf_counter()
+        flushed = self.flush(final=True)
+        logger.info(
+            f"Final write-back of {len(flushed)} files in {time.perf_counter() - start:.1f}s "
+            f"({self.flushed_files} files, {self.flushed_bytes} bytes in total) to {self.remote_dir}"
+        )
+
+    def __enter__(self) -> "WriteBack":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def _is_marker(rel: str) -> bool:
+    return any(fnmatch(rel.rsplit("/", 1)[-1], pattern) for pattern in MARKER_PATTERNS)
+
+
+def start_write_back(settings: DirectorySettings, **kwargs: Any) -> WriteBack | None:
+    """Start flushing OUTPUT_DIR to WRITE_BACK_DIR when the settings are in write-back mode (WRITE_BACK=true)."""
+    if settings.WRITE_BACK_DIR is None:
+        return None
+    return WriteBack(settings.OUTPUT_DIR, settings.WRITE_BACK_DIR, **kwargs).start()
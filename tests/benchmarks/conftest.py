@@ -0,0 +1,218 @@
+"""Fake KaggleApi and synthetic artifact trees for the kaggle_ops benchmarks.
+
+Tree sizes are selected with KAGGLE_OPS_BENCH_SCALE (comma-separated, default "small", see TREE_SCALES)
+and the latency of every fake API call with KAGGLE_OPS_BENCH_LATENCY (seconds, default 0).
+"""
+
+import os
+import shutil
+import time
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.kaggle_ops.utils import customhub
+from src.kaggle_ops.utils.handle_index import HandleIndex
+from src.kaggle_ops.utils.timing import recorder
+
+MB = 1024**2
+GB = 1024**3
+
+# (number of files, total bytes)
+TREE_SCALES = {
+    "small": [(10, 1 * MB), (1_000, 10 * MB)],
+    "medium": [(10_000, 100 * MB), (10, 1 * GB)],
+    "large": [(100_000, 1 * GB), (10, 4 * GB)],
+}
+FILES_PER_DIR = 1_000
+BENCH_LATENCY = float(os.getenv("KAGGLE_OPS_BENCH_LATENCY", "0"))
+OWNER = "bench-user"
+
+
+def tree_params() -> list[tuple[int, int]]:
+    scales = os.getenv("KAGGLE_OPS_BENCH_SCALE", "small").split(",")
+    return [params for scale in scales for params in TREE_SCALES[scale.strip()]]
+
+
+def tree_id(params: tuple[int, int]) -> str:
+    n_files, total_bytes = params
+    return f"{n_files}files-{total_bytes // MB}MB"
+
+
+def make_tree(root: Path, n_files: int, total_bytes: int) -> Path:
+    """Experiment output-like tree: fold directories of .npy files (incompressible) and a few .csv files."""
+    block = os.urandom(MB)
+    file_size = max(1, total_bytes // n_files)
+    for i in range(n_files):
+        suffix = ".csv" if i % 10 == 0 else ".npy"
+        path = root / f"fold{i // FILES_PER_DIR}" / f"{i:06d}{suffix}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            remaining = file_size
+            while remaining > 0:
+                f.write(block[: min(remaining, MB)])
+                remaining -= MB
+    return root
+
+
+class FakeKaggleApi:
+    """In-process stand-in for KaggleApi: every call sleeps latency seconds, uploads also bytes / bandwidth.
+
+    Listings hold n_existing datasets and models of OWNER, served in pages like the real API.
+    Downloads copy the zip registered for the handle in self.archives.
+    """
+
+    def __init__(self, latency: float = BENCH_LATENCY, bandwidth: float | None = None, n_existing: int = 0) -> None:
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.datasets = {f"{OWNER}/dataset-{i}": 1 for i in range(n_existing)}
+        self.models = {f"{OWNER}/model-{i}" for i in range(n_existing)}
+        self.model_instances: set[str] = set()
+        self.archives: dict[str, Path] = {}
+        self.calls = 0
+
+    def _wait(self, folder: str | Path | None = None) -> None:
+        self.calls += 1
+        delay = self.latency
+        if folder is not None and self.bandwidth:
+            delay += sum(p.stat().st_size for p in Path(folder).rglob("*") if p.is_file()) / self.bandwidth
+        if delay:
+            time.sleep(delay)
+
+    @staticmethod
+    def _page(items: list, page_size: int, page_token: str | None) -> tuple[list, str]:
+        start = int(page_token or 0)
+        return items[start : start + page_size], str(start + page_size) if start + page_size < len(items) else ""
+
+    # listings
+    def dataset_list_with_response(self, user: str, page_size: int, page_token: str | None) -> Any:
+        self._wait()
+        refs, next_token = self._page(sorted(self.datasets), page_size, page_token)
+        return SimpleNamespace(datasets=[SimpleNamespace(ref=ref) for ref in refs], next_page_token=next_token)
+
+    def build_kaggle_client(self) -> Any:
+        api = self
+
+        class _Client:
+            def __enter__(self) -> Any:
+                return SimpleNamespace(models=SimpleNamespace(model_api_client=self))
+
+            def __exit__(self, *args: object) -> None:
+                pass
+
+            def list_models(self, request: Any) -> Any:
+                api._wait()
+                refs, next_token = api._page(sorted(api.models), request.page_size, request.page_token or None)
+                return SimpleNamespace(models=[SimpleNamespace(ref=ref) for ref in refs], next_page_token=next_token)
+
+        return _Client()
+
+    def dataset_list(self, user: str, search: str) -> list[Any]:
+        self._wait()
+        handle = f"{user}/{search}"
+        if handle not in self.datasets:
+            return []
+        return [
+            SimpleNamespace(ref=handle, current_version_number=self.datasets[handle], last_updated="", total_bytes=0)
+        ]
+
+    def competition_list_files(self, competition: str, page_token: str | None = None, page_size: int = 200) -> Any:
+        self._wait()
+        size = self.archives[competition].stat().st_size
+        return SimpleNamespace(
+            files=[SimpleNamespace(name=f"{competition}.zip", total_bytes=size, creation_date="")], next_page_token=""
+        )
+
+    def model_instance_get(self, model_instance: str) -> Any:
+        self._wait()
+        if model_instance not in self.model_instances:
+            raise RuntimeError("404 Client Error: Not Found")
+        return SimpleNamespace(ref=model_instance)
+
+    # uploads
+    def model_create_new(self, folder: str) -> Any:
+        self._wait()
+        return SimpleNamespace(error="")
+
+    def model_instance_create(self, folder: str, quiet: bool = False, dir_mode: str = "zip") -> Any:
+        self._wait(folder)
+        return SimpleNamespace(error="")
+
+    def model_instance_version_create(self, model_instance: str, folder: str, **kwargs: Any) -> Any:
+        self._wait(folder)
+        return SimpleNamespace(error="")
+
+    def dataset_create_new(self, folder: str | Path, **kwargs: Any) -> Any:
+        self._wait(folder)
+        return SimpleNamespace(status="ok", error="")
+
+    def dataset_create_version(self, folder: str | Path, **kwargs: Any) -> Any:
+        self._wait(folder)
+        return SimpleNamespace(status="ok", error="")
+
+    # downloads
+    def _download(self, handle: str, path: str | Path) -> None:
+        self._wait()
+        archive = self.archives[handle]
+        shutil.copyfile(archive, Path(path) / f"{handle.split('/')[-1]}.zip")
+
+    def dataset_download_files(self, dataset: str, path: str | Path, **kwargs: Any) -> None:
+        self._download(dataset, path)
+
+    def competition_download_files(self, competition: str, path: str | Path, **kwargs: Any) -> None:
+        self._download(competition, path)
+
+
+@pytest.fixture(scope="session")
+def tree_factory(tmp_path_factory: pytest.TempPathFactory) -> Any:
+    """Build synthetic trees once per session."""
+    cache: dict[tuple[int, int], Path] = {}
+
+    def _get(n_files: int, total_bytes: int) -> Path:
+        if (n_files, total_bytes) not in cache:
+            root = tmp_path_factory.mktemp(f"tree-{n_files}-{total_bytes}")
+            cache[(n_files, total_bytes)] = make_tree(root, n_files, total_bytes)
+        return cache[(n_files, total_bytes)]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def archive_factory(tmp_path_factory: pytest.TempPathFactory, tree_factory: Any) -> Any:
+    """Zip of a synthetic tree, as served by the fake download endpoints."""
+    cache: dict[tuple[int, int], Path] = {}
+
+    def _get(n_files: int, total_bytes: int) -> Path:
+        if (n_files, total_bytes) not in cache:
+            tree = tree_factory(n_files, total_bytes)
+            archive = tmp_path_factory.mktemp("archives") / f"{n_files}-{total_bytes}.zip"
+            with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+                for path in sorted(tree.rglob("*")):
+                    if path.is_file():
+                        zf.write(path, path.relative_to(tree).as_posix())
+            cache[(n_files, total_bytes)] = archive
+        return cache[(n_files, total_bytes)]
+
+    return _get
+
+
+@pytest.fixture
+def fake_kaggle(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeKaggleApi]:
+    """Fake client with isolated handle indexes, push records and timings."""
+    client = FakeKaggleApi(n_existing=1_000)
+    indexes: dict[tuple[str, str], HandleIndex] = {}
+
+    def _get_handle_index(client: Any, kind: str, owner: str) -> HandleIndex:
+        if (kind, owner) not in indexes:
+            indexes[(kind, owner)] = HandleIndex(client=client, kind=kind, owner=owner, cache_dir=tmp_path / "index")
+        return indexes[(kind, owner)]
+
+    monkeypatch.setattr(customhub, "get_handle_index", _get_handle_index)
+    monkeypatch.setattr(customhub, "get_kaggle_username", lambda: OWNER)
+    monkeypatch.setattr(customhub, "DATASET_PUSH_RECORD_DIR", tmp_path / "records")
+    yield client
+    recorder.clear()
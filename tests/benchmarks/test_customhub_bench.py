@@ -0,0 +1,134 @@
+"""Benchmarks of the customhub hot paths against FakeKaggleApi.
+
+Save a baseline and compare later runs against it (`make bench-baseline`, then `make bench`):
+>>> pytest tests/benchmarks --benchmark-only --benchmark-storage=.benchmarks/baseline --benchmark-save=baseline
+>>> pytest tests/benchmarks --benchmark-only --benchmark-storage=.benchmarks/baseline --benchmark-compare
+"""
+
+import contextlib
+import io
+import itertools
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.kaggle_ops.utils import customhub
+from tests.benchmarks.conftest import OWNER, FakeKaggleApi, tree_id, tree_params
+
+pytest.importorskip("pytest_benchmark")
+
+TREES = pytest.mark.parametrize("tree_params", tree_params(), ids=tree_id)
+_counter = itertools.count()
+
+
+def _fresh_dir(root: Path) -> Path:
+    path = root / f"run{next(_counter)}"
+    if path.exists():
+        shutil.rmtree(path)
+    return path
+
+
+@TREES
+@pytest.mark.parametrize("mode", ["copy", "hardlink"])
+def test_copytree(benchmark: Any, tree_factory: Any, tree_params: tuple[int, int], mode: str, tmp_path: Path) -> None:
+    tree = tree_factory(*tree_params)
+
+    def _setup() -> tuple[tuple, dict]:
+        return (str(tree), str(_fresh_dir(tmp_path))), {"ignore_patterns": customhub.IGNORE_PATTERNS, "mode": mode}
+
+    benchmark.pedantic(customhub.copytree, setup=_setup, rounds=3)
+
+
+@TREES
+def test_display_tree(benchmark: Any, tree_factory: Any, tree_params: tuple[int, int]) -> None:
+    tree = tree_factory(*tree_params)
+
+    def _display() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            customhub.display_tree(tree)
+
+    benchmark(_display)
+
+
+@TREES
+def test_model_upload(
+    benchmark: Any, fake_kaggle: FakeKaggleApi, tree_factory: Any, tree_params: tuple[int, int]
+) -> None:
+    tree = tree_factory(*tree_params)
+    handles = (f"{OWNER}/bench-artifacts/other/exp{i:04d}" for i in itertools.count())
+
+    def _upload() -> None:
+        result = customhub.model_upload(fake_kaggle, next(handles), str(tree), incremental=False)  # type: ignore[arg-type]
+        assert result.uploaded
+
+    benchmark.pedantic(_upload, rounds=3)
+
+
+@TREES
+def test_model_upload_unchanged(
+    benchmark: Any, fake_kaggle: FakeKaggleApi, tree_factory: Any, tree_params: tuple[int, int]
+) -> None:
+    tree = tree_factory(*tree_params)
+    handle = f"{OWNER}/bench-artifacts/other/unchanged"
+    customhub.model_upload(fake_kaggle, handle, str(tree))  # type: ignore[arg-type]
+
+    result = benchmark(customhub.model_upload, fake_kaggle, handle, str(tree))
+    assert not result.uploaded
+
+
+@TREES
+def test_dataset_upload(
+    benchmark: Any, fake_kaggle: FakeKaggleApi, tree_factory: Any, tree_params: tuple[int, int]
+) -> None:
+    tree = tree_factory(*tree_params)
+    handles = (f"{OWNER}/bench-dataset-{i}" for i in itertools.count())
+
+    def _upload() -> None:
+        assert customhub.dataset_upload(fake_kaggle, next(handles), str(tree), incremental=False)  # type: ignore[arg-type]
+
+    benchmark.pedantic(_upload, rounds=3)
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["cold", "warm"])
+@pytest.mark.parametrize("kind", ["dataset", "model"])
+def test_check_if_exist(benchmark: Any, fake_kaggle: FakeKaggleApi, kind: str, cached: bool) -> None:
+    check = customhub.check_if_exist_dataset if kind == "dataset" else customhub.check_if_exist_model
+    handle = f"{OWNER}/{kind}-999"
+    index = customhub.get_handle_index(fake_kaggle, kind, OWNER)  # type: ignore[arg-type]
+
+    def _check() -> None:
+        if not cached:
+            index.invalidate()
+        assert check(fake_kaggle, handle)  # type: ignore[arg-type]
+
+    benchmark(_check)
+
+
+def test_check_if_exist_model_instance(benchmark: Any, fake_kaggle: FakeKaggleApi) -> None:
+    fake_kaggle.model_instances.add(f"{OWNER}/bench-artifacts/other/exp001")
+    handles = [f"{OWNER}/bench-artifacts/other/exp001", f"{OWNER}/bench-artifacts/other/missing"]
+
+    result = benchmark(lambda: [customhub.check_if_exist_model_instance(fake_kaggle, h) for h in handles])  # type: ignore[arg-type]
+    assert result == [True, False]
+
+
+@TREES
+@pytest.mark.parametrize("n_datasets", [1, 4])
+def test_datasets_download(
+    benchmark: Any,
+    fake_kaggle: FakeKaggleApi,
+    archive_factory: Any,
+    tree_params: tuple[int, int],
+    n_datasets: int,
+    tmp_path: Path,
+) -> None:
+    handles = [f"{OWNER}/dataset-{i}" for i in range(n_datasets)]
+    for handle in handles:
+        fake_kaggle.archives[handle] = archive_factory(*tree_params)
+
+    def _setup() -> tuple[tuple, dict]:
+        return (fake_kaggle, handles, _fresh_dir(tmp_path)), {"max_workers": 4}
+
+    benchmark.pedantic(customhub.datasets_download, setup=_setup, rounds=3)
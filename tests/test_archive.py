@@ -0,0 +1,73 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from src.kaggle_ops.utils.archive import extract_zip, write_zip_archive
+from src.kaggle_ops.utils.customhub import prepare_upload_folder
+
+
+def test_write_zip_archive_stores_incompressible_and_skips_ignored(tmp_path: Path) -> None:
+    src = tmp_path / "fold0"
+    (src / "sub").mkdir(parents=True)
+    (src / "oof.csv").write_text("id,pred\n" * 1000)
+    (src / "sub" / "model.pt").write_bytes(b"\x00\x01" * 1000)
+    (src / "__pycache__").mkdir()
+    (src / "__pycache__" / "x.pyc").write_bytes(b"ignored")
+
+    archive_path = tmp_path / "fold0.zip"
+    write_zip_archive(src, archive_path, ignore_patterns=["__pycache__"], compresslevel=9)
+
+    with zipfile.ZipFile(archive_path) as zf:
+        infos = {info.filename: info for info in zf.infolist()}
+        assert set(infos) == {"oof.csv", "sub/model.pt"}
+        assert infos["oof.csv"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["sub/model.pt"].compress_type == zipfile.ZIP_STORED
+        assert zf.read("sub/model.pt") == b"\x00\x01" * 1000
+
+
+def test_extract_zip_roundtrip(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    for i in range(10):
+        (src / f"dir{i % 3}").mkdir(parents=True, exist_ok=True)
+        (src / f"dir{i % 3}" / f"file{i}.csv").write_text(f"{i}\n" * (i + 1) * 100)
+
+    archive_path = tmp_path / "data.zip"
+    write_zip_archive(src, archive_path)
+
+    out_dir = tmp_path / "out"
+    assert extract_zip(archive_path, out_dir, max_workers=4) == 10
+    for path in src.rglob("*.csv"):
+        assert (out_dir / path.relative_to(src)).read_text() == path.read_text()
+
+
+def test_extract_zip_without_directory_entries(tmp_path: Path) -> None:
+    archive_path = tmp_path / "data.zip"
+    with zipfile.ZipFile(archive_path, "w") as zf:
+        for i in range(40):
+            zf.writestr(f"a{i % 4}/b{i % 5}/file{i}.txt", f"{i}\n")
+        assert not any(info.is_dir() for info in zf.infolist())
+
+    out_dir = tmp_path / "out"
+    assert extract_zip(archive_path, out_dir, max_workers=8) == 40
+    for i in range(40):
+        assert (out_dir / f"a{i % 4}" / f"b{i % 5}" / f"file{i}.txt").read_text() == f"{i}\n"
+
+
+def test_prepare_upload_folder_stages_files_and_archives_dirs(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    (src / "fold0").mkdir(parents=True)
+    (src / "fold0" / "model.pt").write_bytes(b"\x00" * 100)
+    for i in range(4):
+        (src / f"oof{i}.csv").write_text("id,pred\n" * 100)
+
+    staged = prepare_upload_folder(str(src), str(tmp_path / "dst"), stage_mode="copy", compress_workers=4)
+
+    assert [entry.rel_path for entry in staged.files] == ["fold0.zip", *(f"oof{i}.csv" for i in range(4))]
+    assert (tmp_path / "dst" / "oof3.csv").read_text() == "id,pred\n" * 100
+    with zipfile.ZipFile(tmp_path / "dst" / "fold0.zip") as zf:
+        assert zf.namelist() == ["model.pt"]
+
+    (src / "fold0.zip").write_bytes(b"")
+    with pytest.raises(FileExistsError):
+        prepare_upload_folder(str(src), str(tmp_path / "dst2"))
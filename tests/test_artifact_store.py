@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+from src.artifact_store import ArtifactStore
+
+np = pytest.importorskip("numpy")
+
+
+def _save_folds(artifact_dir: Path, exp_name: str, n_folds: int) -> int:
+    exp_dir = artifact_dir / exp_name / "1"
+    exp_dir.mkdir(parents=True)
+    for fold in range(n_folds):
+        np.save(exp_dir / f"fold{fold}.npy", np.full(1000, fold, dtype=np.float64))
+    return (exp_dir / "fold0.npy").stat().st_size
+
+
+def test_artifact_store_lru(tmp_path: Path) -> None:
+    size = _save_folds(tmp_path, "exp001", n_folds=4)
+    store = ArtifactStore(max_resident_bytes=2 * size, artifact_dir=tmp_path)
+
+    assert store.files("exp001") == [f"fold{i}.npy" for i in range(4)]
+
+    fold0 = store.get("exp001", "fold0.npy")
+    assert isinstance(fold0, np.memmap)
+    assert fold0[0] == 0
+    assert store.get("exp001", "fold0.npy") is fold0
+
+    store.get("exp001", "fold1.npy")
+    store.get("exp001", "fold0.npy")  # fold0 becomes most recently used
+    store.get("exp001", "fold2.npy")
+
+    assert ("exp001", "fold0.npy") in store
+    assert ("exp001", "fold1.npy") not in store
+    stats = store.stats()
+    assert stats["resident_bytes"] == 2 * size
+    assert stats["peak_resident_bytes"] <= 3 * size
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 1)
+
+    store.release("exp001")
+    assert store.stats()["resident_bytes"] == 0
+
+
+def test_artifact_store_unknown_suffix(tmp_path: Path) -> None:
+    exp_dir = tmp_path / "exp001" / "1"
+    exp_dir.mkdir(parents=True)
+    (exp_dir / "model.txt").write_text("tree")
+
+    store = ArtifactStore(artifact_dir=tmp_path)
+    with pytest.raises(ValueError):
+        store.get("exp001", "model.txt")
+
+    store.register_loader(".txt", lambda path: path.read_text())
+    assert store.get("exp001", "model.txt") == "tree"
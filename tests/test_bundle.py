@@ -0,0 +1,55 @@
+import importlib.util
+from pathlib import Path
+
+from src.kaggle_ops.utils.bundle import build_code_bundle
+
+
+def _write(path: Path, text: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_build_code_bundle(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    _write(root / "src" / "__init__.py")
+    _write(
+        root / "src" / "inference.py", "import os\nfrom src.models import load\n\ndef f():\n    from . import lazy\n"
+    )
+    _write(root / "src" / "models" / "__init__.py", "from .gbdt import load\n")
+    _write(root / "src" / "models" / "gbdt.py", "import numpy\n\ndef load():\n    pass\n")
+    _write(root / "src" / "lazy.py")
+    _write(root / "src" / "train.py", "import src.models\n")
+    _write(root / "notebooks" / "eda.py")
+    _write(root / "configs" / "model.yaml", "lr: 0.1\n")
+
+    dst = tmp_path / "bundle"
+    bundled = build_code_bundle(root, dst, data_patterns=["configs/*.yaml"])
+
+    assert [p.as_posix() for p in bundled] == [
+        "configs/model.yaml",
+        "src/__init__.py",
+        "src/inference.py",
+        "src/lazy.py",
+        "src/models/__init__.py",
+        "src/models/gbdt.py",
+    ]
+    assert Path(importlib.util.cache_from_source(str(dst / "src" / "models" / "gbdt.py"))).is_file()
+    assert not (dst / "src" / "train.py").exists()
+
+
+def test_build_code_bundle_resolves_script_dir_imports(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    _write(root / "src" / "inference.py", "import helper\nfrom features import build\n")
+    _write(root / "src" / "helper.py", "import os\n")
+    _write(root / "src" / "features" / "__init__.py", "from .build import build\n")
+    _write(root / "src" / "features" / "build.py", "def build():\n    pass\n")
+    _write(root / "src" / "unused.py")
+
+    bundled = build_code_bundle(root, tmp_path / "bundle", compile_pyc=False)
+
+    assert [p.as_posix() for p in bundled] == [
+        "src/features/__init__.py",
+        "src/features/build.py",
+        "src/helper.py",
+        "src/inference.py",
+    ]
@@ -0,0 +1,75 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.columnar import SCHEMA_FILE_NAME, convert_to_columnar, get_columnar_dir, load_schema, load_table
+
+pytest.importorskip("pyarrow")
+
+
+def _write_csv(path: Path, rows: int) -> None:
+    with open(path, "w") as f:
+        f.write("id,value,category\n")
+        for i in range(rows):
+            f.write(f"{i},{i * 0.5},{'ab'[i % 2]}\n")
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_convert_and_load(tmp_path: Path, fmt: str) -> None:
+    comp_dir = tmp_path / "comp"
+    comp_dir.mkdir()
+    _write_csv(comp_dir / "train.csv", rows=100)
+
+    assert convert_to_columnar(comp_dir, fmt=fmt) == ["train.csv"]
+    columnar_dir = get_columnar_dir(comp_dir)
+    assert (columnar_dir / SCHEMA_FILE_NAME).is_file()
+
+    columns = load_schema(columnar_dir)["train.csv"]["columns"]
+    assert columns["id"] == "int8"
+    assert columns["value"] == "double"
+    assert columns["category"].startswith("dictionary")
+
+    # unchanged sources are not converted again
+    assert convert_to_columnar(comp_dir, fmt=fmt) == []
+
+    settings = SimpleNamespace(COMP_DATASET_DIR=comp_dir)
+    table = load_table(settings, "train", columns=["value"], to_pandas=False)  # type: ignore
+    assert table.column_names == ["value"]
+    assert table.num_rows == 100
+
+    # a modified source is converted again
+    _write_csv(comp_dir / "train.csv", rows=300)
+    os.utime(comp_dir / "train.csv", ns=(0, 0))
+    assert convert_to_columnar(comp_dir, fmt=fmt) == ["train.csv"]
+    assert load_schema(columnar_dir)["train.csv"]["columns"]["id"] == "int16"
+
+    # float32 is opt-in, and changing it converts the file again
+    assert convert_to_columnar(comp_dir, fmt=fmt, float32=True) == ["train.csv"]
+    assert load_schema(columnar_dir)["train.csv"]["columns"]["value"] == "float"
+
+
+def test_load_table_falls_back_to_csv(tmp_path: Path) -> None:
+    comp_dir = tmp_path / "comp"
+    comp_dir.mkdir()
+    _write_csv(comp_dir / "test.csv", rows=10)
+
+    settings = SimpleNamespace(COMP_DATASET_DIR=comp_dir)
+    table = load_table(settings, "test.csv", columns=["id"], to_pandas=False)  # type: ignore
+    assert table.column_names == ["id"]
+
+
+def test_load_table_ignores_stale_cache(tmp_path: Path) -> None:
+    comp_dir = tmp_path / "comp"
+    comp_dir.mkdir()
+    _write_csv(comp_dir / "train.csv", rows=10)
+    convert_to_columnar(comp_dir)
+
+    _write_csv(comp_dir / "train.csv", rows=20)
+    settings = SimpleNamespace(COMP_DATASET_DIR=comp_dir)
+    assert load_table(settings, "train", to_pandas=False).num_rows == 20  # type: ignore
+
+    # without the source CSV the cache is used as is
+    (comp_dir / "train.csv").unlink()
+    assert load_table(settings, "train", to_pandas=False).num_rows == 10  # type: ignore
@@ -0,0 +1,90 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from src.artifact_store import ArtifactStore
+from src.kaggle_ops.utils.bundle import find_local_modules
+from src.kaggle_ops.utils.compact import COMPACTION_MANIFEST_NAME, compact_artifacts, load_compaction_manifest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+
+def _make_artifacts(exp_dir: Path) -> None:
+    (exp_dir / "fold0").mkdir(parents=True)
+    np.save(exp_dir / "fold0" / "pred.npy", np.arange(10_000, dtype=np.float64))
+    np.save(exp_dir / "fold0" / "raw.npy", np.arange(100, dtype=np.float64))
+    np.save(exp_dir / "fold0" / "index.npy", np.arange(100, dtype=np.int64))
+    with open(exp_dir / "oof.pkl", "wb") as f:
+        pickle.dump(pd.DataFrame({"id": range(10), "pred": np.linspace(0, 1, 10)}), f)
+    with open(exp_dir / "params.pkl", "wb") as f:
+        pickle.dump({"lr": 0.1}, f)
+    (exp_dir / "config.yaml").write_text("lr: 0.1\n")
+
+
+def test_compact_artifacts(tmp_path: Path) -> None:
+    src_dir, dst_dir = tmp_path / "artifacts" / "exp001" / "1", tmp_path / "compact" / "exp001"
+    _make_artifacts(src_dir)
+
+    manifest = compact_artifacts(src_dir, dst_dir, keep_float64=["*/raw.npy"])
+    files = manifest["files"]
+
+    assert np.load(dst_dir / "fold0" / "pred.npy").dtype == np.float32
+    assert np.load(dst_dir / "fold0" / "raw.npy").dtype == np.float64
+    assert np.load(dst_dir / "fold0" / "index.npy").dtype == np.int64
+    assert files["fold0/pred.npy"]["actions"] == ["float64->float32"]
+    assert files["fold0/raw.npy"]["actions"] == []
+
+    # pickled DataFrames become Parquet, other pickles are kept as is
+    assert files["oof.pkl"]["output"] == "oof.parquet"
+    assert files["oof.pkl"]["actions"] == ["pickle->parquet", "float64->float32"]
+    assert not (dst_dir / "oof.pkl").exists()
+    assert pd.read_parquet(dst_dir / "oof.parquet")["pred"].dtype == np.float32
+    assert files["params.pkl"]["output"] == "params.pkl"
+    assert (dst_dir / "config.yaml").read_text() == "lr: 0.1\n"
+    assert manifest["compacted_bytes"] < manifest["total_bytes"]
+    assert load_compaction_manifest(dst_dir) == manifest
+
+    # the source artifacts are untouched
+    assert np.load(src_dir / "fold0" / "pred.npy").dtype == np.float64
+    assert (src_dir / "oof.pkl").exists()
+
+
+def test_compact_artifacts_reuses_previous_run(tmp_path: Path) -> None:
+    src_dir, dst_dir = tmp_path / "src", tmp_path / "dst"
+    _make_artifacts(src_dir)
+    compact_artifacts(src_dir, dst_dir)
+    pred_mtime = (dst_dir / "fold0" / "pred.npy").stat().st_mtime_ns
+
+    (src_dir / "config.yaml").unlink()
+    manifest = compact_artifacts(src_dir, dst_dir)
+    assert (dst_dir / "fold0" / "pred.npy").stat().st_mtime_ns == pred_mtime
+    assert "config.yaml" not in manifest["files"]
+    assert not (dst_dir / "config.yaml").exists()
+
+    # changed options compact everything again
+    manifest = compact_artifacts(src_dir, dst_dir, float32=False)
+    assert np.load(dst_dir / "fold0" / "pred.npy").dtype == np.float64
+    assert manifest["files"]["oof.pkl"]["actions"] == ["pickle->parquet"]
+
+
+def test_artifact_store_reads_compacted_artifacts(tmp_path: Path) -> None:
+    src_dir = tmp_path / "src"
+    _make_artifacts(src_dir)
+    compact_artifacts(src_dir, tmp_path / "artifacts" / "exp001" / "1")
+    assert (tmp_path / "artifacts" / "exp001" / "1" / COMPACTION_MANIFEST_NAME).is_file()
+
+    store = ArtifactStore(artifact_dir=tmp_path / "artifacts")
+    oof = store.get("exp001", "oof.pkl")
+    assert isinstance(oof, pd.DataFrame)
+    assert list(oof.columns) == ["id", "pred"]
+    assert store.get("exp001", "params.pkl") == {"lr": 0.1}
+
+
+def test_artifact_store_bundle_excludes_upload_tooling() -> None:
+    root = Path(__file__).resolve().parents[1]
+    bundled = {path.relative_to(root).as_posix() for path in find_local_modules([root / "src/artifact_store.py"], root)}
+    assert "src/kaggle_ops/utils/compact.py" not in bundled
+    assert "src/kaggle_ops/utils/customhub.py" not in bundled
@@ -0,0 +1,150 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.kaggle_ops.utils import customhub
+
+
+class FakeVersionedDatasetClient:
+    """Existing dataset whose version is bumped by every pushed version."""
+
+    def __init__(self) -> None:
+        self.version = 3
+        self.pushes = 0
+
+    def dataset_list(self, user: str, search: str) -> list[Any]:
+        return [
+            SimpleNamespace(ref=f"{user}/{search}", current_version_number=self.version, last_updated="", total_bytes=0)
+        ]
+
+    def dataset_create_version(self, **kwargs: Any) -> Any:
+        self.pushes += 1
+        self.version += 1
+        return SimpleNamespace(status="ok", error="")
+
+
+def test_dataset_upload_skips_unchanged_contents(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(customhub, "DATASET_PUSH_RECORD_DIR", tmp_path / "records")
+    monkeypatch.setattr(customhub, "check_if_exist_dataset", lambda client, handle: True)
+    src = tmp_path / "codes"
+    (src / "src").mkdir(parents=True)
+    (src / "src" / "inference.py").write_text("print('v1')\n")
+
+    client = FakeVersionedDatasetClient()
+
+    def _upload() -> bool:
+        return customhub.dataset_upload(client, "user/comp-codes", str(src), ignore_patterns=[], update=True)  # type: ignore[arg-type]
+
+    assert _upload()
+    assert not _upload()
+    assert client.pushes == 1
+
+    (src / "src" / "inference.py").write_text("print('v2')\n")
+    assert _upload()
+
+    # a version pushed from elsewhere invalidates the record
+    client.version += 1
+    assert _upload()
+    assert client.pushes == 3
+
+
+class RejectingDatasetClient(FakeVersionedDatasetClient):
+    """Version pushes answer with the queued errors ("" for success) instead of raising."""
+
+    def __init__(self, errors: list[str]) -> None:
+        super().__init__()
+        self.errors = errors
+
+    def dataset_create_version(self, **kwargs: Any) -> Any:
+        error = self.errors.pop(0)
+        if error:
+            self.pushes += 1
+            return SimpleNamespace(status="error", error=error)
+        return super().dataset_create_version(**kwargs)
+
+
+def test_dataset_upload_raises_on_rejected_push(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(customhub, "DATASET_PUSH_RECORD_DIR", tmp_path / "records")
+    monkeypatch.setattr(customhub, "check_if_exist_dataset", lambda client, handle: True)
+    src = tmp_path / "codes"
+    src.mkdir()
+    (src / "inference.py").write_text("print('v1')\n")
+
+    client = RejectingDatasetClient(["Dataset is too large", ""])
+
+    def _upload() -> bool:
+        return customhub.dataset_upload(client, "user/comp-codes", str(src), ignore_patterns=[], update=True)  # type: ignore[arg-type]
+
+    with pytest.raises(RuntimeError, match="Dataset is too large"):
+        _upload()
+    assert customhub.load_manifest(customhub.dataset_push_record_dir("user/comp-codes")) is None
+
+    # the rejected push is retried instead of being skipped as unchanged
+    assert _upload()
+    assert not _upload()
+    assert client.pushes == 2
+
+
+class LaggingDatasetClient(FakeVersionedDatasetClient):
+    """The listing shows a pushed version only after refresh(); the dataset is processed until then."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.listed_version = self.version
+        self.processing = False
+
+    def dataset_status(self, handle: str) -> str:
+        return "pending" if self.processing else "ready"
+
+    def dataset_create_version(self, **kwargs: Any) -> Any:
+        self.processing = True
+        return super().dataset_create_version(**kwargs)
+
+    def dataset_list(self, user: str, search: str) -> list[Any]:
+        return [
+            SimpleNamespace(
+                ref=f"{user}/{search}", current_version_number=self.listed_version, last_updated="", total_bytes=0
+            )
+        ]
+
+    def refresh(self) -> None:
+        self.listed_version = self.version
+        self.processing = False
+
+
+def test_dataset_upload_records_pending_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(customhub, "DATASET_PUSH_RECORD_DIR", tmp_path / "records")
+    monkeypatch.setattr(customhub, "DATASET_VERSION_TIMEOUT", 0)
+    monkeypatch.setattr(customhub, "check_if_exist_dataset", lambda client, handle: True)
+    src = tmp_path / "codes"
+    (src / "src").mkdir(parents=True)
+    (src / "src" / "inference.py").write_text("print('v1')\n")
+
+    client = LaggingDatasetClient()
+
+    def _upload() -> bool:
+        return customhub.dataset_upload(client, "user/comp-codes", str(src), ignore_patterns=[], update=True)  # type: ignore[arg-type]
+
+    assert _upload()
+    record = customhub.load_manifest(customhub.dataset_push_record_dir("user/comp-codes"))
+    assert record is not None and record["version"] is None and record["pending_after"] == 3
+
+    # neither the listing lagging during processing nor the listed push trigger another push
+    assert not _upload()
+    client.refresh()
+    assert not _upload()
+    record = customhub.load_manifest(customhub.dataset_push_record_dir("user/comp-codes"))
+    assert record is not None and record["version"] == 4
+
+    # a version pushed from elsewhere still invalidates the record
+    client.version += 1
+    client.refresh()
+    assert _upload()
+    assert client.pushes == 2
+
+    # a push still missing from the listing after processing finished did not land
+    client.processing = False
+    assert _upload()
+    assert client.pushes == 3
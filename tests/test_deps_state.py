@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.kaggle_ops.utils.deps_state import check_deps_fresh, deps_digest, save_deps_state
+from src.settings import KaggleSettings
+
+HANDLE = "user/comp-deps"
+
+
+class _FakeClient:
+    def __init__(self, status: str) -> None:
+        self.status = status
+
+    def kernels_status(self, kernel: str) -> SimpleNamespace:
+        return SimpleNamespace(status=SimpleNamespace(name=self.status))
+
+
+def test_check_deps_fresh(tmp_path: Path) -> None:
+    (tmp_path / "requirements.txt").write_text("# deps\nlightgbm==4.5.0\npolars\n")
+    (tmp_path / "kernel-metadata.json").write_text(json.dumps({"id": HANDLE}))
+    assert check_deps_fresh(tmp_path, None, HANDLE) == (False, "no deps state")
+
+    save_deps_state(tmp_path, deps_digest(tmp_path), HANDLE)
+    assert check_deps_fresh(tmp_path, None, HANDLE)[0]
+    assert check_deps_fresh(tmp_path, _FakeClient("COMPLETE"), HANDLE)[0]
+    assert check_deps_fresh(tmp_path, _FakeClient("ERROR"), HANDLE) == (False, "last kernel run is ERROR")
+
+    # order and comments do not matter
+    (tmp_path / "requirements.txt").write_text("polars\nlightgbm==4.5.0\n")
+    assert check_deps_fresh(tmp_path, None, HANDLE)[0]
+
+    (tmp_path / "requirements.txt").write_text("polars\nlightgbm==4.6.0\n")
+    is_fresh, reason = check_deps_fresh(tmp_path, None, HANDLE)
+    assert not is_fresh
+    assert "lightgbm==4.6.0" in reason
+
+
+def test_deps_regenerates_submission_code(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("nbformat")
+    from src.kaggle_ops import upload, write
+
+    deps_dir, submission_dir = tmp_path / "deps", tmp_path / "submission"
+    deps_dir.mkdir()
+    submission_dir.mkdir()
+    (deps_dir / "requirements.txt").write_text("polars\n")
+    (deps_dir / "kernel-metadata.json").write_text(json.dumps({"id": HANDLE}))
+    monkeypatch.setattr(write, "DEPS_CODE_DIR", deps_dir)
+    monkeypatch.setattr(write, "SUBMISSION_CODE_DIR", submission_dir)
+    monkeypatch.setattr(upload, "DEPS_CODE_DIR", deps_dir)
+    monkeypatch.setattr(upload, "get_kaggle_client", lambda: None)
+    monkeypatch.setattr(upload, "kernel_push", lambda client, folder: None)
+    kaggle_settings = KaggleSettings(KAGGLE_USERNAME="user", KAGGLE_COMPETITION_NAME="comp")  # type: ignore
+
+    assert upload.deps(upload.UploadDepsSettings(kaggle_settings=kaggle_settings, install_mode="wheels"))
+    assert "pip install" in (submission_dir / "code.ipynb").read_text()
+
+    # switching the mode rewrites the submission code even when nothing is pushed
+    assert upload.deps(upload.UploadDepsSettings(kaggle_settings=kaggle_settings, install_mode="overlay"))
+    assert not upload.deps(upload.UploadDepsSettings(kaggle_settings=kaggle_settings, install_mode="overlay"))
+    notebook = (submission_dir / "code.ipynb").read_text()
+    assert "pip install" not in notebook
+    assert "comp-deps/site-packages" in notebook
@@ -0,0 +1,43 @@
+import zipfile
+from pathlib import Path
+
+from src.kaggle_ops.utils.archive import extract_zip
+from src.kaggle_ops.utils.download_manifest import check_download_fresh, save_download_manifest
+
+
+def _download(out_dir: Path) -> Path:
+    out_dir.mkdir(parents=True)
+    zip_path = out_dir / "comp.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("train.csv", "id,target\n" * 100)
+        zf.writestr("images/0.png", b"\x89PNG" * 10)
+    extract_zip(zip_path, out_dir)
+    return zip_path
+
+
+def test_check_download_fresh(tmp_path: Path) -> None:
+    out_dir = tmp_path / "comp"
+    zip_path = _download(out_dir)
+    remote = {"files": [["train.csv", 1000, "2024-01-01"]], "total_bytes": 1000}
+
+    assert check_download_fresh(out_dir, zip_path, remote) == (False, "no download manifest")
+
+    save_download_manifest(out_dir, "comp", remote, zip_path)
+    assert check_download_fresh(out_dir, zip_path, remote)[0]
+    assert check_download_fresh(out_dir, zip_path, None)[0]
+
+    changed = {"files": [["train.csv", 2000, "2024-02-01"]], "total_bytes": 2000}
+    assert check_download_fresh(out_dir, zip_path, changed) == (False, "remote changed")
+
+    (out_dir / "images" / "0.png").write_bytes(b"\x89PNG")
+    assert not check_download_fresh(out_dir, zip_path, remote)[0]
+
+
+def test_check_download_fresh_detects_truncated_zip(tmp_path: Path) -> None:
+    out_dir = tmp_path / "comp"
+    zip_path = _download(out_dir)
+    save_download_manifest(out_dir, "comp", None, zip_path)
+
+    data = zip_path.read_bytes()
+    zip_path.write_bytes(data[: len(data) // 2])
+    assert not check_download_fresh(out_dir, zip_path, None)[0]
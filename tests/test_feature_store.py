@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.feature_store import INPUTS_MANIFEST_DIR_NAME, FeatureStore
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+calls: list[int] = []
+
+
+def _feature(n: int = 3):  # type: ignore
+    calls.append(n)
+    return pd.DataFrame({"x": [0.5] * n * 100})
+
+
+def test_feature_store(tmp_path: Path) -> None:
+    comp_dir = tmp_path / "comp"
+    comp_dir.mkdir()
+    (comp_dir / "train.csv").write_text("id\n1\n")
+    (comp_dir / "sample_submission.csv").write_text("id\n1\n")
+    settings = SimpleNamespace(COMP_DATASET_DIR=comp_dir)
+
+    def _store() -> FeatureStore:
+        return FeatureStore(settings, store_dir=tmp_path / "features", inputs=["train.csv"])  # type: ignore
+
+    feature = _store().feature(_feature)
+    assert len(feature(n=3)) == 300
+    assert len(feature(n=3)) == 300
+    assert calls == [3]
+
+    # inputs outside of `inputs` are not hashed and do not change the key
+    (comp_dir / "sample_submission.csv").write_text("id\n2\n")
+    _store().feature(_feature)(n=3)
+    assert calls == [3]
+    (inputs_manifest,) = (tmp_path / "features" / INPUTS_MANIFEST_DIR_NAME).iterdir()
+    assert list(json.loads(inputs_manifest.read_text())["files"]) == ["train.csv"]
+
+    (comp_dir / "train.csv").write_text("id\n2\n")
+    _store().feature(_feature)(n=3)
+    assert calls == [3, 3]
+
+    store = _store()
+    sizes = [meta["size"] for _, meta in store.entries()]
+    store.max_bytes = max(sizes)
+    assert len(store.evict()) == 1
+    assert len(store.entries()) == 1
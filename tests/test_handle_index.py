@@ -0,0 +1,66 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.kaggle_ops.utils import utils
+from src.kaggle_ops.utils.handle_index import HandleIndex
+
+
+class FakeDatasetClient:
+    """Serves datasets in pages of two and counts listing calls."""
+
+    def __init__(self, refs: list[str]) -> None:
+        self.refs = refs
+        self.calls = 0
+
+    def dataset_list_with_response(self, user: str, page_size: int, page_token: str | None) -> Any:
+        self.calls += 1
+        start = int(page_token or 0)
+        next_token = str(start + 2) if start + 2 < len(self.refs) else ""
+        datasets = [SimpleNamespace(ref=ref) for ref in self.refs[start : start + 2]]
+        return SimpleNamespace(datasets=datasets, next_page_token=next_token)
+
+
+def test_handle_index_walks_all_pages_and_caches(tmp_path: Path) -> None:
+    client = FakeDatasetClient([f"user/ds-{i}" for i in range(5)])
+    index = HandleIndex(client=client, kind="dataset", owner="user", cache_dir=tmp_path)  # type: ignore[arg-type]
+
+    assert "user/ds-4" in index
+    assert "User/DS-0" in index
+    assert "user/missing" not in index
+    assert client.calls == 3
+
+    # a new index (e.g. the next CLI process) is served from the disk cache
+    other = HandleIndex(client=client, kind="dataset", owner="user", cache_dir=tmp_path)  # type: ignore[arg-type]
+    assert "user/ds-2" in other
+    assert client.calls == 3
+
+    other.add("user/new-ds")
+    assert "user/new-ds" in HandleIndex(client=client, kind="dataset", owner="user", cache_dir=tmp_path)  # type: ignore[arg-type]
+
+    other.invalidate()
+    assert "user/ds-1" in HandleIndex(client=client, kind="dataset", owner="user", cache_dir=tmp_path)  # type: ignore[arg-type]
+    assert client.calls == 6
+
+
+def test_get_kaggle_client_is_shared_across_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    kaggle = pytest.importorskip("kaggle")
+    created = []
+
+    class SlowKaggleApi:
+        def authenticate(self) -> None:
+            time.sleep(0.05)
+            created.append(self)
+
+    monkeypatch.setattr(kaggle, "KaggleApi", SlowKaggleApi)
+    monkeypatch.setattr(utils, "_kaggle_client", None)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(lambda _: utils.get_kaggle_client(), range(4)))
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+
+from src.inference_runner import InferenceRunner, InferenceSettings, iter_chunks
+from src.settings import DirectorySettings
+
+pytest.importorskip("pyarrow")
+pd = pytest.importorskip("pandas")
+
+
+def _write_test_csv(path: Path, rows: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"id": range(rows), "x": [i * 2 for i in range(rows)]}).to_csv(path, index=False)
+
+
+def _init() -> int:
+    return 10
+
+
+def _predict(offset: int, chunk):  # type: ignore
+    return pd.DataFrame({"id": chunk["id"], "target": chunk["x"] + offset})
+
+
+def test_iter_chunks(tmp_path: Path) -> None:
+    _write_test_csv(tmp_path / "test.csv", rows=25)
+    sizes = [len(chunk) for chunk in iter_chunks(tmp_path / "test.csv", chunk_size=10, columns=["id"])]
+    assert sizes == [10, 10, 5]
+
+
+def test_inference_runner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    # pin the competition (a local .env may set another one) and write where the runner reads
+    monkeypatch.setenv("KAGGLE_COMPETITION_NAME", "test-competition")
+    settings = InferenceSettings(run_env="local", chunk_size=7, num_workers=2)
+    directory_settings = DirectorySettings(exp_name=settings.exp_name, run_env=settings.run_env)
+    _write_test_csv(directory_settings.COMP_DATASET_DIR / settings.test_name, rows=50)
+
+    runner = InferenceRunner(_predict, settings, init_fn=_init)
+    output_path = runner.run()
+
+    predictions = pd.read_csv(output_path)
+    assert predictions["id"].tolist() == list(range(50))
+    assert (predictions["target"] == predictions["id"] * 2 + 10).all()
+    assert runner.stats.rows["write"] == 50
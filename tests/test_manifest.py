@@ -0,0 +1,41 @@
+import os
+from pathlib import Path
+
+from src.kaggle_ops.utils.manifest import (
+    MANIFEST_FILE_NAME,
+    build_manifest,
+    load_manifest,
+    manifest_equals,
+    save_manifest,
+)
+
+
+def _make_tree(root: Path) -> None:
+    (root / "fold0").mkdir(parents=True)
+    (root / "fold0" / "model.pt").write_bytes(b"weights" * 100)
+    (root / "oof.csv").write_text("id,pred\n1,0.5\n")
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "x.pyc").write_bytes(b"ignored")
+
+
+def test_build_manifest_ignores_patterns(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    manifest = build_manifest(tmp_path, ignore_patterns=["__pycache__", ".*"])
+
+    assert set(manifest["files"]) == {"fold0/model.pt", "oof.csv"}
+    assert manifest["total_bytes"] == 700 + len("id,pred\n1,0.5\n")
+
+
+def test_manifest_roundtrip_and_change_detection(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    manifest = build_manifest(tmp_path, ignore_patterns=[".*"])
+    save_manifest(tmp_path, manifest)
+    assert (tmp_path / MANIFEST_FILE_NAME).is_file()
+
+    previous = load_manifest(tmp_path)
+    assert manifest_equals(build_manifest(tmp_path, ignore_patterns=[".*"], previous=previous), previous)
+
+    # same size, different content and mtime -> detected
+    (tmp_path / "oof.csv").write_text("id,pred\n1,0.6\n")
+    os.utime(tmp_path / "oof.csv", ns=(0, 0))
+    assert not manifest_equals(build_manifest(tmp_path, ignore_patterns=[".*"], previous=previous), previous)
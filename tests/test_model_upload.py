@@ -0,0 +1,68 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.kaggle_ops.utils import customhub
+from src.kaggle_ops.utils.manifest import load_manifest
+
+HANDLE = "user/comp-artifacts/other/exp001"
+
+
+class FakeModelClient:
+    """Existing model instance whose version uploads return the queued errors ("" for success)."""
+
+    def __init__(self, errors: list[str]) -> None:
+        self.errors = errors
+        self.uploads = 0
+
+    def model_instance_version_create(self, model_instance: str, folder: str, **kwargs: Any) -> Any:
+        self.uploads += 1
+        return SimpleNamespace(error=self.errors.pop(0))
+
+
+def test_model_upload_records_only_successful_uploads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(customhub, "check_if_exist_model", lambda client, handle: True)
+    monkeypatch.setattr(customhub, "check_if_exist_model_instance", lambda client, handle: True)
+    (tmp_path / "model.txt").write_text("model")
+    client = FakeModelClient(["Quota exceeded", ""])
+
+    def _upload() -> customhub.UploadResult:
+        return customhub.model_upload(client, HANDLE, str(tmp_path), ignore_patterns=[".*"], update=True)  # type: ignore[arg-type]
+
+    with pytest.raises(RuntimeError, match="Quota exceeded"):
+        _upload()
+    assert load_manifest(tmp_path) is None
+
+    # the failed upload is retried instead of being skipped as unchanged
+    assert _upload().uploaded
+    assert load_manifest(tmp_path) is not None
+    assert not _upload().uploaded
+    assert client.uploads == 2
+
+
+class FakeParentModelClient:
+    """Model created by model_create_new; the creation is slow to widen the check-then-create window."""
+
+    def __init__(self) -> None:
+        self.created: list[str] = []
+
+    def model_create_new(self, folder: str) -> Any:
+        time.sleep(0.05)
+        self.created.append(json.loads((Path(folder) / "model-metadata.json").read_text())["slug"])
+        return SimpleNamespace(error="")
+
+
+def test_ensure_model_creates_parent_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = FakeParentModelClient()
+    monkeypatch.setattr(customhub, "check_if_exist_model", lambda client, handle: bool(client.created))
+    monkeypatch.setattr(customhub, "get_kaggle_username", lambda: "user")
+    monkeypatch.setattr(customhub, "get_handle_index", lambda *args: SimpleNamespace(add=lambda handle: None))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: customhub.ensure_model(client, "user/comp-artifacts"), range(4)))  # type: ignore[arg-type]
+    assert client.created == ["comp-artifacts"]
@@ -0,0 +1,41 @@
+import threading
+import time
+
+import pytest
+
+from src.kaggle_ops import push
+from src.kaggle_ops.upload import UploadArtifactSettings
+from src.kaggle_ops.utils.customhub import UploadResult
+from src.settings import KaggleSettings
+
+
+def test_push_experiments_runs_concurrently_and_reports_failures(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    running, peak, lock = 0, 0, threading.Lock()
+
+    def fake_artifacts(settings: UploadArtifactSettings) -> UploadResult:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        if settings.exp_name == "exp002":
+            raise RuntimeError("Quota exceeded")
+        return UploadResult(handle=settings.exp_name, uploaded=settings.exp_name == "exp001", total_bytes=10)
+
+    monkeypatch.setattr(push, "artifacts", fake_artifacts)
+    kaggle_settings = KaggleSettings(KAGGLE_USERNAME="user", KAGGLE_COMPETITION_NAME="comp")  # type: ignore
+
+    with pytest.raises(RuntimeError, match="exp002") as excinfo:
+        push.push_experiments(["exp001", "exp002", "exp003"], "local", kaggle_settings, max_workers=3)
+    assert "exp001" not in str(excinfo.value)
+    assert peak > 1
+
+    # one failure does not abort the others, and every experiment gets a summary row
+    summary = capsys.readouterr().out.split("=== Push summary ===")[1].splitlines()[2:]
+    statuses = {line.split()[0]: line.split()[1] for line in summary}
+    assert statuses == {"exp001": "success", "exp002": "failure", "exp003": "skipped"}
+    assert any(line.endswith("RuntimeError: Quota exceeded") for line in summary)
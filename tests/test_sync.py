@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from src.kaggle_ops.sync import ListingCache, get_filesystem, pull
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_pull_only_selected_prefixes(tmp_path: Path) -> None:
+    bucket = tmp_path / "bucket"
+    _write(bucket / "input" / "comp" / "train.csv", "id\n1\n")
+    _write(bucket / "output" / "exp001" / "1" / "model.pkl", "model")
+    _write(bucket / "output" / "exp001" / "1" / "fold0" / "oof.csv", "oof")
+    _write(bucket / "output" / "exp002" / "1" / "model.pkl", "other")
+    dst = tmp_path / "data"
+
+    fs, root = get_filesystem(str(bucket))
+    cache = ListingCache(cache_dir=tmp_path / "cache", ttl=60)
+    prefixes = ["output/exp001/1", "input/comp"]
+
+    result = pull(fs, root, prefixes, dst, max_workers=4, cache=cache)
+    assert result["transferred"] == 3
+    assert (dst / "output" / "exp001" / "1" / "fold0" / "oof.csv").read_text() == "oof"
+    assert not (dst / "output" / "exp002").exists()
+
+    # existing files are not transferred again and listings come from the cache
+    _write(bucket / "output" / "exp001" / "1" / "new.pkl", "new")
+    assert pull(fs, root, prefixes, dst, cache=cache) == {"listed": 3, "transferred": 0, "transferred_bytes": 0}
+    assert pull(fs, root, prefixes, dst)["transferred"] == 1
@@ -0,0 +1,31 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.kaggle_ops.utils.timing import SpanRecorder
+
+
+def test_span_recorder(tmp_path: Path) -> None:
+    (tmp_path / "staged").mkdir()
+    (tmp_path / "staged" / "a.zip").write_bytes(b"x" * 10)
+    (tmp_path / "staged" / "b.csv").write_bytes(b"x" * 5)
+
+    recorder = SpanRecorder()
+    with recorder.span("model_upload", "stage", "user/model/other/exp001") as s:
+        s.add_path(tmp_path / "staged")
+    with pytest.raises(ValueError), recorder.span("model_upload", "upload", "user/model/other/exp001"):
+        raise ValueError("quota")
+    with recorder.span("model_upload", "stage", "user/model/other/exp002") as s:
+        s.add_path(tmp_path / "staged" / "a.zip")
+
+    assert [span.status for span in recorder.spans] == ["success", "failure", "success"]
+    stage, upload = recorder.summary()
+    assert (stage["phase"], stage["count"], stage["files"], stage["bytes"]) == ("stage", 2, 3, 25)
+    assert upload["phase"] == "upload"
+
+    recorder.write_jsonl(tmp_path / "timings.jsonl", command="upload artifacts")
+    recorder.write_jsonl(tmp_path / "timings.jsonl", command="upload artifacts")
+    lines = [json.loads(line) for line in (tmp_path / "timings.jsonl").read_text().splitlines()]
+    assert len(lines) == 6
+    assert lines[0]["command"] == "upload artifacts" and lines[0]["files"] == 2
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pytest
+
+from src.train_runner import FOLD_DONE_FILE_NAME, FoldContext, TrainSettings, train_folds
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+
+def _train_fold(context: FoldContext):  # type: ignore
+    if context.fold == 2 and not (context.directory_settings.OUTPUT_DIR / "fixed").exists():
+        raise ValueError("interrupted")
+    (context.output_dir / "model.txt").write_text(f"fold{context.fold}")
+    return pd.DataFrame({"fold": [context.fold] * 3, "oof": [0.1, 0.2, 0.3]})
+
+
+def test_train_folds_resume(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    settings = TrainSettings(exp_name="exp001", run_env="local", n_folds=3, num_workers=2)
+    output_dir = tmp_path / "data" / "output" / "exp001" / "1"
+
+    with pytest.raises(RuntimeError, match=r"\[2\]"):
+        train_folds(_train_fold, settings)
+    assert (output_dir / "fold0" / FOLD_DONE_FILE_NAME).is_file()
+    assert (output_dir / "fold1" / "model.txt").read_text() == "fold1"
+    assert not (output_dir / "fold2").exists()
+
+    (output_dir / "fixed").touch()
+    results = train_folds(_train_fold, settings)
+    assert {r["fold"]: r["status"] for r in results} == {0: "skipped", 1: "skipped", 2: "success"}
+    assert len(pd.read_parquet(output_dir / "oof.parquet")) == 9
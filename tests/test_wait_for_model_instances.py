@@ -0,0 +1,46 @@
+from typing import Any
+
+import pytest
+
+from src.kaggle_ops.utils.customhub import wait_for_model_instances
+
+HANDLE = "user/comp-artifacts/other/exp001/1"
+
+
+class FakeInstanceClient:
+    """Model instance lookups that raise the queued errors before the instance becomes available."""
+
+    def __init__(self, errors: list[Exception]) -> None:
+        self.errors = errors
+        self.calls = 0
+
+    def model_instance_get(self, model_instance: str) -> Any:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return model_instance
+
+
+def _wait(client: FakeInstanceClient, timeout: float = 5.0) -> dict[str, bool]:
+    return wait_for_model_instances(client, [HANDLE], timeout=timeout, initial_interval=0.01, max_interval=0.02)  # type: ignore[arg-type]
+
+
+def test_wait_for_model_instances_ready_after_polls() -> None:
+    client = FakeInstanceClient([Exception("(404) Not Found")] * 3)
+    assert _wait(client) == {HANDLE: True}
+    assert client.calls == 4
+
+
+def test_wait_for_model_instances_deadline() -> None:
+    client = FakeInstanceClient([Exception("(404) Not Found")] * 1000)
+    assert _wait(client, timeout=0.1) == {HANDLE: False}
+    assert client.calls > 1
+
+
+def test_wait_for_model_instances_retries_transient_errors() -> None:
+    client = FakeInstanceClient([Exception("(429) Too Many Requests"), Exception("(503) Service Unavailable")])
+    assert _wait(client) == {HANDLE: True}
+    assert client.calls == 3
+
+    with pytest.raises(Exception, match="403"):
+        _wait(FakeInstanceClient([Exception("(403) Forbidden")]))
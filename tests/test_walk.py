@@ -0,0 +1,51 @@
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+
+import pytest
+
+from src.kaggle_ops.utils.customhub import IGNORE_PATTERNS, copytree
+from src.kaggle_ops.utils.walk import display_tree, scan_tree
+
+
+def _walk_files(directory: Path, ignore_patterns: list[str]) -> list[str]:
+    files = []
+    for root, dirs, filenames in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not any(fnmatch(d, p) for p in ignore_patterns))
+        for filename in sorted(filenames):
+            if not any(fnmatch(filename, p) for p in ignore_patterns):
+                files.append((Path(root) / filename).relative_to(directory).as_posix())
+    return files
+
+
+def _make_tree(root: Path) -> None:
+    for rel in ["a.py", "src/b.py", "src/__pycache__/b.pyc", "src/.env", "data/x.csv", "src/pkg/c.py", "z/d.txt"]:
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(rel)
+
+
+def test_scan_tree_matches_os_walk(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    scan = scan_tree(tmp_path, IGNORE_PATTERNS)
+    assert [e.rel_path for e in scan.files] == _walk_files(tmp_path, IGNORE_PATTERNS)
+    assert sorted(scan.dirs) == ["src", "src/pkg", "z"]
+    assert scan.total_bytes == sum(len(e.rel_path) for e in scan.files)
+
+
+def test_copytree_returns_staged_scan(tmp_path: Path) -> None:
+    _make_tree(tmp_path / "src_dir")
+    staged = copytree(str(tmp_path / "src_dir"), str(tmp_path / "dst"), IGNORE_PATTERNS, mode="hardlink")
+    assert [e.rel_path for e in staged.files] == [e.rel_path for e in scan_tree(tmp_path / "dst").files]
+
+
+def test_display_tree_is_bounded(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    for i in range(1000):
+        (tmp_path / "fold0").mkdir(exist_ok=True)
+        (tmp_path / "fold0" / f"{i}.npy").write_bytes(b"x")
+    (tmp_path / "model.pt").write_bytes(b"x" * 10)
+
+    display_tree(tmp_path, max_entries=5)
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 4
+    assert lines[1].endswith("fold0/ (1000 files, 1000B)")
+    assert lines[2].endswith("... 1000 files (1000B)")
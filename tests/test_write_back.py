@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from src.settings import DirectorySettings
+from src.write_back import WriteBack, start_write_back
+
+
+def test_vertex_write_back_settings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BUCKET_NAME", "bucket")
+    monkeypatch.setenv("GCS_MOUNT_ROOT", str(tmp_path / "gcs"))
+    monkeypatch.setenv("WRITE_BACK_STAGING_DIR", str(tmp_path / "local" / "{exp_name}"))
+
+    settings = DirectorySettings(exp_name="exp001", run_env="vertex")
+    assert settings.OUTPUT_DIR == tmp_path / "gcs" / "bucket" / "output" / "exp001" / "1"
+    assert settings.WRITE_BACK_DIR is None
+
+    settings = DirectorySettings(exp_name="exp001", run_env="vertex", write_back=True)
+    assert settings.OUTPUT_DIR == tmp_path / "local" / "exp001"
+    assert settings.WRITE_BACK_DIR == tmp_path / "gcs" / "bucket" / "output" / "exp001" / "1"
+
+    write_back = start_write_back(settings, interval=3600)
+    assert write_back is not None
+    (settings.OUTPUT_DIR / "model.txt").write_text("model")
+    write_back.close()
+    assert (settings.WRITE_BACK_DIR / "model.txt").read_text() == "model"
+
+
+def test_write_back_flushes_settled_and_changed_files(tmp_path: Path) -> None:
+    local_dir, remote_dir = tmp_path / "local", tmp_path / "remote"
+    (local_dir / "fold0").mkdir(parents=True)
+    (local_dir / "fold0" / "model.txt").write_text("v1")
+    (local_dir / "fold0" / "_SUCCESS").write_text("{}")
+    (local_dir / "oof.parquet.tmp").write_text("partial")
+
+    write_back = WriteBack(local_dir, remote_dir, settle_seconds=3600)
+    assert write_back.flush() == []
+
+    write_back.settle_seconds = 0
+    # data files before markers, temporary files never
+    assert write_back.flush() == ["fold0/_SUCCESS", "fold0/model.txt"]
+    assert not (remote_dir / "oof.parquet.tmp").exists()
+    assert write_back.flush() == []
+
+    (local_dir / "fold0" / "model.txt").write_text("v2 (changed)")
+    with write_back:
+        pass
+    assert (remote_dir / "fold0" / "model.txt").read_text() == "v2 (changed)"
+    assert write_back.flushed_files == 3
+
+
+def test_write_back_holds_markers_when_data_copy_fails(tmp_path: Path) -> None:
+    local_dir, remote_dir = tmp_path / "local", tmp_path / "remote"
+    (local_dir / "fold0").mkdir(parents=True)
+    (local_dir / "fold0" / "model.txt").write_text("model")
+    (local_dir / "fold0" / "_SUCCESS").write_text("{}")
+    # a directory in the way of the data file makes its copy fail
+    (remote_dir / "fold0" / "model.txt").mkdir(parents=True)
+
+    write_back = WriteBack(local_dir, remote_dir, settle_seconds=0)
+    with pytest.raises(RuntimeError, match="model.txt"):
+        write_back.flush()
+    assert not (remote_dir / "fold0" / "_SUCCESS").exists()
+
+    # the marker is flushed by the next pass that copies the data file
+    (remote_dir / "fold0" / "model.txt").rmdir()
+    assert write_back.flush() == ["fold0/_SUCCESS", "fold0/model.txt"]
+    assert (remote_dir / "fold0" / "_SUCCESS").is_file()